@@ -0,0 +1,11 @@
+from app.cache.backends import CacheBackend, MemoryBackend, DiskBackend
+from app.cache.read_through import (
+    cached,
+    init_cache,
+    get_cache,
+    invalidar_pendientes,
+    descartar_pendientes,
+    etiquetas_pendientes
+)
+from app.cache.conditional import conditional, marcar_tablas_modificadas
+from app.cache.fragments import FragmentCacheExtension, init_template_cache
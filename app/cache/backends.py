@@ -0,0 +1,179 @@
+"""Backends de almacenamiento para la caché de lecturas de los controladores."""
+import os
+import time
+import itertools
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+class CacheBackend:
+    """
+    Interfaz común de los backends. Los valores llegan ya serializados
+    (bytes) y cada entrada se asocia a un conjunto de etiquetas para poder
+    invalidarla sin conocer su clave.
+    """
+
+    def get(self, clave: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, clave: str, valor: bytes, etiquetas: Iterable[str], ttl: float) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags(self, etiquetas: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """LRU con TTL dentro del proceso. Cada worker tiene su propia copia."""
+
+    def __init__(self, max_size: int = 2048):
+        self.max_size = max_size
+        self._datos: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._por_etiqueta: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, clave: str) -> Optional[bytes]:
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                return None
+            if entrada[0] <= time.monotonic():
+                self._quitar(clave)
+                return None
+            self._datos.move_to_end(clave)
+            return entrada[1]
+
+    def set(self, clave: str, valor: bytes, etiquetas: Iterable[str], ttl: float) -> None:
+        etiquetas = tuple(etiquetas)
+        with self._lock:
+            self._quitar(clave)
+            self._datos[clave] = (time.monotonic() + ttl, valor, etiquetas)
+            for etiqueta in etiquetas:
+                self._por_etiqueta.setdefault(etiqueta, set()).add(clave)
+            while len(self._datos) > self.max_size:
+                self._quitar(next(iter(self._datos)))
+
+    def invalidate_tags(self, etiquetas: Iterable[str]) -> None:
+        with self._lock:
+            for etiqueta in etiquetas:
+                for clave in self._por_etiqueta.pop(etiqueta, set()):
+                    self._quitar(clave)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datos.clear()
+            self._por_etiqueta.clear()
+
+    def _quitar(self, clave: str) -> None:
+        entrada = self._datos.pop(clave, None)
+        if entrada is None:
+            return
+        for etiqueta in entrada[2]:
+            claves = self._por_etiqueta.get(etiqueta)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_etiqueta[etiqueta]
+
+
+class DiskBackend(CacheBackend):
+    """
+    Caché compartida entre procesos en un archivo SQLite local.
+
+    No requiere servicios externos: todos los workers de la misma máquina
+    abren el mismo archivo, por lo que una invalidación hecha en un proceso
+    es visible de inmediato en los demás.
+
+    El tamaño no se cuenta en cada escritura: cada proceso recorta la tabla
+    una vez cada PURGA_CADA escrituras, así que puede superar `max_size`
+    transitoriamente.
+    """
+
+    PURGA_CADA = 256
+
+    ESQUEMA = (
+        "CREATE TABLE IF NOT EXISTS entradas ("
+        " clave TEXT PRIMARY KEY, valor BLOB NOT NULL, expira REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS etiquetas ("
+        " etiqueta TEXT NOT NULL, clave TEXT NOT NULL, PRIMARY KEY (etiqueta, clave))",
+        "CREATE INDEX IF NOT EXISTS ix_etiquetas_clave ON etiquetas (clave)",
+        "CREATE INDEX IF NOT EXISTS ix_entradas_expira ON entradas (expira)",
+    )
+
+    def __init__(self, path: str, max_size: int = 10000, timeout: float = 5.0):
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._escrituras = itertools.count(1)
+        directorio = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directorio, exist_ok=True)
+        with self._conexion() as conn:
+            for sentencia in self.ESQUEMA:
+                conn.execute(sentencia)
+
+    def _conexion(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, clave: str) -> Optional[bytes]:
+        fila = self._conexion().execute(
+            "SELECT valor FROM entradas WHERE clave = ? AND expira > ?", (clave, time.time())
+        ).fetchone()
+        return fila[0] if fila else None
+
+    def set(self, clave: str, valor: bytes, etiquetas: Iterable[str], ttl: float) -> None:
+        conn = self._conexion()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO entradas (clave, valor, expira) VALUES (?, ?, ?)",
+                (clave, sqlite3.Binary(valor), time.time() + ttl)
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO etiquetas (etiqueta, clave) VALUES (?, ?)",
+                [(etiqueta, clave) for etiqueta in etiquetas]
+            )
+            if next(self._escrituras) % self.PURGA_CADA == 0:
+                self._purgar(conn)
+
+    def invalidate_tags(self, etiquetas: Iterable[str]) -> None:
+        etiquetas = list(etiquetas)
+        if not etiquetas:
+            return
+        marcas = ", ".join("?" for _ in etiquetas)
+        conn = self._conexion()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            claves = f"SELECT clave FROM etiquetas WHERE etiqueta IN ({marcas})"
+            conn.execute(f"DELETE FROM entradas WHERE clave IN ({claves})", etiquetas)
+            conn.execute(f"DELETE FROM etiquetas WHERE clave IN ({claves})", etiquetas)
+
+    def clear(self) -> None:
+        conn = self._conexion()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM entradas")
+            conn.execute("DELETE FROM etiquetas")
+
+    def _purgar(self, conn: sqlite3.Connection) -> None:
+        """Elimina las entradas vencidas y, si no alcanza, las más próximas a vencer."""
+        conn.execute("DELETE FROM entradas WHERE expira <= ?", (time.time(),))
+        exceso = conn.execute("SELECT COUNT(*) FROM entradas").fetchone()[0] - self.max_size
+        if exceso > 0:
+            conn.execute(
+                "DELETE FROM entradas WHERE clave IN "
+                "(SELECT clave FROM entradas ORDER BY expira LIMIT ?)", (exceso,)
+            )
+        conn.execute("DELETE FROM etiquetas WHERE clave NOT IN (SELECT clave FROM entradas)")
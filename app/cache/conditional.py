@@ -0,0 +1,104 @@
+"""
+Respuestas condicionales (ETag) para páginas que solo dependen de unas
+pocas tablas.
+
+Cada commit hecho por `DatabaseController` incrementa en VersionCache el
+contador `tabla:<nombre>` de las tablas que modificó. Una página decorada con
+`@conditional(Modelo, ...)` calcula su ETag a partir de esos contadores y del
+usuario que la pide; si coincide con el del navegador responde 304 sin
+ejecutar la vista.
+
+No se envía Last-Modified: su resolución de un segundo y la falta de
+alcance por usuario harían que If-Modified-Since devolviera 304 obsoletos.
+"""
+import time
+import hashlib
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+from flask_login import current_user
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import db
+from app.database.models import VersionCache
+
+PREFIJO_TABLA = "tabla:"
+
+
+def _tabla(objetivo) -> str:
+    return objetivo if isinstance(objetivo, str) else objetivo.__tablename__
+
+
+def marcar_tablas_modificadas(sesion, tablas) -> None:
+    """Incrementa, dentro de la transacción en curso, el contador de cada tabla.
+
+    Los contadores van en un SAVEPOINT: si fallan, se registra el error y la
+    escritura del usuario se confirma igual (solo se pierde la señal de ETag).
+    """
+    tablas = sorted(t for t in tablas if t != VersionCache.__tablename__)
+    if not tablas:
+        return
+    try:
+        with sesion.begin_nested():
+            for tabla in tablas:
+                VersionCache.incrementar(sesion, PREFIJO_TABLA + tabla)
+    except SQLAlchemyError as e:
+        current_app.logger.warning(f"[VersionCache]: No se pudieron incrementar {', '.join(tablas)}: {e}")
+
+
+def _etag(tablas) -> str:
+    """Calcula el ETag de la petición actual."""
+    filas = VersionCache.leer_varias(db.session, [PREFIJO_TABLA + t for t in tablas])
+    versiones = {clave: version for clave, version, _ in filas}
+
+    # Los tokens CSRF de los formularios vencen; se fuerza un render nuevo
+    # a mitad de su vigencia para que la página en caché nunca tenga uno vencido.
+    vigencia = current_app.config.get("WTF_CSRF_TIME_LIMIT") or 3600
+    tramo_csrf = int(time.time() // max(vigencia / 2, 1))
+
+    alcance = (
+        request.full_path,
+        current_user.get_id(),
+        getattr(current_user, "permission_mask", 0),
+        getattr(current_user, "primer_nombre", ""),
+        session.get("csrf_token"),
+        tramo_csrf,
+        current_app.config.get("APP_VERSION"),
+        tuple(versiones.get(PREFIJO_TABLA + t, 0) for t in tablas),
+    )
+    return hashlib.sha1(repr(alcance).encode("utf-8")).hexdigest()
+
+
+def conditional(*modelos):
+    """
+    Habilita GET condicional en una vista que solo lee de los modelos indicados.
+
+    El ETag incluye el usuario, su máscara de permisos y las versiones de las
+    tablas, así que nunca se comparte entre usuarios ni sobrevive a un cambio
+    de rol. No se aplica a peticiones distintas de GET/HEAD ni cuando hay
+    mensajes flash pendientes de mostrar. Debe ir debajo de `@requires`.
+    """
+    tablas = tuple(sorted({_tabla(m) for m in modelos}))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD") or session.get("_flashes"):
+                return view(*args, **kwargs)
+
+            etag = _etag(tablas)
+            if etag in request.if_none_match:
+                respuesta = current_app.response_class(status=304)
+            else:
+                respuesta = make_response(view(*args, **kwargs))
+                if respuesta.status_code != 200:
+                    return respuesta
+                # La vista puede haber creado el token CSRF de la sesión
+                etag = _etag(tablas)
+
+            respuesta.set_etag(etag)
+            respuesta.cache_control.private = True
+            respuesta.cache_control.no_cache = True
+            return respuesta
+        return wrapper
+    return decorator
@@ -0,0 +1,78 @@
+"""
+Caché de fragmentos de plantillas y caché de bytecode de Jinja.
+
+Uso en plantillas:
+
+    {% cache "navbar_inicio" %} ... {% endcache %}
+    {% cache "navbar_inicio", 600 %} ... {% endcache %}
+
+La clave incluye siempre la versión de la app y el rol del usuario actual,
+así que un fragmento nunca se comparte entre roles. El segundo argumento,
+opcional, es el TTL en segundos (por defecto FRAGMENT_CACHE_TTL). Solo deben
+cachearse fragmentos que dependan únicamente del rol, nunca del usuario.
+"""
+import os
+
+from flask import current_app, has_request_context
+from flask_login import current_user
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from app.cache.backends import MemoryBackend
+
+
+class FragmentCacheExtension(Extension):
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None, fragment_cache_ttl=300)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(["name:endcache"], drop_needle=True)
+        return nodes.CallBlock(self.call_method("_render", args), [], [], body).set_lineno(lineno)
+
+    @staticmethod
+    def _rol_actual() -> str:
+        if not has_request_context() or not current_user.is_authenticated:
+            return "anonimo"
+        role = current_user.role
+        return getattr(role, "value", role)
+
+    def _render(self, nombre, ttl, caller):
+        backend = self.environment.fragment_cache
+        if backend is None:
+            return caller()
+
+        clave = f"fragmento:{current_app.config.get('APP_VERSION')}:{self._rol_actual()}:{nombre}"
+        guardado = backend.get(clave)
+        if guardado is not None:
+            return Markup(guardado.decode("utf-8"))
+
+        html = caller()
+        backend.set(clave, str(html).encode("utf-8"), (), ttl or self.environment.fragment_cache_ttl)
+        return html
+
+
+def init_template_cache(app) -> None:
+    """
+    Registra la extensión de fragmentos y, si JINJA_BYTECODE_CACHE_DIR está
+    definido, un caché de bytecode en disco compartido entre reinicios y workers.
+    """
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    if app.config.get("FRAGMENT_CACHE_ENABLED", True):
+        app.jinja_env.fragment_cache = MemoryBackend(max_size=int(app.config.get("FRAGMENT_CACHE_MAX_SIZE", 256)))
+        app.jinja_env.fragment_cache_ttl = float(app.config.get("FRAGMENT_CACHE_TTL", 300))
+
+    directorio = app.config.get("JINJA_BYTECODE_CACHE_DIR")
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directorio)
@@ -0,0 +1,164 @@
+"""
+Caché de lectura para los métodos de los controladores.
+
+Los métodos de lectura se decoran con `@cached(Modelo, ...)`: el resultado
+se guarda serializado bajo una clave formada por la clase, el método y los
+argumentos, y se etiqueta con las tablas de los modelos indicados.
+
+Las escrituras se registran por sesión (objetos de cada flush y sentencias
+UPDATE/INSERT/DELETE masivas) y `DatabaseController._commit_or_rollback`
+invalida las etiquetas de esas tablas después de un commit exitoso.
+
+Esa invalidación solo alcanza al proceso actual con el backend en memoria, y
+con cualquier backend una lectura que empezó antes del commit puede guardar
+su resultado después de la invalidación. Por eso cada entrada guarda también
+los contadores `tabla:<nombre>` de VersionCache (que el commit incrementa) y
+una lectura descarta la entrada si alguno cambió desde que se guardó.
+"""
+import pickle
+from functools import wraps
+from typing import Iterable, Optional, Set
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.cache.backends import CacheBackend, MemoryBackend, DiskBackend
+from app.database import db
+from app.database.models import VersionCache
+from app.database.replica import lecturas_en_replica, primaria_forzada
+from app.cache.conditional import PREFIJO_TABLA
+
+# Clave de Session.info donde se acumulan las tablas modificadas en la transacción
+TABLAS_PENDIENTES = "cache_tablas_modificadas"
+
+
+def _tabla(objetivo) -> str:
+    """Nombre de tabla de un modelo, o el texto recibido si ya es un nombre."""
+    return objetivo if isinstance(objetivo, str) else objetivo.__tablename__
+
+
+def cached(*modelos, ttl: Optional[float] = None):
+    """
+    Cachea el resultado de un método de lectura de un `DatabaseController`.
+
+    Args:
+        *modelos: Modelos (o nombres de tabla) de los que depende el resultado.
+            Un commit que modifique cualquiera de ellos invalida la entrada.
+        ttl: Segundos de vida; por defecto CACHE_DEFAULT_TTL.
+
+    El resultado debe ser serializable con pickle (schemas, dicts, listas);
+    nunca instancias ORM. Si la sesión ya tiene escrituras sin confirmar en
+    una de esas tablas, se lee de la base sin pasar por la caché.
+
+    Con réplica de lectura: lo leído de la réplica no se guarda (puede estar
+    atrasado respecto de la invalidación) y, mientras la sesión deba leer lo
+    propio de la principal, tampoco se consulta la caché.
+    """
+    etiquetas = tuple(sorted(_tabla(m) for m in modelos))
+
+    def decorator(metodo):
+        prefijo = f"{metodo.__module__}.{metodo.__qualname__}"
+
+        @wraps(metodo)
+        def wrapper(self, *args, **kwargs):
+            backend = get_cache()
+            if backend is None or etiquetas_pendientes(self.session) & set(etiquetas):
+                return metodo(self, *args, **kwargs)
+
+            clave = f"{prefijo}:{args!r}:{sorted(kwargs.items())!r}"
+            versiones = _versiones(self.session, etiquetas)
+            if not primaria_forzada(self.session):
+                valor = backend.get(clave)
+                if valor is not None:
+                    guardadas, resultado = pickle.loads(valor)
+                    if guardadas == versiones:
+                        return resultado
+
+            en_replica = lecturas_en_replica(self.session)
+            resultado = metodo(self, *args, **kwargs)
+            if lecturas_en_replica(self.session) != en_replica:
+                return resultado
+            backend.set(
+                clave, pickle.dumps((versiones, resultado), pickle.HIGHEST_PROTOCOL), etiquetas,
+                ttl if ttl is not None else current_app.config.get("CACHE_DEFAULT_TTL", 300)
+            )
+            return resultado
+
+        wrapper.cache_tags = etiquetas
+        return wrapper
+    return decorator
+
+
+def _versiones(session, etiquetas):
+    """Contadores de VersionCache de las tablas, leídos siempre de la base principal
+    (los de la réplica pueden estar atrasados)."""
+    return tuple(tuple(fila) for fila in session.execute(
+        select(VersionCache.clave, VersionCache.version)
+        .where(VersionCache.clave.in_([PREFIJO_TABLA + e for e in etiquetas]))
+        .order_by(VersionCache.clave),
+        bind_arguments={"bind": db.engine}
+    ).all())
+
+
+# Registro de escrituras por sesión
+
+def etiquetas_pendientes(session) -> Set[str]:
+    return session.info.get(TABLAS_PENDIENTES, set())
+
+def _registrar(session, tablas: Iterable[str]) -> None:
+    session.info.setdefault(TABLAS_PENDIENTES, set()).update(tablas)
+
+def invalidar_pendientes(session) -> None:
+    """Invalida las tablas modificadas por la transacción recién confirmada."""
+    tablas = session.info.pop(TABLAS_PENDIENTES, None)
+    backend = get_cache()
+    if tablas and backend is not None:
+        backend.invalidate_tags(tablas)
+
+def descartar_pendientes(session) -> None:
+    session.info.pop(TABLAS_PENDIENTES, None)
+
+def _after_flush(session, _flush_context):
+    _registrar(session, {
+        obj.__table__.name
+        for grupo in (session.new, session.dirty, session.deleted)
+        for obj in grupo if hasattr(obj, "__table__")
+    })
+
+def _do_orm_execute(estado):
+    if estado.is_update or estado.is_delete or estado.is_insert:
+        tabla = getattr(estado.statement, "table", None)
+        if tabla is not None:
+            _registrar(estado.session, {tabla.name})
+
+def _instalar_eventos() -> None:
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+
+
+# Configuración
+
+def crear_backend(config) -> Optional[CacheBackend]:
+    """Crea el backend indicado por CACHE_BACKEND: memory, disk o none."""
+    tipo = (config.get("CACHE_BACKEND") or "none").lower()
+    if tipo == "memory":
+        return MemoryBackend(max_size=int(config.get("CACHE_MAX_SIZE", 2048)))
+    if tipo == "disk":
+        return DiskBackend(config["CACHE_PATH"], max_size=int(config.get("CACHE_MAX_SIZE", 2048)))
+    if tipo == "none":
+        return None
+    raise ValueError(f"CACHE_BACKEND no soportado: {tipo}")
+
+def init_cache(app) -> Optional[CacheBackend]:
+    """Registra el backend de caché en la app e instala el registro de escrituras."""
+    _instalar_eventos()
+    app.extensions["cache"] = crear_backend(app.config)
+    return app.extensions["cache"]
+
+def get_cache() -> Optional[CacheBackend]:
+    """Devuelve el backend de la app actual, o None si la caché está desactivada."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("cache")
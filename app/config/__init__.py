@@ -1,2 +1,3 @@
 from app.config.settings import Config
-from app.config.create_admin import create_initial_super_admin
\ No newline at end of file
+from app.config.create_admin import create_initial_super_admin
+from app.config.bootstrap import bootstrap_database, seed_database
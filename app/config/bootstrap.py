@@ -0,0 +1,40 @@
+"""
+Tareas de arranque de la base de datos: crear tablas, el super admin inicial
+y, en desarrollo, el seed académico.
+
+Se ejecutan con `flask bootstrap` y `flask seed` (o desde create_app si
+AUTO_BOOTSTRAP está activo) bajo un bloqueo consultivo, para que varios
+workers arrancando a la vez no compitan por crear lo mismo.
+"""
+import time
+from typing import Optional
+
+from flask import current_app
+
+from app.database import db
+from app.database.advisory_lock import advisory_lock
+from app.database.replica import leer_de_primaria
+
+LOCK_BOOTSTRAP = "expresarte_bootstrap"
+
+
+def bootstrap_database() -> Optional[bool]:
+    """Crea las tablas que falten y el super admin inicial."""
+    from app.config.create_admin import create_initial_super_admin
+
+    inicio = time.perf_counter()
+    leer_de_primaria(db.session)  # la réplica puede no tener aún las tablas
+    with advisory_lock(db.engine, LOCK_BOOTSTRAP):
+        db.create_all()
+        resultado = create_initial_super_admin()
+    current_app.logger.info(f"Bootstrap completado en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    return resultado
+
+
+def seed_database() -> Optional[bool]:
+    """Carga el seed académico de prueba."""
+    from app.seeds.academico_seed import generar_seed_academico
+
+    leer_de_primaria(db.session)
+    with advisory_lock(db.engine, LOCK_BOOTSTRAP):
+        return generar_seed_academico()
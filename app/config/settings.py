@@ -24,6 +24,19 @@ class Config:
     DEBUG = os.environ.get("DEBUG")
     LANGUAGE = os.environ.get("LANGUAGE")
     SCHEDULER_API_ENABLED = os.environ.get("SCHEDULER_API_ENABLED") or True
+    AUTO_BOOTSTRAP = str_to_bool(os.getenv('AUTO_BOOTSTRAP', 'True' if DEBUG else 'False'))  # tablas, admin y seed en create_app
+    LAZY_MIGRATE = str_to_bool(os.getenv('LAZY_MIGRATE', 'True'))  # Flask-Migrate solo en la CLI
+
+    # Servidor de producción (flask serve)
+    SERVE_HOST = os.getenv('SERVE_HOST', '0.0.0.0')
+    SERVE_PROCESSES = int(os.getenv('SERVE_PROCESSES', 1))
+    SERVE_GRACEFUL_TIMEOUT = float(os.getenv('SERVE_GRACEFUL_TIMEOUT', 30))
+    WAITRESS_THREADS = int(os.getenv('WAITRESS_THREADS', 8))
+    WAITRESS_CONNECTION_LIMIT = int(os.getenv('WAITRESS_CONNECTION_LIMIT', 100))
+    WAITRESS_BACKLOG = int(os.getenv('WAITRESS_BACKLOG', 1024))
+    WAITRESS_CHANNEL_TIMEOUT = int(os.getenv('WAITRESS_CHANNEL_TIMEOUT', 120))
+    WAITRESS_CLEANUP_INTERVAL = int(os.getenv('WAITRESS_CLEANUP_INTERVAL', 30))
+    WAITRESS_TRUSTED_PROXY = os.getenv('WAITRESS_TRUSTED_PROXY')  # IP del proxy inverso, si lo hay
 
     # Variables de entorno para el administrador
     ADMIN_NOMBRE = os.getenv('ADMIN_NOMBRE', 'Admin')
@@ -35,10 +48,48 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('SQLALCHEMY_DATABASE_URI') or f'sqlite:///{os.path.join(BASE_DIR, "expresarte.db")}'
     SQLALCHEMY_TRACK_MODIFICATIONS = os.environ.get('SQLALCHEMY_TRACK_MODIFICATIONS') or False
 
+    # Réplica de lectura (ver app/database/replica.py); sin definir, todo va a la principal
+    SQLALCHEMY_REPLICA_URI = os.environ.get('SQLALCHEMY_REPLICA_URI') or None
+    REPLICA_READ_YOUR_WRITES_SECONDS = float(os.environ.get('REPLICA_READ_YOUR_WRITES_SECONDS', 5))
+
+    # Perfil de SQLite para workers concurrentes (ver app/database/db_config.py)
+    SQLITE_TUNING = str_to_bool(os.getenv('SQLITE_TUNING', 'True'))
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', -20000))  # negativo: KiB (20 MB)
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 268435456))  # 256 MB
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+    SQLITE_POOL_SIZE = int(os.getenv('SQLITE_POOL_SIZE', 10))
+    SQLITE_MAX_OVERFLOW = int(os.getenv('SQLITE_MAX_OVERFLOW', 10))
+
+    # Paginación
+    USERS_PER_PAGE = int(os.getenv('USERS_PER_PAGE', 50))
+
+    # Caché
+    ACTIVE_PERIOD_CHECK_SECONDS = float(os.getenv('ACTIVE_PERIOD_CHECK_SECONDS', 30))  # cada cuánto se verifica la versión del período activo
+    USER_CACHE_ENABLED = str_to_bool(os.getenv('USER_CACHE_ENABLED', 'True'))
+    USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 60))
+    USER_CACHE_MAX_SIZE = int(os.getenv('USER_CACHE_MAX_SIZE', 1024))
+    USER_CACHE_CHECK_SECONDS = float(os.getenv('USER_CACHE_CHECK_SECONDS', 10))
+    USER_CACHE_RECHECK_SENSITIVE = str_to_bool(os.getenv('USER_CACHE_RECHECK_SENSITIVE', 'True'))  # rutas sensibles leen el usuario de la base
+    USER_CACHE_REPORT_EVERY = int(os.getenv('USER_CACHE_REPORT_EVERY', 1000))  # registra la tasa de aciertos cada N consultas
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory')  # memory | disk | none; cada acierto se verifica contra VersionCache
+    CACHE_PATH = os.getenv('CACHE_PATH') or os.path.join(BASE_DIR, 'cache', 'expresarte-cache.db')  # backend disk
+    CACHE_DEFAULT_TTL = float(os.getenv('CACHE_DEFAULT_TTL', 300))
+    CACHE_MAX_SIZE = int(os.getenv('CACHE_MAX_SIZE', 2048))
+    FRAGMENT_CACHE_ENABLED = str_to_bool(os.getenv('FRAGMENT_CACHE_ENABLED', 'True'))
+    FRAGMENT_CACHE_TTL = float(os.getenv('FRAGMENT_CACHE_TTL', 300))
+    FRAGMENT_CACHE_MAX_SIZE = int(os.getenv('FRAGMENT_CACHE_MAX_SIZE', 256))
+    JINJA_BYTECODE_CACHE_DIR = os.getenv('JINJA_BYTECODE_CACHE_DIR', os.path.join(BASE_DIR, 'cache', 'jinja'))  # vacío para desactivar
+
     # Encriptado
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'una_clave_secreta_segura'
     SECURITY_PASSWORD_SALT = os.getenv('SECURITY_PASSWORD_SALT')
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
+    PASSWORD_HASH_ALGORITHM = os.getenv('PASSWORD_HASH_ALGORITHM', 'scrypt')  # scrypt | pbkdf2
+    PASSWORD_HASH_COST = os.getenv('PASSWORD_HASH_COST')  # scrypt: N o N:r:p, pbkdf2: iteraciones
+    PASSWORD_SALT_LENGTH = int(os.getenv('PASSWORD_SALT_LENGTH', 16))
     RESET_TOKEN_EXP_MINUTES = int(os.getenv('RESET_TOKEN_EXP_MINUTES', 25))
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 30)))
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=int(os.getenv('JWT_REFRESH_TOKEN_EXPIRES', 30)))
@@ -51,4 +102,17 @@ class Config:
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = (os.environ.get('APP_NAME'), os.environ.get('MAIL_USERNAME'))
-    MAIL_DEBUG = int(os.environ.get('MAIL_DEBUG', 0))
\ No newline at end of file
+    MAIL_DEBUG = int(os.environ.get('MAIL_DEBUG', 0))
+    MAIL_PRERENDER = str_to_bool(os.environ.get('MAIL_PRERENDER', 'True'))
+
+    # Bandeja de salida de correos
+    MAIL_OUTBOX_ENABLED = str_to_bool(os.environ.get('MAIL_OUTBOX_ENABLED', 'True'))
+    MAIL_OUTBOX_WORKER = os.environ.get('MAIL_OUTBOX_WORKER', 'thread')  # thread | cli
+    MAIL_OUTBOX_THREADS = int(os.environ.get('MAIL_OUTBOX_THREADS', 2))
+    MAIL_OUTBOX_POLL_SECONDS = float(os.environ.get('MAIL_OUTBOX_POLL_SECONDS', 5))
+    MAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('MAIL_OUTBOX_MAX_ATTEMPTS', 5))
+    MAIL_OUTBOX_BACKOFF_SECONDS = float(os.environ.get('MAIL_OUTBOX_BACKOFF_SECONDS', 30))
+    MAIL_OUTBOX_BACKOFF_MAX_SECONDS = float(os.environ.get('MAIL_OUTBOX_BACKOFF_MAX_SECONDS', 3600))
+    MAIL_OUTBOX_LEASE_SECONDS = float(os.environ.get('MAIL_OUTBOX_LEASE_SECONDS', 300))
+    MAIL_BULK_BATCH_SIZE = int(os.environ.get('MAIL_BULK_BATCH_SIZE', 50))  # mensajes por conexión SMTP
+    MAIL_BULK_RATE = float(os.environ.get('MAIL_BULK_RATE', 0))  # mensajes/segundo, 0 = sin límite
\ No newline at end of file
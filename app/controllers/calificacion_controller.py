@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+from sqlalchemy import insert, tuple_, update
 
 from app.controllers.db_controller import DatabaseController
-from app.database.models import Calificacion
+from app.database.models import Calificacion, CatedraAcademica
 from app.schemas.calificaciones import (
     CalificacionCreate,
     CalificacionUpdate,
@@ -80,4 +81,118 @@ class CalificacionController(DatabaseController):
             catedra_academica_id=catedra_id
         ).first()
 
-        return self._to_response(resultado, CalificacionResponse) if resultado else None
\ No newline at end of file
+        return self._to_response(resultado, CalificacionResponse) if resultado else None
+
+    def obtener_calificaciones_por_catedra(self, catedra_id: int) -> Dict[int, CalificacionResponse]:
+        """Obtiene todas las calificaciones de una cátedra indexadas por estudiante_id"""
+        calificaciones = self.session.query(Calificacion).filter_by(
+            catedra_academica_id=catedra_id
+        ).all()
+
+        return {
+            c.estudiante_id: c
+            for c in self._bulk_to_response(calificaciones, CalificacionResponse)
+        }
+
+    def _upsert_lote(self, filas: List[dict]) -> None:
+        """Inserta o actualiza calificaciones según (estudiante_id, catedra_academica_id).
+
+        Usa el upsert nativo del motor cuando existe y, si no, una
+        combinación de INSERT y UPDATE masivos en la misma transacción.
+        Se escriben todas las columnas: unas observaciones vacías borran las
+        anteriores.
+        """
+        dialecto = self.session.get_bind().dialect.name
+
+        if dialecto in ("sqlite", "postgresql"):
+            if dialecto == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            stmt = dialect_insert(Calificacion).values(filas)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Calificacion.estudiante_id, Calificacion.catedra_academica_id],
+                set_={
+                    "periodo_id": stmt.excluded.periodo_id,
+                    "calificacion": stmt.excluded.calificacion,
+                    "observaciones": stmt.excluded.observaciones,
+                    "fecha": stmt.excluded.fecha
+                }
+            )
+            self.session.execute(stmt)
+            return
+
+        if dialecto in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert as dialect_insert
+            stmt = dialect_insert(Calificacion).values(filas)
+            stmt = stmt.on_duplicate_key_update(
+                periodo_id=stmt.inserted.periodo_id,
+                calificacion=stmt.inserted.calificacion,
+                observaciones=stmt.inserted.observaciones,
+                fecha=stmt.inserted.fecha
+            )
+            self.session.execute(stmt)
+            return
+
+        existentes = {
+            (estudiante_id, catedra_id): calificacion_id
+            for estudiante_id, catedra_id, calificacion_id in self.session.query(
+                Calificacion.estudiante_id, Calificacion.catedra_academica_id, Calificacion.id
+            ).filter(
+                tuple_(Calificacion.estudiante_id, Calificacion.catedra_academica_id).in_(
+                    {(f["estudiante_id"], f["catedra_academica_id"]) for f in filas}
+                )
+            )
+        }
+
+        nuevas, cambios = [], []
+        for fila in filas:
+            calificacion_id = existentes.get((fila["estudiante_id"], fila["catedra_academica_id"]))
+            if calificacion_id is None:
+                nuevas.append(fila)
+            else:
+                cambio = dict(fila, id=calificacion_id)
+                cambios.append(cambio)
+
+        if nuevas:
+            self.session.execute(insert(Calificacion), nuevas)
+        if cambios:
+            self.session.execute(update(Calificacion), cambios)
+
+    def registrar_lote(self, catedra_id: int, datos: List[CalificacionCreate]) -> int:
+        """Registra o actualiza las calificaciones de una cátedra completa en una sola sentencia.
+
+        Keyword arguments:
+        argument: catedra_id -- ID de la cátedra académica
+        argument: datos -- Calificaciones a registrar, todas de la misma cátedra
+        Return: int -- Número de calificaciones registradas o actualizadas
+        Raises:
+        NotFoundError -- Si la cátedra no existe
+        ValueError -- Si alguna calificación pertenece a otra cátedra
+        PermissionDeniedError -- Si la transacción no pudo confirmarse
+        """
+        catedra = self._get_or_fail(CatedraAcademica, catedra_id)
+        if any(d.catedra_academica_id != catedra.id for d in datos):
+            raise ValueError("Todas las calificaciones del lote deben pertenecer a la misma cátedra.")
+        if not datos:
+            return 0
+
+        # Una fila por estudiante: si se repite, prevalece la última
+        fecha = datetime.utcnow()
+        filas = list({
+            d.estudiante_id: {
+                "estudiante_id": d.estudiante_id,
+                "catedra_academica_id": catedra.id,
+                "periodo_id": d.periodo_id or catedra.periodo_id,
+                "calificacion": d.calificacion,
+                "observaciones": d.observaciones,
+                "fecha": fecha
+            }
+            for d in datos
+        }.values())
+
+        self._upsert_lote(filas)
+        if self._commit_or_rollback() is not True:
+            raise PermissionDeniedError("No se pudieron registrar las calificaciones")
+        return len(filas)
+
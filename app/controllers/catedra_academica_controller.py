@@ -1,14 +1,17 @@
 from typing import Optional, List
+from sqlalchemy import func
 
 from app.controllers.db_controller import DatabaseController
-from app.database.models import CatedraAcademica
+from app.database.models import CatedraAcademica, Usuario
 from app.database.enums import Catedra
 from app.schemas.catedra_periodo import (
     CatedraAcademicaCreate,
     CatedraAcademicaUpdate,
-    CatedraAcademicaResponse
+    CatedraAcademicaResponse,
+    CatedraAcademicaListItem
 )
 from app.errors.exceptions import NotFoundError, PermissionDeniedError
+from app.cache import cached
 
 class CatedraAcademicaController(DatabaseController):
     """Controlador para gestión de cátedras académicas por período"""
@@ -41,6 +44,7 @@ class CatedraAcademicaController(DatabaseController):
         self._commit_or_rollback()
         return self._to_response(catedra, CatedraAcademicaResponse)
 
+    @cached(CatedraAcademica)
     def listar_por_periodo(self, periodo_id: int) -> List[CatedraAcademicaResponse]:
         """Lista todas las cátedras académicas de un período específico."""
         catedras = self.session.query(CatedraAcademica).filter_by(periodo_id=periodo_id).order_by(
@@ -48,6 +52,26 @@ class CatedraAcademicaController(DatabaseController):
         ).all()
         return self._bulk_to_response(catedras, CatedraAcademicaResponse)
 
+    @cached(CatedraAcademica, Usuario)
+    def listar_resumen_por_periodo(self, periodo_id: int) -> List[CatedraAcademicaListItem]:
+        """Lista las cátedras de un período con el nombre del profesor, seleccionando
+        solo las columnas necesarias para mostrarlas."""
+        filas = self.session.query(
+            CatedraAcademica.id,
+            CatedraAcademica.catedra,
+            CatedraAcademica.grupo,
+            CatedraAcademica.cupos,
+            CatedraAcademica.inscritos,
+            CatedraAcademica.profesor_id,
+            (Usuario.primer_nombre + " " + Usuario.primer_apellido).label("profesor_nombre")
+        ).outerjoin(
+            Usuario, Usuario.id == CatedraAcademica.profesor_id
+        ).filter(
+            CatedraAcademica.periodo_id == periodo_id
+        ).order_by(CatedraAcademica.grupo).all()
+        return self._bulk_to_response(filas, CatedraAcademicaListItem, trusted=True)
+
+    @cached(CatedraAcademica)
     def listar_por_profesor(self, profesor_id: int) -> List[CatedraAcademicaResponse]:
         """Lista todas las cátedras académicas asignadas a un profesor específico."""
         catedras = self.session.query(CatedraAcademica).filter_by(profesor_id=profesor_id).order_by(
@@ -1,14 +1,73 @@
 """Controlador de base de datos"""
-from typing import Any, Type
-from pydantic import BaseModel
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from inspect import isfunction, isgeneratorfunction
+from typing import Any, List, Type, get_args
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from typing import Union
 
 from app.errors.exceptions import NotFoundError
+from app.database.replica import alcance_bind
+from app.cache import invalidar_pendientes, descartar_pendientes, etiquetas_pendientes, marcar_tablas_modificadas
+
+_AUSENTE = object()
+
+# Métodos públicos que solo leen: con réplica configurada consultan el bind de lectura
+PREFIJOS_LECTURA = ("get_", "list_", "listar_", "obtener_", "contar_", "count_")
+
+
+def solo_lectura(func):
+    """Marca un método público como de solo lectura aunque su nombre no lo indique."""
+    func._lectura = True
+    return func
+
+
+def usa_primaria(func):
+    """Marca un método de lectura que debe ir a la base principal (p. ej. porque
+    devuelve modelos ORM que luego se modifican)."""
+    func._lectura = False
+    return func
+
+
+def _enrutar(func, lectura: bool):
+    @wraps(func)
+    def envoltura(self, *args, **kwargs):
+        with alcance_bind(self.session, lectura):
+            return func(self, *args, **kwargs)
+    return envoltura
+
+@lru_cache(maxsize=None)
+def _lista_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter de List[schema], compilado una sola vez por schema."""
+    return TypeAdapter(List[schema])
+
+@lru_cache(maxsize=None)
+def _campos_confiables(schema: Type[BaseModel]):
+    """Campos del schema y, de ellos, los datetime (la base devuelve date
+    en columnas Date y la validación normal los convierte a datetime)."""
+    campos = tuple(schema.model_fields)
+    fechas = tuple(
+        nombre for nombre, campo in schema.model_fields.items()
+        if campo.annotation is datetime or datetime in get_args(campo.annotation)
+    )
+    return campos, fechas
+
 
 class DatabaseController:
+    def __init_subclass__(cls, **kwargs):
+        """Envuelve los métodos públicos para enrutar sus consultas: los de
+        lectura (por prefijo o @solo_lectura) a la réplica y el resto a la
+        principal. Los generadores se dejan en la principal."""
+        super().__init_subclass__(**kwargs)
+        for nombre, atributo in list(vars(cls).items()):
+            if nombre.startswith("_") or not isfunction(atributo) or isgeneratorfunction(atributo):
+                continue
+            lectura = getattr(atributo, "_lectura", nombre.startswith(PREFIJOS_LECTURA))
+            setattr(cls, nombre, _enrutar(atributo, lectura))
+
     def __init__(self, db: SQLAlchemy):
         self.db = db
         self.session = self.db.session
@@ -16,12 +75,18 @@ class DatabaseController:
     def _commit_or_rollback(self) -> Union[bool, str]:
         """Intenta hacer commit de la sesión actual.
         Si falla, hace rollback y devuelve el error.
+        Antes del commit incrementa los contadores de las tablas modificadas
+        (usados por los ETag) y, tras un commit exitoso, invalida su caché.
         """
         try:
+            self.session.flush()
+            marcar_tablas_modificadas(self.session, etiquetas_pendientes(self.session))
             self.session.commit()
+            invalidar_pendientes(self.session)
             return True
         except Exception as e:
             self.session.rollback()
+            descartar_pendientes(self.session)
             current_app.logger.error(f"[COMMIT ERROR] {e}")
             return str(e)
 
@@ -40,9 +105,36 @@ class DatabaseController:
 
         raise TypeError(f"Tipo no soportado: {type(instance)}")
 
-    def _bulk_to_response(self, instances: list[Any], schema: Type[BaseModel]) -> list[BaseModel]:
-        """Convierte múltiples instancias ORM o dicts en schemas Pydantic"""
-        return [self._to_response(i, schema) for i in instances if i]
+    def _bulk_to_response(self, instances: list[Any], schema: Type[BaseModel], trusted: bool = False) -> list[BaseModel]:
+        """Convierte múltiples instancias ORM o dicts en schemas Pydantic.
+
+        Valida la lista completa con un TypeAdapter precompilado. Con
+        `trusted=True` (filas ORM o tuplas de columnas leídas de nuestra propia
+        base) se omite la validación y se construyen con `model_construct`.
+        """
+        instances = [i for i in instances if i]
+        if trusted:
+            return self._construct_bulk(instances, schema)
+        return _lista_adapter(schema).validate_python(instances, from_attributes=True)
+
+    @staticmethod
+    def _construct_bulk(rows: list[Any], schema: Type[BaseModel]) -> list[BaseModel]:
+        """Construye schemas sin validar a partir de objetos con atributos por campo."""
+        campos, fechas = _campos_confiables(schema)
+        construir = schema.model_construct
+        resultado = []
+        for row in rows:
+            valores = {}
+            for campo in campos:
+                valor = getattr(row, campo, _AUSENTE)
+                if valor is not _AUSENTE:
+                    valores[campo] = valor
+            for campo in fechas:
+                valor = valores.get(campo)
+                if type(valor) is date:
+                    valores[campo] = datetime(valor.year, valor.month, valor.day)
+            resultado.append(construir(**valores))
+        return resultado
 
     def _get_or_fail(self, model_class, object_id: int):
         """Obtiene un objeto por su ID o lanza NotFoundError si no existe."""
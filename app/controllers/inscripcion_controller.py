@@ -1,7 +1,10 @@
+from collections import Counter
 from typing import List
+from sqlalchemy import func, insert, select, tuple_, update
 from app.controllers.db_controller import DatabaseController
 from app.database.models import Inscripcion, CatedraAcademica
-from app.schemas.inscripciones import InscripcionCreate, InscripcionUpdate, InscripcionResponse
+from app.database.enums import EstadoInscripcion
+from app.schemas.inscripciones import InscripcionCreate, InscripcionUpdate, InscripcionResponse, InscripcionLoteResultado
 from app.errors.exceptions import NotFoundError, PermissionDeniedError
 
 
@@ -11,6 +14,36 @@ class InscripcionController(DatabaseController):
         super().__init__(db)
         self.current_user = current_user
 
+    def _reservar_cupo(self, catedra_id: int) -> None:
+        """Ocupa un cupo de la cátedra con un UPDATE condicional atómico.
+
+        La reserva forma parte de la transacción en curso: si luego se hace
+        rollback, el cupo se libera.
+
+        Raises:
+        PermissionDeniedError -- Si la cátedra no tiene cupos disponibles
+        """
+        resultado = self.session.execute(
+            update(CatedraAcademica)
+            .where(
+                CatedraAcademica.id == catedra_id,
+                CatedraAcademica.inscritos < CatedraAcademica.cupos
+            )
+            .values(inscritos=CatedraAcademica.inscritos + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if resultado.rowcount == 0:
+            raise PermissionDeniedError(f"No hay cupos disponibles en la cátedra {catedra_id}")
+
+    def _liberar_cupo(self, catedra_id: int) -> None:
+        """Libera un cupo de la cátedra dentro de la transacción en curso."""
+        self.session.execute(
+            update(CatedraAcademica)
+            .where(CatedraAcademica.id == catedra_id, CatedraAcademica.inscritos > 0)
+            .values(inscritos=CatedraAcademica.inscritos - 1)
+            .execution_options(synchronize_session=False)
+        )
+
     def inscribir_alumno(self, data: InscripcionCreate) -> InscripcionResponse:
         """Inscribe a un alumno en una cátedra si cumple condiciones de rol y cupos"""
         # Validar existencia de la cátedra
@@ -18,39 +51,176 @@ class InscripcionController(DatabaseController):
         if not catedra:
             raise NotFoundError("Cátedra académica no encontrada")
 
-        # Validar cupos
-        cupo_actual = self.session.query(Inscripcion).filter_by(
-            catedra_academica_id=catedra.id, estado="activo"
-        ).count()
-
-        if cupo_actual >= catedra.cupos:
-            raise PermissionDeniedError(f"No hay cupos disponibles en la cátedra {catedra.id}")
-
         # Verificar si ya existe
         existente = self.session.query(Inscripcion).filter_by(
-            estudiante_id=data.estudiante_id, catedra_academica_id=catedra.id, estado="activo"
+            estudiante_id=data.estudiante_id, catedra_academica_id=catedra.id, estado=EstadoInscripcion.ACTIVO
         ).first()
 
         if existente:
             raise PermissionDeniedError("El alumno ya está inscrito en esta cátedra")
 
+        estado = data.estado or EstadoInscripcion.ACTIVO
+
+        # Validar cupos: solo las inscripciones activas ocupan un cupo
+        if estado == EstadoInscripcion.ACTIVO:
+            try:
+                self._reservar_cupo(catedra.id)
+            except PermissionDeniedError:
+                self.session.rollback()
+                raise
+        elif catedra.inscritos >= catedra.cupos:
+            raise PermissionDeniedError(f"No hay cupos disponibles en la cátedra {catedra.id}")
+
         nueva = Inscripcion(
             estudiante_id=data.estudiante_id,
             catedra_academica_id=catedra.id,
             periodo_id=data.periodo_id,
-            estado=data.estado or "activo"
+            estado=estado
         )
 
         self.session.add(nueva)
-        self._commit_or_rollback()
+        if self._commit_or_rollback() is not True:
+            raise PermissionDeniedError("No se pudo registrar la inscripción")
+        self.session.expire(catedra, ["inscritos"])
         return self._to_response(nueva, InscripcionResponse)
 
 
+    def _reservar_cupos(self, catedra_id: int, solicitados: int) -> int:
+        """Reserva hasta `solicitados` cupos de una cátedra de forma atómica.
+
+        Los cupos libres se leen con SELECT ... FOR UPDATE: es una lectura actual
+        (no la instantánea de la transacción, como en InnoDB con REPEATABLE READ)
+        y bloquea la fila hasta el commit, así que el UPDATE condicional no puede
+        perder la carrera contra otra inscripción.
+
+        Return: int -- Número de cupos efectivamente reservados
+        Raises:
+        PermissionDeniedError -- Si el UPDATE condicional no se aplica
+        """
+        disponibles = self.session.execute(
+            select(CatedraAcademica.cupos - CatedraAcademica.inscritos)
+            .where(CatedraAcademica.id == catedra_id)
+            .with_for_update()
+        ).scalar() or 0
+        cantidad = min(solicitados, max(disponibles, 0))
+        if cantidad == 0:
+            return 0
+
+        resultado = self.session.execute(
+            update(CatedraAcademica)
+            .where(
+                CatedraAcademica.id == catedra_id,
+                CatedraAcademica.inscritos + cantidad <= CatedraAcademica.cupos
+            )
+            .values(inscritos=CatedraAcademica.inscritos + cantidad)
+            .execution_options(synchronize_session=False)
+        )
+        if resultado.rowcount == 0:
+            raise PermissionDeniedError(f"No se pudieron reservar cupos en la cátedra {catedra_id}")
+        return cantidad
+
+    def inscribir_lote(self, datos: List[InscripcionCreate]) -> List[InscripcionLoteResultado]:
+        """Inscribe un lote de alumnos en una sola transacción.
+
+        Valida existencia de cátedras, duplicados y cupos con consultas por
+        conjunto, inserta las inscripciones aceptadas con un INSERT masivo y
+        devuelve el resultado de cada fila en el mismo orden de entrada.
+        """
+        if not datos:
+            return []
+
+        catedra_ids = {d.catedra_academica_id for d in datos}
+        catedras = {
+            c.id: c for c in self.session.query(CatedraAcademica).filter(CatedraAcademica.id.in_(catedra_ids))
+        }
+
+        pares = {(d.estudiante_id, d.catedra_academica_id) for d in datos}
+        existentes = set(self.session.query(
+            Inscripcion.estudiante_id, Inscripcion.catedra_academica_id
+        ).filter(
+            tuple_(Inscripcion.estudiante_id, Inscripcion.catedra_academica_id).in_(pares),
+            Inscripcion.estado == EstadoInscripcion.ACTIVO
+        ).all())
+
+        # Primera pasada: existencia y duplicados (contra la db y dentro del lote)
+        resultados = []
+        vistos = set()
+        for d in datos:
+            par = (d.estudiante_id, d.catedra_academica_id)
+            if d.catedra_academica_id not in catedras:
+                estado = "catedra_inexistente"
+            elif par in existentes or par in vistos:
+                estado = "duplicada"
+            else:
+                estado = "aceptada"
+                vistos.add(par)
+            resultados.append(estado)
+
+        # Segunda pasada: reserva de cupos por cátedra para las inscripciones activas
+        activos = Counter(
+            d.catedra_academica_id for d, estado in zip(datos, resultados)
+            if estado == "aceptada" and (d.estado or EstadoInscripcion.ACTIVO) == EstadoInscripcion.ACTIVO
+        )
+        try:
+            reservados = {cid: self._reservar_cupos(cid, n) for cid, n in activos.items()}
+        except PermissionDeniedError:
+            self.session.rollback()
+            raise
+
+        filas = []
+        for i, d in enumerate(datos):
+            if resultados[i] != "aceptada":
+                continue
+            estado = d.estado or EstadoInscripcion.ACTIVO
+            catedra = catedras[d.catedra_academica_id]
+            if estado == EstadoInscripcion.ACTIVO:
+                if reservados[catedra.id] == 0:
+                    resultados[i] = "sin_cupo"
+                    continue
+                reservados[catedra.id] -= 1
+            elif catedra.inscritos >= catedra.cupos:
+                resultados[i] = "sin_cupo"
+                continue
+            fila = {
+                "estudiante_id": d.estudiante_id,
+                "catedra_academica_id": catedra.id,
+                "periodo_id": d.periodo_id,
+                "estado": estado
+            }
+            # Sin fecha explícita se usa el default del modelo (utcnow al insertar)
+            if "fecha_inscripcion" in d.model_fields_set:
+                fila["fecha_inscripcion"] = d.fecha_inscripcion
+            filas.append(fila)
+
+        if filas:
+            self.session.execute(insert(Inscripcion), filas)
+        if self._commit_or_rollback() is not True:
+            raise PermissionDeniedError("No se pudo registrar el lote de inscripciones")
+
+        for catedra in catedras.values():
+            self.session.expire(catedra, ["inscritos"])
+
+        return [
+            InscripcionLoteResultado(
+                estudiante_id=d.estudiante_id,
+                catedra_academica_id=d.catedra_academica_id,
+                resultado=estado
+            )
+            for d, estado in zip(datos, resultados)
+        ]
+
     def cambiar_estado(self, inscripcion_id: int, nuevo_estado: str) -> InscripcionResponse:
-        """Actualiza el estado de una inscripción"""
+        """Actualiza el estado de una inscripción, manteniendo el contador de cupos"""
         insc = self._get_or_fail(Inscripcion, inscripcion_id)
         if nuevo_estado not in ["activo", "retirado", "aprobado"]:
             raise ValueError("Estado inválido")
+
+        if insc.estado != nuevo_estado:
+            if nuevo_estado == EstadoInscripcion.ACTIVO:
+                self._reservar_cupo(insc.catedra_academica_id)
+            elif insc.estado == EstadoInscripcion.ACTIVO:
+                self._liberar_cupo(insc.catedra_academica_id)
+
         insc.estado = nuevo_estado
         self._commit_or_rollback()
         return self._to_response(insc, InscripcionResponse)
@@ -58,9 +228,32 @@ class InscripcionController(DatabaseController):
     def eliminar_inscripcion(self, inscripcion_id: int) -> bool:
         """Elimina la inscripción directamente (solo si no hay evaluaciones vinculadas, opcional)"""
         insc = self._get_or_fail(Inscripcion, inscripcion_id)
+        if insc.estado == EstadoInscripcion.ACTIVO:
+            self._liberar_cupo(insc.catedra_academica_id)
         self.session.delete(insc)
         return self._commit_or_rollback() is True
 
+    def reconciliar_cupos(self) -> int:
+        """Recalcula el contador de inscritos de todas las cátedras a partir de las inscripciones activas.
+
+        Return: int -- Número de cátedras cuyo contador fue corregido
+        """
+        activos = select(func.count(Inscripcion.id)).where(
+            Inscripcion.catedra_academica_id == CatedraAcademica.id,
+            Inscripcion.estado == EstadoInscripcion.ACTIVO
+        ).scalar_subquery()
+
+        resultado = self.session.execute(
+            update(CatedraAcademica)
+            .where(CatedraAcademica.inscritos != activos)
+            .values(inscritos=activos)
+            .execution_options(synchronize_session=False)
+        )
+        corregidas = resultado.rowcount
+        self._commit_or_rollback()
+        self.session.expire_all()
+        return corregidas
+
     def listar_por_alumno(self, estudiante_id: int) -> List[InscripcionResponse]:
         """Devuelve todas las inscripciones de un alumno"""
         inscripciones = self.session.query(Inscripcion).filter_by(
@@ -71,7 +264,9 @@ class InscripcionController(DatabaseController):
 
     def contar_estudiantes_en_catedra(self, catedra_id: int) -> int:
         """Cuenta el número de inscripciones activas en una cátedra académica"""
-        return self.session.query(Inscripcion).filter_by(catedra_academica_id=catedra_id).count()
+        return self.session.query(Inscripcion).filter_by(
+            catedra_academica_id=catedra_id, estado=EstadoInscripcion.ACTIVO
+        ).count()
 
     def listar_por_catedra(self, catedra_id: int) -> List[InscripcionResponse]:
         """Devuelve todas las inscripciones activas en una cátedra"""
@@ -1,15 +1,33 @@
+import time
+import threading
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
+from flask import current_app, has_app_context
+from sqlalchemy import and_, func
 
-from app.controllers.db_controller import DatabaseController
-from app.database.models import PeriodoAcademico
+from app.controllers.db_controller import DatabaseController, solo_lectura
+from app.database.models import PeriodoAcademico, CatedraAcademica, Inscripcion, Usuario, VersionCache
+from app.database.enums import EstadoInscripcion, Role
 from app.schemas import PeriodoAcademicoCreate, PeriodoAcademicoUpdate, PeriodoAcademicoResponse
 from app.errors import NotFoundError
+from app.cache import cached
+from app.database.replica import lecturas_en_replica, primaria_forzada
 from sqlalchemy.exc import IntegrityError
 
 
 class PeriodoAcademicoController(DatabaseController):
     """Controlador para gestión de períodos académicos"""
+
+    # Período activo compartido entre instancias del proceso. `version` es la
+    # versión de VersionCache con la que se cargó y `verificado` el instante
+    # (monotónico) de la última comparación contra la base de datos.
+    # `_activo_generacion` cambia con cada invalidación local: una lectura que
+    # empezó antes de un commit no puede volver a guardar el período anterior.
+    VERSION_PERIODO_ACTIVO = "periodo_activo"
+    _activo_cache: Dict[str, object] = {}
+    _activo_generacion = 0
+    _activo_lock = threading.Lock()
+
     def __init__(self, db, current_user=None):
         super().__init__(db)
         self.current_user = current_user
@@ -28,42 +46,184 @@ class PeriodoAcademicoController(DatabaseController):
             fecha_fin=data.fecha_fin
         )
         self.session.add(nuevo)
-        self._commit_or_rollback()
+        self._marcar_periodo_activo_modificado()
+        self._confirmar_periodo_activo()
         return self._to_response(nuevo, PeriodoAcademicoResponse)
 
+    @cached(PeriodoAcademico)
     def listar_periodos(self, solo_activos: bool = False) -> List[PeriodoAcademicoResponse]:
-        query = self.session.query(PeriodoAcademico)
+        """Lista los períodos, seleccionando columnas en lugar de entidades."""
+        query = self.session.query(
+            PeriodoAcademico.id,
+            PeriodoAcademico.nombre,
+            PeriodoAcademico.fecha_inicio,
+            PeriodoAcademico.fecha_fin,
+            PeriodoAcademico.activo
+        )
         if solo_activos:
-            query = query.filter_by(activo=True)
+            query = query.filter(PeriodoAcademico.activo.is_(True))
         periodos = query.order_by(PeriodoAcademico.fecha_inicio.desc()).all()
-        return self._bulk_to_response(periodos, PeriodoAcademicoResponse)
+        return self._bulk_to_response(periodos, PeriodoAcademicoResponse, trusted=True)
 
     def activar_periodo(self, periodo_id: int) -> PeriodoAcademicoResponse:
         self.session.query(PeriodoAcademico).update({PeriodoAcademico.activo: False}) # <--- Experimental, para evitar que haya más de un período activo a la vez
         periodo = self._get_or_fail(PeriodoAcademico, periodo_id)
         periodo.activo = True
-        self._commit_or_rollback()
+        self._marcar_periodo_activo_modificado()
+        self._confirmar_periodo_activo()
         return self._to_response(periodo, PeriodoAcademicoResponse)
 
     def desactivar_periodo(self, periodo_id: int) -> PeriodoAcademicoResponse:
         periodo = self._get_or_fail(PeriodoAcademico, periodo_id)
         periodo.activo = False
-        self._commit_or_rollback()
+        self._marcar_periodo_activo_modificado()
+        self._confirmar_periodo_activo()
         return self._to_response(periodo, PeriodoAcademicoResponse)
 
+    def obtener_periodo(self, periodo_id: int) -> PeriodoAcademicoResponse:
+        return self._to_response(self._get_or_fail(PeriodoAcademico, periodo_id), PeriodoAcademicoResponse)
+
     def obtener_periodo_por_nombre(self, nombre: str) -> Optional[PeriodoAcademicoResponse]:
         periodo = self.session.query(PeriodoAcademico).filter_by(nombre=nombre).first()
         return self._to_response(periodo, PeriodoAcademicoResponse) if periodo else None
 
     def get_active_periodo(self) -> Optional[PeriodoAcademicoResponse]:
-        """Devuelve el período académico marcado como activo, si existe"""
+        """Devuelve el período académico marcado como activo, si existe.
+
+        El resultado se cachea en el proceso. Como mucho una vez cada
+        ACTIVE_PERIOD_CHECK_SECONDS se compara la versión cacheada con la fila
+        de VersionCache, de modo que los cambios hechos por otros procesos se
+        ven con ese retraso máximo; los del propio proceso, de inmediato.
+
+        Con réplica, como en `@cached`: lo leído de la réplica no se guarda y,
+        mientras la sesión deba leer lo propio de la principal, no se consulta
+        la copia local.
+        """
+        cache = self._activo_cache
+        ahora = time.monotonic()
+        usar_cache = not primaria_forzada(self.session)
+        if usar_cache and cache and ahora - cache["verificado"] < self._intervalo_verificacion():
+            return cache["periodo"]
+
+        with self._activo_lock:
+            generacion = self._activo_generacion
+        en_replica = lecturas_en_replica(self.session)
+        version = VersionCache.leer(self.session, self.VERSION_PERIODO_ACTIVO)
+        with self._activo_lock:
+            if usar_cache and cache and cache["version"] == version:
+                cache["verificado"] = ahora
+                return cache["periodo"]
+
         activo = self.session.query(PeriodoAcademico).filter_by(activo=True).first()
-        return self._to_response(activo, PeriodoAcademicoResponse) if activo else None
+        periodo = self._to_response(activo, PeriodoAcademicoResponse) if activo else None
+        if lecturas_en_replica(self.session) != en_replica:
+            return periodo
+        with self._activo_lock:
+            if generacion == self._activo_generacion:
+                cache.update(periodo=periodo, version=version, verificado=ahora)
+        return periodo
+
+    @classmethod
+    def invalidar_periodo_activo(cls) -> None:
+        """Descarta el período activo cacheado en este proceso."""
+        with cls._activo_lock:
+            cls._activo_cache.clear()
+            cls._activo_generacion += 1
+
+    def _marcar_periodo_activo_modificado(self) -> None:
+        """Incrementa la versión del período activo en la transacción en curso,
+        para que el resto de procesos recargue su copia."""
+        VersionCache.incrementar(self.session, self.VERSION_PERIODO_ACTIVO)
+
+    def _confirmar_periodo_activo(self) -> bool:
+        """Confirma la transacción y, si tuvo éxito, invalida la copia local.
+
+        Invalidar antes del commit permitiría que otro hilo recargara la fila
+        anterior y la sirviera hasta la siguiente verificación.
+        """
+        confirmado = self._commit_or_rollback() is True
+        if confirmado:
+            self.invalidar_periodo_activo()
+        return confirmado
+
+    @staticmethod
+    def _intervalo_verificacion() -> float:
+        if has_app_context():
+            return current_app.config.get("ACTIVE_PERIOD_CHECK_SECONDS", 30)
+        return 30
 
     def delete_periodo(self, periodo_id: int) -> bool:
         periodo = self._get_or_fail(PeriodoAcademico, periodo_id)
         self.session.delete(periodo)
-        return self._commit_or_rollback() is True
+        self._marcar_periodo_activo_modificado()
+        return self._confirmar_periodo_activo()
+
+    @solo_lectura
+    @cached(CatedraAcademica, Inscripcion, Usuario, PeriodoAcademico)
+    def resumen_periodo(self, periodo_id: int) -> List[dict]:
+        """Devuelve cátedra, grupo, profesor e inscritos activos de cada cátedra del período.
+
+        Se resuelve con un único JOIN + GROUP BY y se cachea por período hasta que
+        un commit modifique cátedras, inscripciones o usuarios (nombre del profesor).
+        """
+        inscritos = func.count(Inscripcion.id).label("inscritos")
+        filas = self.session.query(
+            CatedraAcademica.id,
+            CatedraAcademica.catedra,
+            CatedraAcademica.grupo,
+            CatedraAcademica.cupos,
+            Usuario.primer_nombre,
+            Usuario.primer_apellido,
+            inscritos
+        ).outerjoin(
+            Usuario, Usuario.id == CatedraAcademica.profesor_id
+        ).outerjoin(
+            Inscripcion, and_(
+                Inscripcion.catedra_academica_id == CatedraAcademica.id,
+                Inscripcion.estado == EstadoInscripcion.ACTIVO
+            )
+        ).filter(
+            CatedraAcademica.periodo_id == periodo_id
+        ).group_by(
+            CatedraAcademica.id,
+            CatedraAcademica.catedra,
+            CatedraAcademica.grupo,
+            CatedraAcademica.cupos,
+            Usuario.primer_nombre,
+            Usuario.primer_apellido
+        ).order_by(CatedraAcademica.grupo).all()
+
+        return [{
+            "id": fila.id,
+            "nombre": fila.catedra.label,
+            "grupo": fila.grupo,
+            "cupos": fila.cupos,
+            "profesor": f"{fila.primer_nombre} {fila.primer_apellido}" if fila.primer_nombre else "Sin asignar",
+            "inscritos": fila.inscritos or 0
+        } for fila in filas]
+
+    @solo_lectura
+    def contactos_periodo(self, periodo_id: int, role: Role) -> List[dict]:
+        """Email y nombre de los usuarios activos del período: estudiantes con
+        inscripción activa o profesores con alguna cátedra asignada."""
+        self._get_or_fail(PeriodoAcademico, periodo_id)
+        if role == Role.STUDENT:
+            vinculo = self.session.query(Inscripcion.estudiante_id).filter(
+                Inscripcion.periodo_id == periodo_id,
+                Inscripcion.estado == EstadoInscripcion.ACTIVO
+            )
+        elif role == Role.TEACHER:
+            vinculo = self.session.query(CatedraAcademica.profesor_id).filter(
+                CatedraAcademica.periodo_id == periodo_id
+            )
+        else:
+            raise ValueError(f"Rol no soportado para notificaciones de período: {role}")
+
+        filas = self.session.query(Usuario.email, Usuario.primer_nombre, Usuario.primer_apellido).filter(
+            Usuario.id.in_(vinculo),
+            Usuario.activo.is_(True)
+        ).order_by(Usuario.id).all()
+        return [{"email": fila.email, "nombre": f"{fila.primer_nombre} {fila.primer_apellido}"} for fila in filas]
 
     def update_periodo(self, periodo_id: int, data: PeriodoAcademicoUpdate) -> PeriodoAcademicoResponse:
         periodo = self._get_or_fail(PeriodoAcademico, periodo_id)
@@ -77,5 +237,6 @@ class PeriodoAcademicoController(DatabaseController):
         for field, value in valores.items():
             setattr(periodo, field, value)
 
+        self._marcar_periodo_activo_modificado()
         self._commit_or_rollback()
         return self._to_response(periodo, PeriodoAcademicoResponse)
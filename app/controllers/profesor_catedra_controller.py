@@ -1,9 +1,10 @@
 from typing import List, Optional
 
 from flask import current_app
+from sqlalchemy import and_
 from app.controllers.db_controller import DatabaseController
-from app.database.models import ProfesorCatedra, PeriodoAcademico, CatedraAcademica
-from app.database.enums import Catedra
+from app.database.models import ProfesorCatedra, CatedraAcademica, Inscripcion, Usuario, Calificacion
+from app.database.enums import Catedra, EstadoInscripcion, Role
 from app.schemas import (
     ProfesorCatedraCreate,
     ProfesorCatedraUpdate,
@@ -11,6 +12,8 @@ from app.schemas import (
     CatedraAcademicaResponse
 )
 from app.errors.exceptions import PermissionDeniedError, NotFoundError
+from app.controllers.periodo_academico_controller import PeriodoAcademicoController
+from app.cache import cached
 
 class ProfesorCatedraController(DatabaseController):
     """Controlador para asignación de cátedras a profesores"""
@@ -39,6 +42,7 @@ class ProfesorCatedraController(DatabaseController):
         self._commit_or_rollback()
         return self._to_response(asignacion, ProfesorCatedraResponse)
 
+    @cached(ProfesorCatedra)
     def get_catedras_by_profesor(self, profesor_id: int) -> List[ProfesorCatedraResponse]:
         registros = self.session.query(ProfesorCatedra).filter_by(profesor_id=profesor_id).all()
         return self._bulk_to_response(registros, ProfesorCatedraResponse)
@@ -70,26 +74,58 @@ class ProfesorCatedraController(DatabaseController):
         return self._commit_or_rollback() is True
 
     def get_students_by_catedra(self, profesor_id: int, catedra: str) -> List:
-        periodo = self.session.query(PeriodoAcademico).filter_by(activo=True).first()
+        periodo = PeriodoAcademicoController(self.db).get_active_periodo()
         if not periodo:
             current_app.logger.warning("No hay período académico activo")
             return []
 
-        registros = self.session.query(CatedraAcademica).filter_by(
-            profesor_id=profesor_id,
-            catedra=catedra,
-            periodo_id=periodo.id
+        return self.session.query(Usuario).join(
+            Inscripcion, Inscripcion.estudiante_id == Usuario.id
+        ).join(
+            CatedraAcademica, CatedraAcademica.id == Inscripcion.catedra_academica_id
+        ).filter(
+            CatedraAcademica.profesor_id == profesor_id,
+            CatedraAcademica.catedra == catedra,
+            CatedraAcademica.periodo_id == periodo.id,
+            Inscripcion.estado == EstadoInscripcion.ACTIVO,
+            Usuario.role == Role.STUDENT.value
         ).all()
 
-        estudiantes = []
-        for ca in registros:
-            inscripciones = ca.inscripciones.filter_by(estado="activo").all()
-            estudiantes.extend([
-                i.student for i in inscripciones if i.student and i.student.is_student()
-            ])
-
-        return estudiantes
-
+    def get_roster_by_catedra_academica(self, catedra_academica_id: int) -> List[dict]:
+        """Devuelve los estudiantes activos de una cátedra académica con su calificación.
+
+        Une Inscripcion, Usuario y Calificacion en una sola consulta, por lo que
+        el costo no depende del número de estudiantes del grupo.
+        """
+        filas = self.session.query(
+            Usuario.id,
+            Usuario.primer_nombre,
+            Usuario.primer_apellido,
+            Calificacion.id.label("calificacion_id"),
+            Calificacion.calificacion,
+            Calificacion.observaciones
+        ).join(
+            Inscripcion, Inscripcion.estudiante_id == Usuario.id
+        ).outerjoin(
+            Calificacion, and_(
+                Calificacion.estudiante_id == Usuario.id,
+                Calificacion.catedra_academica_id == Inscripcion.catedra_academica_id
+            )
+        ).filter(
+            Inscripcion.catedra_academica_id == catedra_academica_id,
+            Inscripcion.estado == EstadoInscripcion.ACTIVO,
+            Usuario.role == Role.STUDENT.value
+        ).order_by(Usuario.primer_apellido, Usuario.primer_nombre).all()
+
+        return [{
+            "id": fila.id,
+            "nombre": f"{fila.primer_nombre} {fila.primer_apellido}",
+            "calificacion_id": fila.calificacion_id,
+            "calificacion": fila.calificacion.value if fila.calificacion else "Sin registrar",
+            "observaciones": fila.observaciones or ""
+        } for fila in filas]
+
+    @cached(ProfesorCatedra)
     def get_all_catedras(self) -> List[ProfesorCatedraResponse]:
         registros = self.session.query(ProfesorCatedra).all()
         return self._bulk_to_response(registros, ProfesorCatedraResponse)
\ No newline at end of file
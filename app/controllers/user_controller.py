@@ -1,12 +1,23 @@
-from typing import Optional, List, Union
+import csv
+import json
+import base64
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Dict, Iterable, Iterator, Optional, List, Tuple, Union
 from flask import current_app
-from werkzeug.security import generate_password_hash
+from sqlalchemy import and_, or_, func, insert
+from pydantic import ValidationError
 
-from app.schemas import UserCreate, UserUpdate, UserResponse
-from app.database.models import Usuario
+from app.schemas import (
+    UserCreate, UserUpdate, UserResponse, UserPage, UserListItem, UserListPage, UserOption,
+    UserImportReport, ProfesorCatedraResponse
+)
+from app.schemas.users import UserImportError
+from app.database.models import Usuario, ProfesorCatedra
 from app.database.enums import Role, Permission
 from app.errors import NotFoundError, InvalidRoleError, PermissionDeniedError
-from app.controllers.db_controller import DatabaseController
+from app.controllers.db_controller import DatabaseController, usa_primaria
+from app.security import get_password_policy, marcar_usuario_modificado, invalidar_usuario
 
 class UserController(DatabaseController):
     def __init__(self, db, current_user=None):
@@ -56,11 +67,12 @@ class UserController(DatabaseController):
         Raises:
         PermissionDeniedError -- If there is already a user with the same email
         """
-        if self.session.query(Usuario).filter_by(email=data.email).first():
+        # Mismo criterio que la importación: el correo no distingue mayúsculas
+        if self.session.query(Usuario.id).filter(func.lower(Usuario.email) == data.email.lower()).first():
             raise PermissionDeniedError("Ya existe un usuario con ese correo.")
 
         role = self._validate_role(data.role)
-        hashed_pwd = generate_password_hash(data.password_hash)
+        hashed_pwd = get_password_policy().hash(data.password_hash)
 
         user = Usuario(
             email=data.email,
@@ -84,7 +96,9 @@ class UserController(DatabaseController):
         for field, value in data.model_dump(exclude_unset=True).items():
             setattr(user, field, value)
 
+        marcar_usuario_modificado(self.session)
         self._commit_or_rollback()
+        invalidar_usuario(user_id)
         return self._to_response(user, UserResponse)
 
     def list_users(self, role: Optional[str] = None) -> List[UserResponse]:
@@ -93,13 +107,15 @@ class UserController(DatabaseController):
         query = self.session.query(Usuario)
         if role:
             query = query.filter_by(role=role)
-        return self._bulk_to_response(query.all(), UserResponse)
+        return self._bulk_to_response(query.all(), UserResponse, trusted=True)
 
     def disable_user(self, user_id: int) -> UserResponse:
         """Desactiva un usuario por su ID."""
         user = self._get_or_fail(Usuario, user_id)
         user.activo = False
+        marcar_usuario_modificado(self.session)
         self._commit_or_rollback()
+        invalidar_usuario(user_id)
         return self._to_response(user, UserResponse)
 
     # Métodos misceláneos
@@ -126,30 +142,207 @@ class UserController(DatabaseController):
         user = self.session.get(Usuario, user_id)
         return self._to_response(user, UserResponse)
 
-    def get_users_by_role(self, role: Union[str, Role], only_active: bool = True) -> List[UserResponse]:
-        """Obtiene todos los usuarios por rol."""
-        self._check_permission(Permission.VIEW_USERS)
+    def _query_by_role(self, role: Union[str, Role, None], only_active: bool, *columns):
+        """Construye la consulta base de usuarios filtrada por rol y estado.
 
-        query = self.session.query(Usuario)
+        Si se indican columnas, la consulta solo selecciona esas columnas
+        (filas ligeras, sin entidades en el identity map).
+        """
+        query = self.session.query(*columns) if columns else self.session.query(Usuario)
 
         if isinstance(role, Role):
-            query = query.filter_by(role=role.value)
+            query = query.filter(Usuario.role == role.value)
         elif isinstance(role, str):
             if role != "all":
                 if role not in Role.to_list():
                     raise InvalidRoleError(role, Role.to_list())
-                query = query.filter_by(role=role)
+                query = query.filter(Usuario.role == role)
             # Si es "all", no se filtra el rol
 
         if only_active:
-            query = query.filter_by(activo=True)
+            query = query.filter(Usuario.activo.is_(True))
+
+        return query
+
+    def get_users_by_role(self, role: Union[str, Role], only_active: bool = True) -> List[UserResponse]:
+        """Obtiene todos los usuarios por rol."""
+        self._check_permission(Permission.VIEW_USERS)
+        query = self._query_by_role(role, only_active)
+        return self._bulk_to_response(query.all(), UserResponse, trusted=True)
+
+    # Paginación por clave (keyset) ordenada por (primer_apellido, id)
+    @staticmethod
+    def _encode_cursor(user, direction: str) -> str:
+        """Codifica la posición de un usuario en un cursor opaco."""
+        raw = json.dumps([user.primer_apellido, user.id, direction]).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, int, str]:
+        """Decodifica un cursor opaco.
+
+        Raises:
+        ValueError -- Si el cursor está malformado
+        """
+        try:
+            apellido, user_id, direction = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except Exception:
+            raise ValueError("Cursor de paginación inválido.")
+        if direction not in ("next", "prev") or not isinstance(user_id, int):
+            raise ValueError("Cursor de paginación inválido.")
+        return apellido, user_id, direction
+
+    def _seek(self, query, apellido: str, user_id: int, direction: str):
+        """Aplica la condición y el orden de búsqueda por clave en la dirección indicada."""
+        if direction == "prev":
+            return query.filter(or_(
+                Usuario.primer_apellido < apellido,
+                and_(Usuario.primer_apellido == apellido, Usuario.id < user_id)
+            )).order_by(Usuario.primer_apellido.desc(), Usuario.id.desc())
+
+        return query.filter(or_(
+            Usuario.primer_apellido > apellido,
+            and_(Usuario.primer_apellido == apellido, Usuario.id > user_id)
+        )).order_by(Usuario.primer_apellido, Usuario.id)
 
-        return self._bulk_to_response(query.all(), UserResponse)
+    def get_users_page(
+        self,
+        role: Union[str, Role] = "all",
+        only_active: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> UserPage:
+        """Obtiene una página de usuarios mediante paginación por clave.
+
+        Keyword arguments:
+        argument: role -- Rol a filtrar, o "all" para todos
+        argument: only_active -- Si solo se incluyen usuarios activos
+        argument: limit -- Tamaño máximo de la página
+        argument: cursor -- Cursor opaco devuelto por una página anterior
+        Return: UserPage -- Usuarios de la página y cursores de navegación
+        Raises:
+        ValueError -- Si el cursor es inválido
+        """
+        self._check_permission(Permission.VIEW_USERS)
+        users, next_cursor, prev_cursor = self._paginate(self._query_by_role(role, only_active), limit, cursor)
+        return UserPage(
+            items=self._bulk_to_response(users, UserResponse, trusted=True),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor
+        )
+
+    # Columnas que muestra el listado de usuarios
+    LIST_COLUMNS = (
+        Usuario.id, Usuario.email, Usuario.primer_nombre, Usuario.primer_apellido,
+        Usuario.role, Usuario.activo, Usuario.fecha_creacion
+    )
+
+    def get_user_list_page(
+        self,
+        role: Union[str, Role] = "all",
+        only_active: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> UserListPage:
+        """Igual que get_users_page, pero seleccionando solo las columnas del listado."""
+        self._check_permission(Permission.VIEW_USERS)
+        query = self._query_by_role(role, only_active, *self.LIST_COLUMNS)
+        rows, next_cursor, prev_cursor = self._paginate(query, limit, cursor)
+        return UserListPage(
+            items=self._bulk_to_response(rows, UserListItem, trusted=True),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor
+        )
+
+    def _paginate(self, query, limit: int, cursor: Optional[str]) -> Tuple[list, Optional[str], Optional[str]]:
+        """Aplica el cursor a la consulta y devuelve (filas, cursor siguiente, cursor anterior).
+
+        Las filas pueden ser entidades o tuplas con `primer_apellido` e `id`.
+        """
+        if cursor:
+            apellido, user_id, direction = self._decode_cursor(cursor)
+            query = self._seek(query, apellido, user_id, direction)
+        else:
+            direction = "next"
+            query = query.order_by(Usuario.primer_apellido, Usuario.id)
+
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if direction == "prev":
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None
+
+        return (
+            rows,
+            self._encode_cursor(rows[-1], "next") if rows and has_next else None,
+            self._encode_cursor(rows[0], "prev") if rows and has_prev else None
+        )
+
+    def get_teacher_options(self, only_active: bool = True) -> List[UserOption]:
+        """Profesores para listas desplegables: solo id y nombres, ordenados por apellido."""
+        self._check_permission(Permission.VIEW_USERS)
+        query = self._query_by_role(
+            Role.TEACHER, only_active, Usuario.id, Usuario.primer_nombre, Usuario.primer_apellido
+        ).order_by(Usuario.primer_apellido, Usuario.primer_nombre)
+        return self._bulk_to_response(query.all(), UserOption, trusted=True)
+
+    def iter_users(
+        self,
+        role: Union[str, Role] = "all",
+        only_active: bool = False,
+        batch_size: int = 500
+    ) -> Iterator[UserResponse]:
+        """Itera sobre todos los usuarios por lotes, sin cargarlos todos en memoria."""
+        self._check_permission(Permission.VIEW_USERS)
+        base = self._query_by_role(role, only_active)
+        query = base.order_by(Usuario.primer_apellido, Usuario.id)
+
+        while True:
+            users = query.limit(batch_size).all()
+            if not users:
+                return
+            yield from self._bulk_to_response(users, UserResponse, trusted=True)
+            if len(users) < batch_size:
+                return
+            last = users[-1]
+            query = self._seek(base, last.primer_apellido, last.id, "next")
 
     def get_all_teachers(self, only_active: bool = True) -> List[UserResponse]:
         """Obtiene todos los profesores."""
         return self.get_users_by_role(Role.TEACHER.value, only_active)
 
+    def get_teachers_roster(self, only_active: bool = True) -> List[dict]:
+        """Obtiene los profesores junto a sus cátedras asignadas en una sola consulta.
+
+        Devuelve una lista de dicts con las claves "obj" (UserResponse) y
+        "catedras" (lista de ProfesorCatedraResponse), lista para renderizar.
+        """
+        self._check_permission(Permission.VIEW_USERS)
+
+        query = self.session.query(Usuario, ProfesorCatedra).outerjoin(
+            ProfesorCatedra, ProfesorCatedra.profesor_id == Usuario.id
+        ).filter(Usuario.role == Role.TEACHER.value)
+
+        if only_active:
+            query = query.filter(Usuario.activo.is_(True))
+
+        roster = {}
+        for profesor, asignacion in query.order_by(Usuario.id, ProfesorCatedra.id).all():
+            item = roster.get(profesor.id)
+            if item is None:
+                item = roster[profesor.id] = {
+                    "obj": self._to_response(profesor, UserResponse),
+                    "catedras": []
+                }
+            if asignacion is not None:
+                item["catedras"].append(self._to_response(asignacion, ProfesorCatedraResponse))
+
+        return list(roster.values())
+
     def get_all_students(self, only_active: bool = True) -> List[UserResponse]:
         """Obtiene todos los estudiantes."""
         return self.get_users_by_role(Role.STUDENT.value, only_active)
@@ -158,13 +351,152 @@ class UserController(DatabaseController):
         """Obtiene todos los administradores."""
         return self.get_users_by_role(Role.ADMIN.value, only_active)
 
+    def get_user_ids_by_email(self, emails: Iterable[str], role: Optional[Role] = None) -> Dict[str, int]:
+        """Resuelve varios correos a IDs de usuario en una sola consulta.
+
+        La comparación no distingue mayúsculas: las claves del resultado son
+        los correos en minúsculas.
+        """
+        self._check_permission(Permission.VIEW_USERS)
+        emails = {email.strip().lower() for email in emails}
+        if not emails:
+            return {}
+
+        query = self.session.query(Usuario.email, Usuario.id).filter(func.lower(Usuario.email).in_(emails))
+        if role is not None:
+            query = query.filter_by(role=role.value)
+        return {email.lower(): user_id for email, user_id in query.all()}
+
+    @usa_primaria
     def get_user_model_by_email(self, email: str) -> Optional[Usuario]:
         """Obtiene un modelo de usuario por su correo electrónico."""
         return self.session.query(Usuario).filter_by(email=email).first()
 
+    def authenticate(self, email: str, password: str) -> Optional[Usuario]:
+        """Verifica las credenciales de un usuario.
+
+        Si la contraseña es correcta pero su hash usa parámetros distintos a la
+        política actual, se vuelve a hashear de forma transparente.
+        Return: Optional[Usuario] -- El usuario autenticado, o None si las credenciales no son válidas
+        """
+        user = self.get_user_model_by_email(email)
+        if user is None:
+            return None
+
+        valida, nuevo_hash = get_password_policy().verify_and_update(user.password_hash, password)
+        if not valida:
+            return None
+
+        if nuevo_hash:
+            user.password_hash = nuevo_hash
+            self._commit_or_rollback()
+        return user
+
     def update_user_password(self, user_id: int, new_password: str) -> bool:
         """Actualiza la contraseña de un usuario."""
         user = self._get_or_fail(Usuario, user_id)
-        user.password_hash = generate_password_hash(new_password)
+        user.password_hash = get_password_policy().hash(new_password)
+        marcar_usuario_modificado(self.session)
         self._commit_or_rollback()
-        return True
\ No newline at end of file
+        invalidar_usuario(user_id)
+        return True
+
+    # Importación masiva
+    IMPORT_ROLES = (Role.STUDENT.value, Role.TEACHER.value)
+
+    def importar_usuarios_csv(
+        self,
+        stream: IO[str],
+        role: Union[str, Role] = Role.STUDENT,
+        chunk_size: int = 500,
+        workers: Optional[int] = None,
+        dry_run: bool = False
+    ) -> UserImportReport:
+        """Importa estudiantes y profesores desde un CSV leyéndolo por bloques.
+
+        Cada bloque se valida contra UserCreate, se depura de correos repetidos
+        (en el archivo y en la db, con una consulta por bloque), se hashea en un
+        pool de procesos y se inserta con un INSERT masivo.
+
+        Keyword arguments:
+        argument: stream -- Archivo CSV con encabezados (email, password, primer_nombre, primer_apellido, sexo, ...)
+        argument: role -- Rol por defecto si el CSV no trae la columna "role"
+        argument: chunk_size -- Filas por bloque
+        argument: workers -- Procesos para hashear contraseñas (None = núcleos disponibles)
+        argument: dry_run -- Si es True solo valida y reporta, sin escribir
+        Return: UserImportReport -- Resumen de filas creadas, duplicadas e inválidas
+        """
+        rol_defecto = self._validate_role(role)
+        policy = get_password_policy()
+        reporte = UserImportReport(dry_run=dry_run)
+        vistos = set()
+
+        filas = enumerate(csv.DictReader(stream), start=2)  # la fila 1 es el encabezado
+        pool = ProcessPoolExecutor(max_workers=workers) if not dry_run and workers != 1 else None
+        try:
+            while True:
+                bloque = list(islice(filas, chunk_size))
+                if not bloque:
+                    break
+                reporte.total += len(bloque)
+
+                validos = []
+                for numero, fila in bloque:
+                    datos = {k.strip(): (v.strip() or None) for k, v in fila.items() if k and v is not None}
+                    datos["role"] = datos.get("role") or rol_defecto
+                    datos["password_hash"] = datos.pop("password", None)
+                    try:
+                        usuario = UserCreate(**datos)
+                    except ValidationError as e:
+                        error = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                        reporte.invalidos.append(UserImportError(fila=numero, email=datos.get("email"), error=error))
+                        continue
+                    if usuario.role.value not in self.IMPORT_ROLES:
+                        reporte.invalidos.append(UserImportError(
+                            fila=numero, email=usuario.email, error=f"Rol no permitido en importación: {usuario.role.value}"
+                        ))
+                        continue
+                    email = usuario.email.lower()
+                    if email in vistos:
+                        reporte.duplicados.append(UserImportError(fila=numero, email=usuario.email, error="Repetido en el archivo"))
+                        continue
+                    vistos.add(email)
+                    validos.append((numero, usuario, email))
+
+                existentes = set(self.get_user_ids_by_email(email for _, _, email in validos)) if validos else set()
+                nuevos = []
+                for numero, usuario, email in validos:
+                    if email in existentes:
+                        reporte.duplicados.append(UserImportError(fila=numero, email=usuario.email, error="Ya existe en el sistema"))
+                    else:
+                        nuevos.append(usuario)
+
+                if dry_run:
+                    reporte.creados += len(nuevos)
+                    continue
+                if not nuevos:
+                    continue
+
+                passwords = [u.password_hash for u in nuevos]
+                if pool:
+                    hashes = list(pool.map(policy.hash, passwords, chunksize=16))
+                else:
+                    hashes = [policy.hash(p) for p in passwords]
+
+                self.session.execute(insert(Usuario), [
+                    {
+                        **u.model_dump(exclude={"password_hash", "role"}),
+                        "password_hash": password_hash,
+                        "role": u.role.value
+                    }
+                    for u, password_hash in zip(nuevos, hashes)
+                ])
+                if self._commit_or_rollback() is not True:
+                    raise PermissionDeniedError(f"No se pudo insertar el bloque que termina en la fila {bloque[-1][0]}")
+                reporte.creados += len(nuevos)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        return reporte
+
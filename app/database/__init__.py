@@ -1,3 +1,5 @@
 from app.database.db_config import db, init_db
-from app.database.models import Usuario, ProfesorCatedra, Calificacion, Inscripcion, CatedraAcademica, PeriodoAcademico
-from app.database.enums import Role, Permission, ROLE_HIERARCHY, ROLE_PERMISSIONS
\ No newline at end of file
+from app.database.models import Usuario, ProfesorCatedra, Calificacion, Inscripcion, CatedraAcademica, PeriodoAcademico, VersionCache, CorreoSaliente
+from app.database.enums import Role, Permission, ROLE_HIERARCHY, ROLE_PERMISSIONS
+from app.database.advisory_lock import advisory_lock
+from app.database.replica import BIND_REPLICA, alcance_bind, leer_de_primaria, copiar_a_replica
@@ -0,0 +1,89 @@
+"""
+Bloqueo consultivo (advisory lock) entre procesos sobre la base de datos.
+
+Se usa para que varios workers o comandos de la CLI no ejecuten a la vez
+tareas de arranque como crear tablas, el super admin o el seed.
+
+- PostgreSQL: pg_advisory_lock sobre una conexión dedicada.
+- MySQL/MariaDB: GET_LOCK / RELEASE_LOCK.
+- SQLite: flock sobre un archivo `<base>.<nombre>.lock` junto a la base
+  (las bases en memoria no se comparten entre procesos y no lo necesitan).
+"""
+import os
+import zlib
+from contextlib import contextmanager
+
+from flask import current_app
+from sqlalchemy import text
+
+
+def _clave(nombre: str) -> int:
+    """Clave entera estable para pg_advisory_lock (bigint con signo)."""
+    return zlib.crc32(nombre.encode("utf-8")) - 2 ** 31
+
+
+@contextmanager
+def _lock_postgresql(engine, nombre):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:clave)"), {"clave": _clave(nombre)})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:clave)"), {"clave": _clave(nombre)})
+
+
+@contextmanager
+def _lock_mysql(engine, nombre, timeout):
+    with engine.connect() as conn:
+        obtenido = conn.execute(text("SELECT GET_LOCK(:nombre, :timeout)"),
+                                {"nombre": nombre, "timeout": timeout}).scalar()
+        if obtenido != 1:
+            raise TimeoutError(f"No se obtuvo el bloqueo '{nombre}' en {timeout} s")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:nombre)"), {"nombre": nombre})
+
+
+@contextmanager
+def _lock_archivo(ruta):
+    try:
+        import fcntl
+    except ImportError:  # Windows: sin flock, se continúa sin bloqueo
+        current_app.logger.warning(f"Bloqueo por archivo no disponible en esta plataforma: {ruta}")
+        yield
+        return
+
+    with open(ruta, "a") as archivo:
+        fcntl.flock(archivo, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(archivo, fcntl.LOCK_UN)
+
+
+@contextmanager
+def advisory_lock(engine, nombre: str, timeout: int = 300):
+    """Mantiene un bloqueo exclusivo `nombre` mientras dura el bloque `with`."""
+    dialecto = engine.dialect.name
+    if dialecto == "postgresql":
+        contexto = _lock_postgresql(engine, nombre)
+    elif dialecto in ("mysql", "mariadb"):
+        contexto = _lock_mysql(engine, nombre, timeout)
+    elif dialecto == "sqlite":
+        base = engine.url.database
+        if not base or base == ":memory:" or base.startswith("file::memory:"):
+            contexto = _sin_bloqueo()
+        else:
+            contexto = _lock_archivo(f"{os.path.abspath(base)}.{nombre}.lock")
+    else:
+        current_app.logger.warning(f"Sin bloqueo consultivo para el dialecto {dialecto}")
+        contexto = _sin_bloqueo()
+
+    with contexto:
+        yield
+
+
+@contextmanager
+def _sin_bloqueo():
+    yield
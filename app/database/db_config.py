@@ -1,6 +1,94 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from app.database.replica import BIND_REPLICA, SesionEnrutada
+
+db = SQLAlchemy(session_options={"class_": SesionEnrutada})
+
+# Valores aceptados por los PRAGMA configurables (el resto son enteros)
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORE = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def _opcion(valor, permitidos, nombre):
+    valor = str(valor).upper()
+    if valor not in permitidos:
+        raise ValueError(f"Valor no válido para {nombre}: {valor} (opciones: {', '.join(sorted(permitidos))})")
+    return valor
+
+
+def _es_memoria(url) -> bool:
+    return not url.database or url.database == ":memory:" or "mode=memory" in str(url)
+
+
+def sqlite_pragmas(config, en_memoria: bool = False):
+    """PRAGMA que se aplican a cada conexión SQLite nueva, según la configuración."""
+    pragmas = []
+    if not en_memoria:
+        pragmas.append(("journal_mode", _opcion(config.get("SQLITE_JOURNAL_MODE", "WAL"), _JOURNAL_MODES, "SQLITE_JOURNAL_MODE")))
+    pragmas += [
+        ("synchronous", _opcion(config.get("SQLITE_SYNCHRONOUS", "NORMAL"), _SYNCHRONOUS, "SQLITE_SYNCHRONOUS")),
+        ("busy_timeout", int(config.get("SQLITE_BUSY_TIMEOUT_MS", 5000))),
+        ("cache_size", int(config.get("SQLITE_CACHE_SIZE", -20000))),
+        ("mmap_size", int(config.get("SQLITE_MMAP_SIZE", 268435456))),
+        ("temp_store", _opcion(config.get("SQLITE_TEMP_STORE", "MEMORY"), _TEMP_STORE, "SQLITE_TEMP_STORE")),
+    ]
+    return pragmas
+
+
+def sqlite_engine_options(config):
+    """Opciones del engine para SQLite con varios hilos/procesos escribiendo."""
+    return {
+        # Tiempo que el driver espera un bloqueo antes de fallar con "database is locked"
+        "connect_args": {"timeout": int(config.get("SQLITE_BUSY_TIMEOUT_MS", 5000)) / 1000},
+        "pool_size": int(config.get("SQLITE_POOL_SIZE", 10)),
+        "max_overflow": int(config.get("SQLITE_MAX_OVERFLOW", 10)),
+    }
+
+
+def _instalar_pragmas(engine, pragmas) -> None:
+    @event.listens_for(engine, "connect")
+    def _configurar_sqlite(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for nombre, valor in pragmas:
+                cursor.execute(f"PRAGMA {nombre}={valor}")
+        finally:
+            cursor.close()
 
-db = SQLAlchemy()
 
 def init_db(app):
-    db.init_app(app)
\ No newline at end of file
+    """
+    Inicializa SQLAlchemy. Con SQLite y SQLITE_TUNING activo agrega el perfil
+    de SQLALCHEMY_ENGINE_OPTIONS y un hook de conexión que aplica los PRAGMA
+    (WAL, synchronous, busy_timeout, cache_size, mmap_size, temp_store).
+    Las opciones definidas explícitamente en la configuración tienen prioridad.
+    Si SQLALCHEMY_REPLICA_URI está definida se registra como el bind de lectura
+    "replica" (en SQLite, con PRAGMA query_only).
+    """
+    replica_uri = app.config.get("SQLALCHEMY_REPLICA_URI")
+    if replica_uri:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds.setdefault(BIND_REPLICA, replica_uri)
+        app.config["SQLALCHEMY_BINDS"] = binds
+
+    url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    ajustar = url.get_backend_name() == "sqlite" and app.config.get("SQLITE_TUNING", True)
+    if ajustar and not _es_memoria(url):
+        opciones = sqlite_engine_options(app.config)
+        opciones.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opciones
+
+    db.init_app(app)
+
+    if ajustar:
+        with app.app_context():
+            for clave, engine in db.engines.items():
+                if engine.dialect.name != "sqlite":
+                    continue
+                pragmas = sqlite_pragmas(app.config, en_memoria=_es_memoria(engine.url))
+                if clave == BIND_REPLICA:
+                    pragmas.append(("query_only", "ON"))
+                _instalar_pragmas(engine, pragmas)
@@ -1,8 +1,19 @@
-from app.database.enums.permissions_system import ROLE_HIERARCHY, ROLE_PERMISSIONS, user_has_permission
+from app.database.enums.permissions_system import (
+    ROLE_HIERARCHY,
+    ROLE_PERMISSIONS,
+    ROLE_PERMISSION_MASKS,
+    user_has_permission,
+    permission_mask,
+    role_mask,
+    has_permission,
+    has_all,
+    has_any
+)
 from app.database.enums.inscripcion_status_enum import EstadoInscripcion
 from app.database.enums.calificacion_enum import Calificacion
 from app.database.enums.permissions_enum import Permission
 from app.database.enums.catedras_enum import Catedra
 from app.database.enums.estatus_enums import Estatus
 from app.database.enums.sexos_enum import Sexo
-from app.database.enums.roles_enum import Role
\ No newline at end of file
+from app.database.enums.roles_enum import Role
+from app.database.enums.correo_enum import EstadoCorreo
\ No newline at end of file
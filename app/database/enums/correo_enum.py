@@ -0,0 +1,20 @@
+from typing import List, Tuple
+from enum import Enum
+
+class EstadoCorreo(str, Enum):
+    """Enum para los estados de un correo en la bandeja de salida"""
+
+    PENDIENTE = "pendiente"
+    ENVIANDO = "enviando"
+    ENVIADO = "enviado"
+    FALLIDO = "fallido"  # agotó los reintentos (dead letter)
+
+    def __repr__(self):
+        return f"{self.value}"
+
+    def __str__(self) -> str:
+        return f"{self.value}"
+
+    @classmethod
+    def choices(cls) -> List[Tuple[str, bool]]:
+        return [(e.value, e.name.replace("_", " ").title()) for e in cls]
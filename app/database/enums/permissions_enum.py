@@ -33,4 +33,9 @@ class Permission(Enum):
     
     # Permisos administrativos
     MANAGE_ACADEMIC_PERIODS = auto()
-    GENERATE_REPORTS = auto()
\ No newline at end of file
+    GENERATE_REPORTS = auto()
+
+    @property
+    def mask(self) -> int:
+        """Bit que representa este permiso dentro de una máscara de permisos."""
+        return 1 << (self.value - 1)
@@ -1,4 +1,4 @@
-from typing import Set, Dict
+from typing import Set, Dict, Union
 
 from app.database.enums.roles_enum import Role
 from app.database.enums.permissions_enum import Permission
@@ -56,6 +56,50 @@ ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
     }
 }
 
+def _compilar_mascaras() -> Dict[Role, int]:
+    """
+    Aplana ROLE_PERMISSIONS y ROLE_HIERARCHY en una máscara de bits por rol.
+
+    Cada rol hereda los permisos de los roles de menor privilegio (nivel mayor
+    o igual en la jerarquía).
+    """
+    mascaras = {}
+    for role, level in ROLE_HIERARCHY.items():
+        mascara = 0
+        for otro, otro_level in ROLE_HIERARCHY.items():
+            if otro_level >= level:
+                for perm in ROLE_PERMISSIONS.get(otro, set()):
+                    mascara |= perm.mask
+        mascaras[role] = mascara
+    return mascaras
+
+# Máscara de permisos efectiva por rol, calculada una sola vez al importar
+ROLE_PERMISSION_MASKS: Dict[Role, int] = _compilar_mascaras()
+
+def permission_mask(*permissions: Permission) -> int:
+    """Combina varios permisos en una sola máscara."""
+    mascara = 0
+    for perm in permissions:
+        mascara |= perm.mask
+    return mascara
+
+def role_mask(role: Union[Role, str, None]) -> int:
+    """Devuelve la máscara de permisos de un rol (0 si el rol no existe)."""
+    return ROLE_PERMISSION_MASKS.get(role, 0)
+
+def has_permission(mask: int, permission: Permission) -> bool:
+    """Verifica un permiso contra una máscara en O(1)."""
+    return bool(mask & permission.mask)
+
+def has_all(mask: int, *permissions: Permission) -> bool:
+    """Verifica que la máscara contenga todos los permisos indicados."""
+    requerida = permission_mask(*permissions)
+    return mask & requerida == requerida
+
+def has_any(mask: int, *permissions: Permission) -> bool:
+    """Verifica que la máscara contenga al menos uno de los permisos indicados."""
+    return bool(mask & permission_mask(*permissions))
+
 def user_has_permission(user_role: Role, required_permission: Permission) -> bool:
     """
     Verifica si un rol de usuario tiene un permiso específico,
@@ -74,14 +118,4 @@ def user_has_permission(user_role: Role, required_permission: Permission) -> boo
         >>> user_has_permission(Role.STUDENT, Permission.EDIT_GRADES)
         False
     """
-    # Verificar si el rol tiene directamente el permiso
-    if required_permission in ROLE_PERMISSIONS.get(user_role, set()):
-        return True
-    
-    # Verificar si algún rol superior tiene el permiso
-    user_level = ROLE_HIERARCHY.get(user_role, float('inf'))
-    for role, level in ROLE_HIERARCHY.items():
-        if level < user_level and required_permission in ROLE_PERMISSIONS.get(role, set()):
-            return True
-    
-    return False
\ No newline at end of file
+    return has_permission(role_mask(user_role), required_permission)
@@ -3,4 +3,6 @@ from app.database.models.profesor_catedra_model import ProfesorCatedra
 from app.database.models.calificaciones_model import Calificacion
 from app.database.models.inscripciones_model import Inscripcion
 from app.database.models.periodo_academico_model import PeriodoAcademico
-from app.database.models.catedra_periodo_model import CatedraAcademica
\ No newline at end of file
+from app.database.models.catedra_periodo_model import CatedraAcademica
+from app.database.models.cache_version_model import VersionCache
+from app.database.models.correo_saliente_model import CorreoSaliente
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import update, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from app.database.db_config import db
+
+class VersionCache(db.Model):
+    """
+    Contador de versión por clave, usado como señal de invalidación entre
+    procesos: quien modifica los datos incrementa la versión en la misma
+    transacción y los demás procesos comparan la versión con la que cachearon.
+    """
+    __tablename__ = 'version_cache'
+
+    clave = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    actualizado = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f'<VersionCache {self.clave}={self.version}>'
+
+    @classmethod
+    def leer(cls, session, clave: str) -> int:
+        """Devuelve la versión actual de la clave (0 si nunca se incrementó)."""
+        version = session.execute(select(cls.version).where(cls.clave == clave)).scalar()
+        return version or 0
+
+    @classmethod
+    def incrementar(cls, session, clave: str) -> None:
+        """Incrementa la versión de la clave dentro de la transacción en curso.
+
+        Se usa un upsert del dialecto para que dos transacciones que crean la
+        misma clave a la vez no choquen con la clave primaria.
+        """
+        ahora = datetime.utcnow()
+        dialecto = session.get_bind(mapper=cls).dialect.name
+        if dialecto in ("sqlite", "postgresql"):
+            insertar = (sqlite if dialecto == "sqlite" else postgresql).insert
+            session.execute(
+                insertar(cls).values(clave=clave, version=1, actualizado=ahora).on_conflict_do_update(
+                    index_elements=[cls.clave], set_={"version": cls.version + 1, "actualizado": ahora}
+                )
+            )
+            return
+        if dialecto in ("mysql", "mariadb"):
+            session.execute(
+                mysql.insert(cls).values(clave=clave, version=1, actualizado=ahora)
+                .on_duplicate_key_update(version=cls.version + 1, actualizado=ahora)
+            )
+            return
+
+        resultado = session.execute(
+            update(cls).where(cls.clave == clave).values(version=cls.version + 1, actualizado=ahora)
+        )
+        if resultado.rowcount == 0:
+            session.add(cls(clave=clave, version=1, actualizado=ahora))
+
+    @classmethod
+    def leer_varias(cls, session, claves: Iterable[str]) -> List[Tuple[str, int, datetime]]:
+        """Devuelve (clave, versión, actualizado) de las claves existentes, en una sola consulta."""
+        return session.execute(
+            select(cls.clave, cls.version, cls.actualizado).where(cls.clave.in_(list(claves)))
+        ).all()
+
+    def to_dict(self) -> Dict:
+        return {
+            'clave': self.clave,
+            'version': self.version,
+            'actualizado': self.actualizado
+        }
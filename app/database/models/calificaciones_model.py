@@ -7,6 +7,9 @@ class Calificacion(db.Model):
     """Modelo para las calificaciones de los alumnos"""
     
     __tablename__ = 'calificacion'
+    __table_args__ = (
+        db.Index('uq_calificacion_estudiante_catedra', 'estudiante_id', 'catedra_academica_id', unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     estudiante_id = db.Column(db.Integer, db.ForeignKey("usuarios.id"))
@@ -6,6 +6,10 @@ class CatedraAcademica(db.Model):
     """Modelo para las cátedras por período académico"""
 
     __tablename__ = 'catedra_academica'
+    __table_args__ = (
+        db.Index('ix_catedra_academica_periodo_profesor_catedra', 'periodo_id', 'profesor_id', 'catedra'),
+        db.Index('uq_catedra_academica_periodo_catedra_grupo', 'periodo_id', 'catedra', 'grupo', unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     profesor_id = db.Column(db.Integer, db.ForeignKey("usuarios.id"))
@@ -14,6 +18,7 @@ class CatedraAcademica(db.Model):
     periodo_id = db.Column(db.Integer, db.ForeignKey("periodo_academico.id"))
     grupo = db.Column(db.String(10))  # Ejemplo: "A", "B", etc.
     cupos = db.Column(db.Integer, default=20)
+    inscritos = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Inscripciones activas
 
     # Relaciones
     profesor = db.relationship('Usuario', back_populates='catedras_academicas')
@@ -31,5 +36,6 @@ class CatedraAcademica(db.Model):
             'catedra': self.catedra,
             'periodo_id': self.periodo_id,
             'grupo': self.grupo,
-            'cupos': self.cupos
+            'cupos': self.cupos,
+            'inscritos': self.inscritos
         }
\ No newline at end of file
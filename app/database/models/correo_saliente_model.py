@@ -0,0 +1,44 @@
+from typing import Dict
+from datetime import datetime
+from app.database.db_config import db
+from app.database.enums import EstadoCorreo
+
+class CorreoSaliente(db.Model):
+    """
+    Bandeja de salida de correos. Las vistas solo insertan filas; un worker
+    las envía por SMTP, reintenta con espera creciente y marca como FALLIDO
+    el correo que agota los intentos.
+    """
+    __tablename__ = 'correo_saliente'
+    __table_args__ = (
+        db.Index('ix_correo_saliente_estado_proximo', 'estado', 'proximo_intento'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    asunto = db.Column(db.String(255), nullable=False)
+    destinatarios = db.Column(db.JSON, nullable=False)
+    remitente = db.Column(db.String(255))
+    html = db.Column(db.Text, nullable=False)
+    estado = db.Column(db.Enum(EstadoCorreo), nullable=False, default=EstadoCorreo.PENDIENTE)
+    intentos = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    proximo_intento = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    bloqueado_hasta = db.Column(db.DateTime)  # vencimiento del reclamo de un worker
+    ultimo_error = db.Column(db.Text)
+    fecha_creacion = db.Column(db.DateTime, default=datetime.utcnow)
+    fecha_envio = db.Column(db.DateTime)
+
+    def __repr__(self) -> str:
+        return f'<CorreoSaliente {self.id} {self.estado} intentos={self.intentos}>'
+
+    def to_dict(self) -> Dict[str, any]:
+        return {
+            'id': self.id,
+            'asunto': self.asunto,
+            'destinatarios': self.destinatarios,
+            'estado': self.estado,
+            'intentos': self.intentos,
+            'proximo_intento': self.proximo_intento,
+            'ultimo_error': self.ultimo_error,
+            'fecha_creacion': self.fecha_creacion,
+            'fecha_envio': self.fecha_envio
+        }
@@ -7,6 +7,18 @@ class Inscripcion(db.Model):
     """Modelo para las inscripciones de los alumnos"""
     
     __tablename__ = 'inscripcion'
+    __table_args__ = (
+        db.Index('ix_inscripcion_catedra_estado', 'catedra_academica_id', 'estado'),
+        db.Index('ix_inscripcion_estudiante', 'estudiante_id'),
+        # Un alumno solo puede tener una inscripción activa por cátedra.
+        # Índice parcial: solo se crea en motores que soportan WHERE en índices.
+        db.Index(
+            'uq_inscripcion_activa', 'estudiante_id', 'catedra_academica_id',
+            unique=True,
+            sqlite_where=db.text("estado = 'ACTIVO'"),
+            postgresql_where=db.text("estado = 'ACTIVO'")
+        ).ddl_if(dialect=('sqlite', 'postgresql')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     estudiante_id = db.Column(db.Integer, db.ForeignKey("usuarios.id"))
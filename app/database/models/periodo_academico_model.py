@@ -5,6 +5,10 @@ class PeriodoAcademico(db.Model):
     """Modelo para los períodos académicos"""
 
     __tablename__ = 'periodo_academico'
+    __table_args__ = (
+        db.Index('ix_periodo_academico_activo', 'activo'),
+        db.Index('uq_periodo_academico_nombre', 'nombre', unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     nombre = db.Column(db.String(50))  # Ejemplo: "2025-I"
@@ -5,6 +5,9 @@ from app.database.enums import Catedra
 class ProfesorCatedra(db.Model):
     """Modelo para las cátedras asignadas a un profesor"""
     __tablename__ = 'profesor_catedra'
+    __table_args__ = (
+        db.Index('uq_profesor_catedra_profesor_catedra', 'profesor_id', 'catedra', unique=True),
+    )
     id = db.Column(db.Integer, primary_key=True)
     profesor_id = db.Column(db.Integer, db.ForeignKey('usuarios.id'))
     catedra = db.Column(db.Enum(Catedra), nullable=False)
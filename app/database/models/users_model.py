@@ -3,12 +3,16 @@ from datetime import datetime
 from typing import Optional
 
 from app.database.db_config import db
-from app.database.enums import Permission, Role, Sexo, user_has_permission
+from app.database.enums import Permission, Role, Sexo, role_mask, has_permission, has_all, has_any
 
 class Usuario(db.Model, UserMixin):
     """Modelo para la tabla de usuarios en la db"""
     
     __tablename__ = 'usuarios'
+    __table_args__ = (
+        db.Index('ix_usuarios_role_activo', 'role', 'activo'),
+        db.Index('ix_usuarios_apellido_id', 'primer_apellido', 'id'),
+    )
     
     # Información de la cuenta
     id = db.Column(db.Integer, primary_key=True)
@@ -81,6 +85,11 @@ class Usuario(db.Model, UserMixin):
         except ValueError:
             return None
     
+    @property
+    def permission_mask(self) -> int:
+        """Máscara de permisos precalculada del rol del usuario"""
+        return role_mask(self.role)
+
     def has_permission(self, permission: Permission) -> bool:
         """
         Verifica si el usuario tiene un permiso específico.
@@ -91,10 +100,15 @@ class Usuario(db.Model, UserMixin):
         Returns:
             bool: True si tiene el permiso, False si no
         """
-        user_role = self.get_role()
-        if user_role is None:
-            return False
-        return user_has_permission(user_role, permission)
+        return has_permission(self.permission_mask, permission)
+
+    def has_all(self, *permissions: Permission) -> bool:
+        """Verifica que el usuario tenga todos los permisos indicados"""
+        return has_all(self.permission_mask, *permissions)
+
+    def has_any(self, *permissions: Permission) -> bool:
+        """Verifica que el usuario tenga al menos uno de los permisos indicados"""
+        return has_any(self.permission_mask, *permissions)
     
     # Métodos de conveniencia para verificación de roles
     def is_super_admin(self) -> bool:
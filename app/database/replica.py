@@ -0,0 +1,136 @@
+"""
+Separación de lecturas y escrituras con una réplica de solo lectura.
+
+Si SQLALCHEMY_REPLICA_URI está definida, `init_db` la registra como el bind
+"replica". `SesionEnrutada` (la clase de `db.session`) envía a ese bind las
+consultas hechas dentro de un alcance de lectura (ver `alcance_bind`, que
+usan los controladores) y todo lo demás a la base principal.
+
+Leer lo propio ("read your writes"): en cuanto la sesión escribe (flush o
+INSERT/UPDATE/DELETE directo), el resto de la petición lee de la principal,
+también después del commit. Además, tras un commit con escrituras en una
+petición web, se guarda en la sesión de Flask una marca para que las
+peticiones siguientes del mismo usuario (p. ej. el GET tras un redirect) lean
+de la principal durante REPLICA_READ_YOUR_WRITES_SECONDS segundos.
+
+Para pruebas locales, `copiar_a_replica` copia una base SQLite principal a
+otro archivo con la API de backup en línea de SQLite (`flask replicar`).
+"""
+import time
+import sqlite3
+from contextlib import contextmanager
+
+from flask import current_app, has_request_context, session as sesion_flask
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+BIND_REPLICA = "replica"
+
+# Claves en Session.info (se descartan con la sesión al final de cada petición)
+_ALCANCE = "bind_lectura"
+_ESCRIBIO = "bind_escribio"
+_USO_REPLICA = "bind_uso_replica"
+# Clave en la sesión de Flask: leer de la principal hasta este instante (epoch)
+_PRIMARIA_HASTA = "_leer_primaria_hasta"
+
+
+class SesionEnrutada(Session):
+    """Sesión que lee de la réplica dentro de un alcance de lectura."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if clause is not None and getattr(clause, "is_dml", False):
+            self.info[_ESCRIBIO] = True
+        elif bind is None and self.info.get(_ALCANCE) and self._puede_leer_replica():
+            replica = self._db.engines.get(BIND_REPLICA)
+            if replica is not None:
+                self.info[_USO_REPLICA] = self.info.get(_USO_REPLICA, 0) + 1
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _puede_leer_replica(self) -> bool:
+        if self._flushing or self.info.get(_ESCRIBIO):
+            return False
+        if has_request_context() and sesion_flask.get(_PRIMARIA_HASTA, 0) > time.time():
+            return False
+        return True
+
+
+@event.listens_for(SesionEnrutada, "after_flush")
+def _marcar_escritura(session, _flush_context):
+    session.info[_ESCRIBIO] = True
+
+
+@event.listens_for(SesionEnrutada, "after_commit")
+def _recordar_escritura(session):
+    if not session.info.get(_ESCRIBIO) or not has_request_context():
+        return
+    if BIND_REPLICA not in session._db.engines:
+        return
+    segundos = float(current_app.config.get("REPLICA_READ_YOUR_WRITES_SECONDS", 5))
+    if segundos > 0:
+        sesion_flask[_PRIMARIA_HASTA] = time.time() + segundos
+
+
+@contextmanager
+def alcance_bind(session, lectura: bool):
+    """
+    Marca las consultas del bloque como de lectura (réplica) o de escritura
+    (principal). Solo cuenta el alcance más externo: las lecturas que hace un
+    método de escritura siguen yendo a la principal.
+    """
+    info = session.info
+    if _ALCANCE in info:
+        yield
+        return
+
+    if not lectura and info.pop(_USO_REPLICA, False) and not (session.new or session.dirty or session.deleted):
+        # Los objetos cargados de la réplica pueden estar atrasados: se recargan de la principal
+        session.expire_all()
+    info[_ALCANCE] = lectura
+    try:
+        yield
+    finally:
+        info.pop(_ALCANCE, None)
+
+
+def lecturas_en_replica(session) -> int:
+    """Cuántas consultas de la sesión fueron a la réplica desde el último alcance de escritura."""
+    return session.info.get(_USO_REPLICA, 0)
+
+
+def primaria_forzada(session) -> bool:
+    """True si hay réplica pero esta sesión debe leer de la principal (leer lo propio)."""
+    sesion = session() if callable(session) else session
+    if not isinstance(sesion, SesionEnrutada) or BIND_REPLICA not in sesion._db.engines:
+        return False
+    return not sesion._puede_leer_replica()
+
+
+def leer_de_primaria(session) -> None:
+    """Fuerza que el resto de la petición lea de la base principal."""
+    session.info[_ESCRIBIO] = True
+
+
+def _ruta_sqlite(uri: str) -> str:
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        raise ValueError(f"La copia con backup solo admite archivos SQLite: {url.render_as_string(hide_password=True)}")
+    return url.database
+
+
+def copiar_a_replica(origen_uri: str, destino_uri: str, paginas: int = 1024, pausa: float = 0.01) -> float:
+    """
+    Copia la base SQLite principal sobre la réplica con la API de backup en
+    línea: la principal sigue aceptando lecturas y escrituras mientras se
+    copia por bloques de `paginas`. Devuelve la duración en segundos.
+    """
+    inicio = time.perf_counter()
+    origen = sqlite3.connect(_ruta_sqlite(origen_uri))
+    destino = sqlite3.connect(_ruta_sqlite(destino_uri))
+    try:
+        origen.backup(destino, pages=paginas, sleep=pausa)
+    finally:
+        destino.close()
+        origen.close()
+    return time.perf_counter() - inicio
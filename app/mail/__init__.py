@@ -1,2 +1,27 @@
-from app.mail.expresarte_mailer import ExpresarteMailer
-from app.mail.token_handler import MailTokenHandler
\ No newline at end of file
+"""
+Correo de la aplicación. Los submódulos (Flask-Mail, Jinja, JWT) se importan
+al primer acceso a cada nombre, no al importar el paquete.
+"""
+import importlib
+
+from app.mail.extension import init_mailer, get_mailer
+
+_EXPORTS = {
+    "ExpresarteMailer": "app.mail.expresarte_mailer",
+    "MailTokenHandler": "app.mail.token_handler",
+    "OutboxWorker": "app.mail.outbox",
+    "encolar_correo": "app.mail.outbox",
+    "reintentar_fallidos": "app.mail.outbox",
+    "init_outbox": "app.mail.outbox",
+    "ResultadoEnvio": "app.mail.bulk",
+}
+
+__all__ = ["init_mailer", "get_mailer", *_EXPORTS]
+
+
+def __getattr__(nombre):
+    if nombre in _EXPORTS:
+        valor = getattr(importlib.import_module(_EXPORTS[nombre]), nombre)
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
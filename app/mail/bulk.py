@@ -0,0 +1,51 @@
+"""
+Utilidades para el envío masivo de correos.
+
+La plantilla se renderiza una sola vez con el contexto común; los campos
+propios de cada destinatario se dejan como marcadores y se sustituyen luego
+por simple reemplazo de texto (con escape HTML). Por eso en la plantilla esos
+campos deben imprimirse tal cual, sin filtros: `{{ nombre }}`.
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from markupsafe import escape
+
+
+@dataclass
+class ResultadoEnvio:
+    """Resultado del envío a un destinatario."""
+    email: str
+    enviado: bool
+    error: Optional[str] = None
+
+
+class PlantillaMasiva:
+    """HTML renderizado una vez, con marcadores para los campos por destinatario."""
+
+    def __init__(self, template, contexto: Dict, campos: Iterable[str]):
+        self.marcadores = {campo: f"%%destinatario:{campo}%%" for campo in campos}
+        self.html = template.render(**contexto, **self.marcadores)
+
+    def para(self, datos: Dict) -> str:
+        html = self.html
+        for campo, marcador in self.marcadores.items():
+            html = html.replace(marcador, str(escape(datos.get(campo, ""))))
+        return html
+
+
+class Limitador:
+    """Espaciado uniforme para no superar `por_segundo` mensajes (0 = sin límite)."""
+
+    def __init__(self, por_segundo: float = 0):
+        self.intervalo = 1.0 / por_segundo if por_segundo else 0.0
+        self._proximo = time.monotonic()
+
+    def esperar(self) -> None:
+        if not self.intervalo:
+            return
+        ahora = time.monotonic()
+        if self._proximo > ahora:
+            time.sleep(self._proximo - ahora)
+        self._proximo = max(self._proximo, ahora) + self.intervalo
@@ -1,29 +1,53 @@
+import os
+import smtplib
+from typing import Dict, List, Optional
+
 from flask_mail import Message, Mail
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from flask import current_app
 from app.config import Config
 
 from app.mail.token_handler import MailTokenHandler
+from app.mail.outbox import encolar_correo
+from app.mail.bulk import PlantillaMasiva, Limitador, ResultadoEnvio
+
+# Carpeta de plantillas de correo, resuelta desde el paquete y no desde el cwd
+MAIL_TEMPLATES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "templates", "mail"))
 
 class ExpresarteMailer:
     def __init__(self, app=None):
         self.mail = Mail()
+        self.env = None
         if app:
             self.init_app(app)
 
-        # Configurar entorno Jinja2 para plantillas de correo
-        self.env = Environment(
-            loader=FileSystemLoader("app/templates/mail"),
-            autoescape=select_autoescape(["html", "xml"])
-        )
-
     def init_app(self, app):
-        """Inicializa Flask-Mail con la configuración de la app"""
+        """
+        Inicializa Flask-Mail y el entorno de plantillas una sola vez por app.
+        El entorno comparte el caché de bytecode de las plantillas web.
+        """
         try:
             self.mail.init_app(app)
-            current_app.logger.debug("[ExpresarteMailer]: Inicializando Flask-Mail")
+            app.logger.debug("[ExpresarteMailer]: Inicializando Flask-Mail")
         except Exception as e:
-            current_app.logger.error(f"[ExpresarteMailer]: Error al inicializar Flask-Mail: {e}")
+            app.logger.error(f"[ExpresarteMailer]: Error al inicializar Flask-Mail: {e}")
+
+        # Configurar entorno Jinja2 para plantillas de correo
+        self.env = Environment(
+            loader=FileSystemLoader(MAIL_TEMPLATES_DIR),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=app.jinja_env.bytecode_cache,
+            auto_reload=app.debug
+        )
+        app.extensions["expresarte_mailer"] = self
+
+    def warm_up(self, app):
+        """Compila y renderiza las plantillas de correo para que el primer envío no sea en frío."""
+        for template_name in self.env.list_templates(filter_func=lambda nombre: not nombre.startswith("partials/")):
+            try:
+                self.env.get_template(template_name).render(reset_link=app.config.get("APP_URL", ""))
+            except Exception as e:
+                app.logger.warning(f"[ExpresarteMailer]: No se pudo pre-renderizar {template_name}: {e}")
 
     def render_template(self, template_name, **context):
         """Renderiza una plantilla Jinja2 con contexto"""
@@ -36,11 +60,22 @@ class ExpresarteMailer:
             return None
 
     def send_email(self, subject, recipients, template_name, context, sender=None):
-        """Envía un correo HTML usando una plantilla"""
+        """
+        Envía un correo HTML usando una plantilla. Con MAIL_OUTBOX_ENABLED el
+        correo solo se encola y lo envía el worker de la bandeja de salida.
+        """
         html_body = self.render_template(template_name, **context)
         sender = sender or current_app.config.get("MAIL_DEFAULT_SENDER")
         current_app.logger.debug(f"[ExpresarteMailer]: Sender: {sender}")
 
+        if current_app.config.get("MAIL_OUTBOX_ENABLED", True):
+            try:
+                correo_id = encolar_correo(subject, recipients, html_body, sender)
+                current_app.logger.debug(f"[ExpresarteMailer]: Correo encolado: {correo_id}")
+            except Exception as e:
+                current_app.logger.error(f"[ExpresarteMailer]: Error al encolar correo: {e}")
+            return
+
         try:
             msg = Message(
                 subject=subject,
@@ -54,6 +89,80 @@ class ExpresarteMailer:
             current_app.logger.error(f"[ExpresarteMailer]: Error al enviar correo: {e}")
 
 
+    def send_bulk(self, subject: str, recipients: List[Dict], template_name: str, context: Optional[Dict] = None,
+                  recipient_fields=("nombre",), sender=None, batch_size: Optional[int] = None,
+                  rate: Optional[float] = None) -> List[ResultadoEnvio]:
+        """
+        Envía el mismo correo a muchos destinatarios y devuelve el resultado de cada uno.
+
+        Args:
+            recipients: dicts con `email` y los campos de `recipient_fields`.
+            context: contexto común; la plantilla se renderiza una sola vez.
+            batch_size: mensajes por conexión SMTP (MAIL_BULK_BATCH_SIZE).
+            rate: máximo de mensajes por segundo, 0 sin límite (MAIL_BULK_RATE).
+        """
+        plantilla = PlantillaMasiva(self.env.get_template(template_name), context or {}, recipient_fields)
+        sender = sender or current_app.config.get("MAIL_DEFAULT_SENDER")
+        batch_size = max(1, batch_size or int(current_app.config.get("MAIL_BULK_BATCH_SIZE", 50)))
+        limitador = Limitador(rate if rate is not None else float(current_app.config.get("MAIL_BULK_RATE", 0)))
+
+        resultados = []
+        for inicio in range(0, len(recipients), batch_size):
+            lote = recipients[inicio:inicio + batch_size]
+            resultados.extend(self._send_batch(subject, lote, plantilla, sender, limitador))
+
+        enviados = sum(1 for r in resultados if r.enviado)
+        current_app.logger.info(f"[ExpresarteMailer]: Envío masivo '{subject}': {enviados}/{len(resultados)} enviados")
+        return resultados
+
+    def _send_batch(self, subject, lote, plantilla, sender, limitador) -> List[ResultadoEnvio]:
+        """Envía un lote por una única conexión SMTP."""
+        resultados = []
+        try:
+            with self.mail.connect() as conexion:
+                for datos in lote:
+                    limitador.esperar()
+                    try:
+                        conexion.send(Message(
+                            subject=subject,
+                            recipients=[datos["email"]],
+                            html=plantilla.para(datos),
+                            sender=sender
+                        ))
+                        resultados.append(ResultadoEnvio(datos["email"], True))
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except Exception as e:
+                        resultados.append(ResultadoEnvio(datos["email"], False, f"{type(e).__name__}: {e}"))
+        except Exception as e:
+            # Sin conexión: el resto del lote queda sin enviar
+            current_app.logger.error(f"[ExpresarteMailer]: Error de conexión en envío masivo: {e}")
+            resultados.extend(
+                ResultadoEnvio(datos["email"], False, f"{type(e).__name__}: {e}")
+                for datos in lote[len(resultados):]
+            )
+        return resultados
+
+    def send_period_activated(self, periodo_nombre: str, profesores: List[Dict], **opciones) -> List[ResultadoEnvio]:
+        """Avisa a los profesores que el período fue activado."""
+        return self.send_bulk(
+            subject=f"Período {periodo_nombre} activado",
+            recipients=profesores,
+            template_name="periodo_activado.html",
+            context={"periodo": periodo_nombre, "link": f"{current_app.config['APP_URL']}/teachers/dashboard"},
+            **opciones
+        )
+
+    def send_grades_published(self, periodo_nombre: str, estudiantes: List[Dict], **opciones) -> List[ResultadoEnvio]:
+        """Avisa a los estudiantes que las calificaciones del período están publicadas."""
+        return self.send_bulk(
+            subject=f"Calificaciones del período {periodo_nombre}",
+            recipients=estudiantes,
+            template_name="calificaciones_publicadas.html",
+            context={"periodo": periodo_nombre, "link": current_app.config["APP_URL"]},
+            **opciones
+        )
+
     def send_reset_password(self, email: str, user_id: int):
         """Envía correo de recuperación de contraseña"""
         token_handler = MailTokenHandler(user_id)
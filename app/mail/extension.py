@@ -0,0 +1,64 @@
+"""
+Registro del mailer y de la bandeja de salida en la app.
+
+Este módulo no importa Flask-Mail, Jinja ni JWT: con MAIL_PRERENDER
+desactivado el mailer se crea en el primer `get_mailer()` y el worker de la
+bandeja de salida con la primera petición, así que el arranque de cada
+worker web no carga el código de correo.
+"""
+import threading
+
+from flask import current_app
+
+_lock = threading.Lock()
+
+
+def _crear_mailer(app):
+    from app.mail.expresarte_mailer import ExpresarteMailer
+
+    mailer = ExpresarteMailer(app)
+    if app.config.get("MAIL_PRERENDER", True):
+        mailer.warm_up(app)
+    return mailer
+
+
+def init_mailer(app) -> None:
+    """
+    Registra el mailer compartido de la app. Si MAIL_PRERENDER está activo se
+    crea ya y se pre-renderizan las plantillas; si no, al primer uso.
+
+    Con MAIL_OUTBOX_WORKER='thread' el worker de la bandeja de salida se
+    arranca con la primera petición, para no hacerlo en comandos de la CLI.
+    Con 'cli' los correos los envía `flask procesar-correos` en otro proceso.
+    """
+    app.extensions["expresarte_mailer"] = _crear_mailer(app) if app.config.get("MAIL_PRERENDER", True) else None
+    app.extensions["mail_outbox"] = None
+
+    if not app.config.get("MAIL_OUTBOX_ENABLED", True):
+        return
+    if (app.config.get("MAIL_OUTBOX_WORKER") or "thread").lower() != "thread":
+        return
+
+    @app.before_request
+    def _iniciar_outbox():
+        worker = app.extensions.get("mail_outbox")
+        if worker is None:
+            with _lock:
+                worker = app.extensions.get("mail_outbox")
+                if worker is None:
+                    from app.mail.outbox import init_outbox
+                    worker = init_outbox(app)
+        if not worker.activo:
+            worker.iniciar()
+
+
+def get_mailer():
+    """Devuelve el mailer compartido de la app actual, creándolo si hace falta."""
+    mailer = current_app.extensions.get("expresarte_mailer")
+    if mailer is None:
+        with _lock:
+            mailer = current_app.extensions.get("expresarte_mailer")
+            if mailer is None:
+                app = current_app._get_current_object()
+                mailer = app.extensions["expresarte_mailer"] = _crear_mailer(app)
+    return mailer
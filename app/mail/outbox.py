@@ -0,0 +1,262 @@
+"""
+Bandeja de salida persistente para los correos.
+
+Las vistas solo llaman a `encolar_correo`, que inserta una fila en
+`correo_saliente`. Un `OutboxWorker` (hilos dentro del proceso web o el
+comando `flask procesar-correos`) reclama las filas vencidas, las envía por
+SMTP y:
+
+- si el envío falla, reprograma el correo con espera exponencial;
+- si agota MAIL_OUTBOX_MAX_ATTEMPTS, lo marca FALLIDO (dead letter);
+- al detenerse, deja de reclamar y espera a que terminen los envíos en curso.
+
+El reclamo es un UPDATE condicional, así que varios workers (o procesos)
+pueden compartir la misma tabla sin enviar dos veces el mismo correo. Si un
+worker muere con un correo reclamado, otro lo retoma al vencer
+`bloqueado_hasta`.
+"""
+import atexit
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from flask import current_app
+from flask_mail import Message
+from sqlalchemy import and_, or_, select, update
+
+from app.database import db
+from app.database.models import CorreoSaliente
+from app.database.enums import EstadoCorreo
+
+
+def _remitente(sender) -> Optional[str]:
+    if isinstance(sender, (tuple, list)):
+        return f"{sender[0]} <{sender[1]}>" if sender[0] else sender[1]
+    return sender
+
+
+def encolar_correo(subject: str, recipients: List[str], html: str, sender=None) -> int:
+    """Inserta un correo en la bandeja de salida y devuelve su id."""
+    correo = CorreoSaliente(
+        asunto=subject,
+        destinatarios=list(recipients),
+        remitente=_remitente(sender),
+        html=html,
+        estado=EstadoCorreo.PENDIENTE,
+        proximo_intento=datetime.utcnow()
+    )
+    try:
+        db.session.add(correo)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    worker = current_app.extensions.get("mail_outbox")
+    if worker is not None:
+        worker.despertar()
+    return correo.id
+
+
+class OutboxWorker:
+    """Envía los correos pendientes con un pool de hilos."""
+
+    def __init__(self, app, hilos: int = 2, intervalo: float = 5.0, max_intentos: int = 5,
+                 espera_base: float = 30.0, espera_max: float = 3600.0, bloqueo: float = 300.0):
+        self.app = app
+        self.hilos = max(1, hilos)
+        self.intervalo = intervalo
+        self.max_intentos = max(1, max_intentos)
+        self.espera_base = espera_base
+        self.espera_max = espera_max
+        self.bloqueo = bloqueo
+
+        self._detener = threading.Event()
+        self._aviso = threading.Event()
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._hilo: Optional[threading.Thread] = None
+        self._en_curso = set()
+        self._registrado_atexit = False
+
+    @classmethod
+    def desde_config(cls, app, **overrides) -> "OutboxWorker":
+        opciones = dict(
+            hilos=int(app.config.get("MAIL_OUTBOX_THREADS", 2)),
+            intervalo=float(app.config.get("MAIL_OUTBOX_POLL_SECONDS", 5)),
+            max_intentos=int(app.config.get("MAIL_OUTBOX_MAX_ATTEMPTS", 5)),
+            espera_base=float(app.config.get("MAIL_OUTBOX_BACKOFF_SECONDS", 30)),
+            espera_max=float(app.config.get("MAIL_OUTBOX_BACKOFF_MAX_SECONDS", 3600)),
+            bloqueo=float(app.config.get("MAIL_OUTBOX_LEASE_SECONDS", 300)),
+        )
+        opciones.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(app, **opciones)
+
+    @property
+    def activo(self) -> bool:
+        return self._hilo is not None and self._hilo.is_alive()
+
+    # Ciclo de vida
+
+    def iniciar(self) -> None:
+        """Arranca el hilo despachador (idempotente)."""
+        with self._lock:
+            if self.activo:
+                return
+            self._detener.clear()
+            self._pool = ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="correo")
+            self._hilo = threading.Thread(target=self._despachar, name="correo-despachador", daemon=True)
+            self._hilo.start()
+            if not self._registrado_atexit:
+                atexit.register(self.detener)
+                self._registrado_atexit = True
+
+    def despertar(self) -> None:
+        """Avisa que hay correos nuevos para no esperar al próximo sondeo."""
+        self._aviso.set()
+
+    def detener(self, timeout: Optional[float] = 30.0) -> None:
+        """Deja de reclamar correos y espera a que terminen los envíos en curso."""
+        with self._lock:
+            hilo, pool = self._hilo, self._pool
+            self._hilo = self._pool = None
+        if hilo is None:
+            return
+        self._detener.set()
+        self._aviso.set()
+        hilo.join(timeout)
+        if self._en_curso:
+            wait(list(self._en_curso), timeout=timeout)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def procesar_pendientes(self) -> int:
+        """Envía en este hilo todos los correos vencidos y devuelve cuántos procesó."""
+        procesados = 0
+        while True:
+            ids = self._reclamar(self.hilos)
+            if not ids:
+                return procesados
+            for correo_id in ids:
+                self._enviar(correo_id)
+            procesados += len(ids)
+
+    # Despacho
+
+    def _despachar(self) -> None:
+        while not self._detener.is_set():
+            libres = self.hilos - len(self._en_curso)
+            ids = self._reclamar(libres) if libres > 0 else []
+            for correo_id in ids:
+                futuro = self._pool.submit(self._enviar, correo_id)
+                self._en_curso.add(futuro)
+                futuro.add_done_callback(self._terminado)
+            if ids and len(ids) == libres:
+                # Hay más trabajo: esperar a que se libere un hilo, no al sondeo
+                wait(list(self._en_curso), return_when=FIRST_COMPLETED)
+                continue
+            self._aviso.wait(self.intervalo)
+            self._aviso.clear()
+
+    def _terminado(self, futuro) -> None:
+        self._en_curso.discard(futuro)
+        self._aviso.set()
+
+    def _reclamar(self, limite: int) -> List[int]:
+        """Marca como ENVIANDO hasta `limite` correos vencidos y devuelve sus ids."""
+        if limite <= 0:
+            return []
+        with self.app.app_context():
+            ahora = datetime.utcnow()
+            disponible = or_(
+                and_(CorreoSaliente.estado == EstadoCorreo.PENDIENTE, CorreoSaliente.proximo_intento <= ahora),
+                and_(CorreoSaliente.estado == EstadoCorreo.ENVIANDO, CorreoSaliente.bloqueado_hasta < ahora),
+            )
+            try:
+                candidatos = db.session.execute(
+                    select(CorreoSaliente.id).where(disponible)
+                    .order_by(CorreoSaliente.proximo_intento).limit(limite)
+                ).scalars().all()
+                reclamados = []
+                for correo_id in candidatos:
+                    resultado = db.session.execute(
+                        update(CorreoSaliente)
+                        .where(CorreoSaliente.id == correo_id, disponible)
+                        .values(estado=EstadoCorreo.ENVIANDO,
+                                bloqueado_hasta=ahora + timedelta(seconds=self.bloqueo))
+                    )
+                    if resultado.rowcount == 1:
+                        reclamados.append(correo_id)
+                db.session.commit()
+                return reclamados
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"[OutboxWorker]: Error al reclamar correos: {e}")
+                return []
+
+    def _espera(self, intentos: int) -> float:
+        """Espera exponencial con algo de dispersión para no reintentar en bloque."""
+        espera = min(self.espera_base * (2 ** (intentos - 1)), self.espera_max)
+        return espera * random.uniform(0.8, 1.2)
+
+    def _enviar(self, correo_id: int) -> None:
+        with self.app.app_context():
+            correo = db.session.get(CorreoSaliente, correo_id)
+            if correo is None or correo.estado != EstadoCorreo.ENVIANDO:
+                return
+            try:
+                msg = Message(
+                    subject=correo.asunto,
+                    recipients=list(correo.destinatarios),
+                    html=correo.html,
+                    sender=correo.remitente
+                )
+                current_app.extensions["mail"].send(msg)
+            except Exception as e:
+                correo.intentos += 1
+                correo.ultimo_error = f"{type(e).__name__}: {e}"[:2000]
+                correo.bloqueado_hasta = None
+                if correo.intentos >= self.max_intentos:
+                    correo.estado = EstadoCorreo.FALLIDO
+                    self.app.logger.error(
+                        f"[OutboxWorker]: Correo {correo_id} descartado tras {correo.intentos} intentos: {e}")
+                else:
+                    correo.estado = EstadoCorreo.PENDIENTE
+                    correo.proximo_intento = datetime.utcnow() + timedelta(seconds=self._espera(correo.intentos))
+                    self.app.logger.warning(
+                        f"[OutboxWorker]: Falló el envío del correo {correo_id} (intento {correo.intentos}): {e}")
+            else:
+                correo.intentos += 1
+                correo.estado = EstadoCorreo.ENVIADO
+                correo.fecha_envio = datetime.utcnow()
+                correo.bloqueado_hasta = None
+                correo.ultimo_error = None
+
+            try:
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f"[OutboxWorker]: No se pudo actualizar el correo {correo_id}: {e}")
+
+
+def reintentar_fallidos() -> int:
+    """Devuelve a PENDIENTE los correos FALLIDO, con los intentos en cero."""
+    try:
+        resultado = db.session.execute(
+            update(CorreoSaliente)
+            .where(CorreoSaliente.estado == EstadoCorreo.FALLIDO)
+            .values(estado=EstadoCorreo.PENDIENTE, intentos=0, proximo_intento=datetime.utcnow())
+        )
+        db.session.commit()
+        return resultado.rowcount
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def init_outbox(app) -> OutboxWorker:
+    """Crea el worker de la bandeja de salida del proceso web y lo registra en la app."""
+    worker = OutboxWorker.desde_config(app)
+    app.extensions["mail_outbox"] = worker
+    return worker
@@ -1,4 +1,3 @@
-import jwt
 from typing import Optional, Union
 from datetime import datetime, timedelta
 from flask import current_app
@@ -11,6 +10,8 @@ class MailTokenHandler:
 
     def create_reset_token(self) -> str:
         """Genera un token JWT para recuperación de contraseña"""
+        import jwt  # se importa al primer uso para no cargarlo en el arranque
+
         expiration = timedelta(minutes=Config.RESET_TOKEN_EXP_MINUTES)
         payload = {
             'user_id': self.user_id,
@@ -23,6 +24,8 @@ class MailTokenHandler:
     @staticmethod
     def decode_token(token: str) -> Union[int, None]:
         """Decodifica el token y retorna el user_id si es válido"""
+        import jwt
+
         try:
             payload = jwt.decode(token, Config.SECRET_KEY, algorithms=['HS256'])
             current_app.logger.debug(f"Token decodificado: {payload}")
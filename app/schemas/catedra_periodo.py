@@ -25,9 +25,20 @@ class CatedraAcademicaResponse(BaseModel):
     periodo_id: int
     grupo: Optional[str] = None
     cupos: int
+    inscritos: int = 0
     created_at: datetime = datetime.now()
     updated_at: datetime = datetime.now()
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class CatedraAcademicaListItem(BaseModel):
+    """Proyección de cátedra académica con el nombre de su profesor"""
+    id: int
+    catedra: Catedra
+    grupo: Optional[str] = None
+    cupos: int
+    inscritos: int = 0
+    profesor_id: Optional[int] = None
+    profesor_nombre: Optional[str] = None
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from app.database.enums import EstadoInscripcion
 
@@ -27,4 +27,9 @@ class InscripcionResponse(BaseModel):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class InscripcionLoteResultado(BaseModel):
+    estudiante_id: int
+    catedra_academica_id: int
+    resultado: Literal["aceptada", "duplicada", "sin_cupo", "catedra_inexistente"]
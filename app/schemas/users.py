@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from app.database.enums import Sexo, Role
 
@@ -49,4 +49,42 @@ class UserResponse(BaseModel):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class UserPage(BaseModel):
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+# Proyecciones para listados: solo las columnas que se muestran
+class UserListItem(BaseModel):
+    id: int
+    email: str
+    primer_nombre: str
+    primer_apellido: str
+    role: Role
+    activo: bool
+    fecha_creacion: datetime
+
+class UserListPage(BaseModel):
+    items: List[UserListItem]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class UserOption(BaseModel):
+    id: int
+    primer_nombre: str
+    primer_apellido: str
+
+class UserImportError(BaseModel):
+    fila: int
+    email: Optional[str] = None
+    error: str
+
+class UserImportReport(BaseModel):
+    dry_run: bool = False
+    total: int = 0
+    creados: int = 0
+    duplicados: List[UserImportError] = []
+    invalidos: List[UserImportError] = []
+
@@ -0,0 +1,10 @@
+from app.security.password_policy import PasswordPolicy, init_password_policy, get_password_policy
+from app.security.user_cache import (
+    SesionUsuario,
+    UserCache,
+    init_user_cache,
+    get_user_cache,
+    marcar_usuario_modificado,
+    invalidar_usuario
+)
+from app.security.decorators import requires
@@ -0,0 +1,55 @@
+from functools import wraps
+
+from flask import flash, redirect, url_for, current_app
+from flask_login import current_user, logout_user
+
+from app.database.enums import Permission, permission_mask
+from app.security.user_cache import SesionUsuario, get_user_cache
+
+
+def _mascara_actual(sensitive: bool) -> int:
+    """
+    Máscara de permisos del usuario de la petición. En rutas sensibles, y si
+    USER_CACHE_RECHECK_SENSITIVE está activo, se vuelve a leer el usuario de
+    la base en lugar de confiar en la instantánea cacheada.
+    """
+    usuario = current_user._get_current_object()
+    cache = get_user_cache()
+    if sensitive and cache is not None and isinstance(usuario, SesionUsuario) \
+            and current_app.config.get("USER_CACHE_RECHECK_SENSITIVE", True):
+        usuario = cache.recargar(usuario.id)
+        if usuario is None or not usuario.activo:
+            logout_user()
+            return 0
+    return getattr(usuario, "permission_mask", 0)
+
+
+def requires(*permissions: Permission, any_of: bool = False, sensitive: bool = False,
+             message: str = "Acceso denegado."):
+    """
+    Restringe una ruta a los usuarios cuyo rol tenga los permisos indicados.
+
+    La verificación se hace contra la máscara precalculada del rol. Por
+    defecto se exigen todos los permisos; con `any_of=True` basta con uno.
+    Con `sensitive=True` los permisos se comprueban contra la base de datos
+    y no contra la caché de usuarios. Debe colocarse debajo de `@login_required`.
+
+    Example:
+        @admin_bp.route('/usuarios')
+        @login_required
+        @requires(Permission.VIEW_USERS, Permission.EDIT_USERS)
+        def lista_usuarios(): ...
+    """
+    requerida = permission_mask(*permissions)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            mascara = _mascara_actual(sensitive)
+            permitido = bool(mascara & requerida) if any_of else mascara & requerida == requerida
+            if not permitido:
+                flash(message, "danger")
+                return redirect(url_for('main.index'))
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,79 @@
+"""Política central de hashing de contraseñas."""
+from typing import Mapping, Optional, Tuple
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash, DEFAULT_PBKDF2_ITERATIONS
+
+ALGORITMOS = ("scrypt", "pbkdf2")
+
+class PasswordPolicy:
+    """Hashea y verifica contraseñas con un algoritmo y costo configurables.
+
+    Los hashes se guardan en el formato de werkzeug (`método$sal$hash`), por lo
+    que los hashes antiguos siguen verificándose aunque la política cambie; al
+    iniciar sesión se detectan y se vuelven a hashear con los parámetros actuales.
+    """
+
+    def __init__(self, algorithm: str = "scrypt", cost: Optional[str] = None, salt_length: int = 16):
+        if algorithm not in ALGORITMOS:
+            raise ValueError(f"Algoritmo de hashing inválido: '{algorithm}'. Válidos: {list(ALGORITMOS)}")
+        self.algorithm = algorithm
+        self.salt_length = salt_length
+        self.method = self._build_method(algorithm, str(cost) if cost else None)
+
+    @staticmethod
+    def _build_method(algorithm: str, cost: Optional[str]) -> str:
+        """Construye el método de werkzeug completo, tal como queda guardado en el hash."""
+        if algorithm == "scrypt":
+            if not cost:
+                return "scrypt:32768:8:1"
+            partes = cost.split(":")
+            if len(partes) == 1:
+                partes += ["8", "1"]
+            if len(partes) != 3:
+                raise ValueError("El costo de scrypt debe ser 'N' o 'N:r:p'.")
+            return "scrypt:" + ":".join(str(int(p)) for p in partes)
+
+        return f"pbkdf2:sha256:{int(cost) if cost else DEFAULT_PBKDF2_ITERATIONS}"
+
+    @classmethod
+    def from_config(cls, config: Mapping) -> "PasswordPolicy":
+        return cls(
+            algorithm=config.get("PASSWORD_HASH_ALGORITHM", "scrypt"),
+            cost=config.get("PASSWORD_HASH_COST"),
+            salt_length=int(config.get("PASSWORD_SALT_LENGTH", 16))
+        )
+
+    def hash(self, password: str) -> str:
+        """Genera el hash de una contraseña en texto plano."""
+        return generate_password_hash(password, method=self.method, salt_length=self.salt_length)
+
+    def verify(self, stored_hash: str, password: str) -> bool:
+        """Verifica una contraseña contra un hash guardado, sea cual sea su método."""
+        if not stored_hash:
+            return False
+        return check_password_hash(stored_hash, password)
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """Indica si el hash fue generado con parámetros distintos a los actuales."""
+        metodo, _, resto = stored_hash.partition("$")
+        sal = resto.partition("$")[0]
+        return metodo != self.method or len(sal) != self.salt_length
+
+    def verify_and_update(self, stored_hash: str, password: str) -> Tuple[bool, Optional[str]]:
+        """Verifica la contraseña y, si es válida pero el hash está desactualizado, devuelve uno nuevo."""
+        if not self.verify(stored_hash, password):
+            return False, None
+        return True, self.hash(password) if self.needs_rehash(stored_hash) else None
+
+
+def init_password_policy(app):
+    """Registra la política de contraseñas configurada en la app."""
+    app.extensions["password_policy"] = PasswordPolicy.from_config(app.config)
+    return app.extensions["password_policy"]
+
+def get_password_policy() -> PasswordPolicy:
+    """Devuelve la política de la app actual."""
+    policy = current_app.extensions.get("password_policy")
+    if policy is None:
+        policy = init_password_policy(current_app)
+    return policy
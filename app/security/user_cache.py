@@ -0,0 +1,207 @@
+"""Caché de usuarios autenticados para el user_loader de Flask-Login."""
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, has_app_context
+from flask_login import UserMixin
+
+from app.database import db
+from app.database.models import Usuario, VersionCache
+from app.database.enums import role_mask
+
+
+class SesionUsuario(UserMixin):
+    """
+    Instantánea de solo lectura de un usuario autenticado.
+
+    Expone los datos que usan las rutas y plantillas en cada petición (id,
+    rol, estado, nombres y máscara de permisos). Cualquier otro atributo
+    (relaciones, fechas, etc.) se resuelve cargando el modelo `Usuario`
+    en la sesión actual la primera vez que se pide.
+    """
+
+    CAMPOS = (
+        "id", "email", "primer_nombre", "segundo_nombre",
+        "primer_apellido", "segundo_apellido", "role", "activo", "permission_mask"
+    )
+
+    def __init__(self, datos: Dict):
+        self.__dict__.update(datos)
+
+    @classmethod
+    def datos_de(cls, usuario: Usuario) -> Dict:
+        datos = {campo: getattr(usuario, campo) for campo in cls.CAMPOS if campo != "permission_mask"}
+        datos["permission_mask"] = role_mask(usuario.role)
+        return datos
+
+    def get_id(self):
+        return str(self.id)
+
+    @property
+    def is_active(self):
+        return self.activo
+
+    # Misma lógica que el modelo, basada solo en `role` y `permission_mask`
+    nombre_completo = Usuario.nombre_completo
+    get_role = Usuario.get_role
+    has_permission = Usuario.has_permission
+    has_all = Usuario.has_all
+    has_any = Usuario.has_any
+    is_super_admin = Usuario.is_super_admin
+    is_admin = Usuario.is_admin
+    is_academic = Usuario.is_academic
+    is_teacher = Usuario.is_teacher
+    is_student = Usuario.is_student
+
+    def modelo(self) -> Optional[Usuario]:
+        """Devuelve el `Usuario` completo, cargándolo una sola vez por instancia."""
+        if "_modelo" not in self.__dict__:
+            self.__dict__["_modelo"] = db.session.get(Usuario, self.id)
+        return self.__dict__["_modelo"]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.modelo(), name)
+
+    def __repr__(self) -> str:
+        return f'<SesionUsuario {self.email}>'
+
+
+class UserCache:
+    """
+    Caché LRU con TTL de instantáneas de usuario, indexada por ID.
+
+    Es local al proceso. Las ediciones hechas en este proceso invalidan la
+    entrada al momento; para las de otros procesos se compara la versión
+    `usuarios` de VersionCache como mucho una vez cada `intervalo` segundos
+    y, si cambió, se vacía la caché completa.
+    """
+
+    VERSION_USUARIOS = "usuarios"
+
+    def __init__(self, ttl: float = 60, max_size: int = 1024, intervalo: float = 10, reportar_cada: int = 1000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.intervalo = intervalo
+        self.reportar_cada = reportar_cada
+        self._datos: "OrderedDict[int, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._verificado = 0.0
+        self.aciertos = 0
+        self.fallos = 0
+
+    @classmethod
+    def from_config(cls, config) -> "UserCache":
+        return cls(
+            ttl=float(config.get("USER_CACHE_TTL", 60)),
+            max_size=int(config.get("USER_CACHE_MAX_SIZE", 1024)),
+            intervalo=float(config.get("USER_CACHE_CHECK_SECONDS", 10)),
+            reportar_cada=int(config.get("USER_CACHE_REPORT_EVERY", 1000))
+        )
+
+    def cargar(self, user_id: int) -> Optional[SesionUsuario]:
+        """Devuelve la instantánea del usuario, consultando la base solo si no está en caché."""
+        self._verificar_version()
+        ahora = time.monotonic()
+        with self._lock:
+            entrada = self._datos.get(user_id)
+            if entrada is not None and entrada[0] > ahora:
+                self._datos.move_to_end(user_id)
+                self.aciertos += 1
+                datos = entrada[1]
+            else:
+                self.fallos += 1
+                datos = None
+            total = self.aciertos + self.fallos
+
+        if self.reportar_cada and total % self.reportar_cada == 0:
+            self._reportar()
+
+        if datos is None:
+            usuario = db.session.get(Usuario, user_id)
+            if usuario is None:
+                return None
+            datos = SesionUsuario.datos_de(usuario)
+            self.guardar(user_id, datos)
+        return SesionUsuario(datos)
+
+    def recargar(self, user_id: int) -> Optional[Usuario]:
+        """Lee el usuario directamente de la base y renueva su entrada en la caché."""
+        usuario = db.session.get(Usuario, user_id)
+        if usuario is None:
+            self.invalidar(user_id)
+        else:
+            self.guardar(user_id, SesionUsuario.datos_de(usuario))
+        return usuario
+
+    def guardar(self, user_id: int, datos: Dict) -> None:
+        with self._lock:
+            self._datos[user_id] = (time.monotonic() + self.ttl, datos)
+            self._datos.move_to_end(user_id)
+            while len(self._datos) > self.max_size:
+                self._datos.popitem(last=False)
+
+    def invalidar(self, user_id: Optional[int] = None) -> None:
+        """Descarta un usuario, o todos si no se indica ID."""
+        with self._lock:
+            if user_id is None:
+                self._datos.clear()
+            else:
+                self._datos.pop(user_id, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / total if total else 0.0,
+                "tamano": len(self._datos)
+            }
+
+    def _verificar_version(self) -> None:
+        ahora = time.monotonic()
+        if ahora - self._verificado < self.intervalo:
+            return
+        version = VersionCache.leer(db.session, self.VERSION_USUARIOS)
+        with self._lock:
+            if self._version is not None and version != self._version:
+                self._datos.clear()
+            self._version = version
+            self._verificado = ahora
+
+    def _reportar(self) -> None:
+        if has_app_context():
+            s = self.stats()
+            current_app.logger.info(
+                f"[USER CACHE] aciertos={s['aciertos']} fallos={s['fallos']} "
+                f"tasa={s['tasa_aciertos']:.1%} tamaño={s['tamano']}"
+            )
+
+
+def init_user_cache(app) -> Optional[UserCache]:
+    """Registra la caché de usuarios si USER_CACHE_ENABLED está activo."""
+    cache = UserCache.from_config(app.config) if app.config.get("USER_CACHE_ENABLED", True) else None
+    app.extensions["user_cache"] = cache
+    return cache
+
+def get_user_cache() -> Optional[UserCache]:
+    """Devuelve la caché de usuarios de la app actual, o None si está desactivada."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("user_cache")
+
+def marcar_usuario_modificado(session) -> None:
+    """Incrementa la versión `usuarios` dentro de la transacción en curso,
+    para que los demás procesos descarten sus copias."""
+    VersionCache.incrementar(session, UserCache.VERSION_USUARIOS)
+
+def invalidar_usuario(user_id: int) -> None:
+    """Descarta el usuario de la caché del proceso. Llamar después del commit."""
+    cache = get_user_cache()
+    if cache is not None:
+        cache.invalidar(user_id)
@@ -4,7 +4,6 @@
 from typing import Optional
 from datetime import date
 from flask import current_app
-from werkzeug.security import generate_password_hash
 
 from app.database.enums import Catedra, Sexo, Role, Calificacion, EstadoInscripcion
 from app.controllers import ControllerFactory
@@ -3,5 +3,6 @@
 from app.server.forms.auth_forms import LoginForm, PasswordResetForm, RequestResetPasswordForm
 from app.server.forms.admin_forms import CreateUserForm, UserStatusForm, ActualizarUserForm
 from app.server.forms.asignar_catedra_form import AsignarCatedraForm
-from app.server.forms.califications_form import CalificacionForm, SetCalificacionForm
-from app.server.forms.periodo_academico_forms import PeriodoAcademicoForm, CrearPeriodoAcademicoForm, CatedraPeriodoForm
\ No newline at end of file
+from app.server.forms.califications_form import CalificacionForm, SetCalificacionForm, CalificacionLoteForm
+from app.server.forms.periodo_academico_forms import PeriodoAcademicoForm, CrearPeriodoAcademicoForm, CatedraPeriodoForm
+from app.server.forms.inscripcion_forms import InscripcionLoteForm
\ No newline at end of file
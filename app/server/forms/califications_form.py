@@ -1,5 +1,5 @@
 from flask_wtf import FlaskForm
-from wtforms import HiddenField, SelectField, TextAreaField, SubmitField
+from wtforms import Form, FieldList, FormField, HiddenField, SelectField, TextAreaField, SubmitField
 from wtforms.validators import InputRequired, Optional, DataRequired
 from app.database.enums import Calificacion
 
@@ -28,3 +28,21 @@ class SetCalificacionForm(FlaskForm):
         validators=[DataRequired()]
     )
     submit = SubmitField("Asignar")
+
+class CalificacionEntradaForm(Form):
+    """Fila del formulario de calificaciones por lote (sin CSRF propio)"""
+    alumno_id = HiddenField(validators=[InputRequired()])
+
+    nota_final = SelectField(
+        "Calificación Final",
+        choices=Calificacion.choices(),
+        validators=[InputRequired()],
+        coerce=str
+    )
+
+    observaciones = TextAreaField("Observaciones", validators=[Optional()], render_kw={"rows": 1})
+
+class CalificacionLoteForm(FlaskForm):
+    calificaciones = FieldList(FormField(CalificacionEntradaForm))
+    submit = SubmitField("Guardar Calificaciones")
+
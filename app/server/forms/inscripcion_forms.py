@@ -0,0 +1,13 @@
+from flask_wtf import FlaskForm
+from wtforms import TextAreaField, SubmitField
+from wtforms.validators import DataRequired
+
+class InscripcionLoteForm(FlaskForm):
+    """Formulario para inscribir una lista de estudiantes en una cátedra"""
+
+    estudiantes = TextAreaField(
+        "Correos de los estudiantes",
+        validators=[DataRequired()],
+        render_kw={"rows": 10, "placeholder": "Un correo por línea"}
+    )
+    submit = SubmitField("Inscribir")
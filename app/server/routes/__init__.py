@@ -3,9 +3,11 @@ from app.server.routes.main_routes import main_bp
 from app.server.routes.auth_routes import auth_bp
 from app.server.routes.admin_routes import admin_bp
 from app.server.routes.teacher_routes import teacher_bp
+from app.server.routes.health_routes import health_bp
 
 def register_blueprints(app):
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(admin_bp)
-    app.register_blueprint(teacher_bp)
\ No newline at end of file
+    app.register_blueprint(teacher_bp)
+    app.register_blueprint(health_bp)
\ No newline at end of file
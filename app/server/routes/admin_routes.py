@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
 from flask_login import login_required, current_user
 
 from app.server.forms import(
@@ -8,7 +8,8 @@ from app.server.forms import(
     ActualizarUserForm, 
     PeriodoAcademicoForm, 
     CrearPeriodoAcademicoForm,
-    CatedraPeriodoForm
+    CatedraPeriodoForm,
+    InscripcionLoteForm
 )
 from app.schemas import (
     UserCreate,
@@ -17,11 +18,14 @@ from app.schemas import (
     ProfesorCatedraUpdate, 
     PeriodoAcademicoCreate, 
     PeriodoAcademicoUpdate,
-    CatedraAcademicaCreate
+    CatedraAcademicaCreate,
+    InscripcionCreate
 )
 from app.controllers import ControllerFactory
-from app.database.enums import Catedra, Role
-from app.database.models import PeriodoAcademico
+from app.security import requires
+from app.cache import conditional
+from app.database.enums import Catedra, Role, EstadoInscripcion, Permission
+from app.database.models import PeriodoAcademico, CatedraAcademica, Usuario, Inscripcion
 
 controller = ControllerFactory(current_user=current_user)
 
@@ -31,18 +35,13 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
 @admin_bp.route('/usuarios/crear', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.CREATE_USERS, sensitive=True, message="Acceso denegado: solo administradores pueden crear usuarios.")
 def crear_usuario():
-    if not current_user.is_admin():
-        flash("Acceso denegado: solo administradores pueden crear usuarios.", "danger")
-        return redirect(url_for('main.index'))
-
     form = CreateUserForm()
     if form.validate_on_submit():
-        from werkzeug.security import generate_password_hash
-
         nuevo_usuario = UserCreate(
             email=form.email.data,
-            password_hash=generate_password_hash(form.password.data),
+            password_hash=form.password.data,
             primer_nombre=form.primer_nombre.data,
             segundo_nombre=form.segundo_nombre.data or None,
             primer_apellido=form.primer_apellido.data,
@@ -65,24 +64,28 @@ def crear_usuario():
 
 @admin_bp.route('/usuarios')
 @login_required
+@requires(Permission.VIEW_USERS, Permission.EDIT_USERS, message="Acceso denegado: solo administradores pueden ver esta página.")
+@conditional(Usuario)
 def lista_usuarios():
     form = UserStatusForm()
-    if not current_user.is_admin():
-        flash("Acceso denegado: solo administradores pueden ver esta página.", "danger")
-        return redirect(url_for('main.index'))
-
     user_ctrl = controller.get_user_controller()
-    usuarios = user_ctrl.get_users_by_role(role='all', only_active=False)
+    try:
+        pagina = user_ctrl.get_user_list_page(
+            role='all',
+            only_active=False,
+            limit=current_app.config["USERS_PER_PAGE"],
+            cursor=request.args.get('cursor')
+        )
+    except ValueError as e:
+        flash(str(e), "warning")
+        return redirect(url_for('admin.lista_usuarios'))
 
-    return render_template('admin/list_users.html', usuarios=usuarios, form=form)
+    return render_template('admin/list_users.html', usuarios=pagina.items, pagina=pagina, form=form)
 
 @admin_bp.route('/usuarios/<int:id>/editar', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.EDIT_USERS, sensitive=True, message="Acceso denegado: solo administradores pueden editar usuarios.")
 def editar_usuario(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado: solo administradores pueden editar usuarios.", "danger")
-        return redirect(url_for('main.index'))
-
     user_ctrl = ControllerFactory(current_user=current_user).get_user_controller()
     usuario = user_ctrl.get_user_by_id(id)
 
@@ -117,11 +120,8 @@ def editar_usuario(id):
 
 @admin_bp.route('/usuarios/<int:id>/estado', methods=['POST'])
 @login_required
+@requires(Permission.EDIT_USERS, sensitive=True, message="Acceso denegado: solo administradores pueden modificar estado de usuarios.")
 def cambiar_estado_usuario(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado: solo administradores pueden modificar estado de usuarios.", "danger")
-        return redirect(url_for('main.index'))
-
     form = UserStatusForm()
     if form.validate_on_submit():
         user_ctrl = controller.get_user_controller()
@@ -140,32 +140,17 @@ def cambiar_estado_usuario(id):
 
 @admin_bp.route('/profesores')
 @login_required
+@requires(Permission.EDIT_USERS, Permission.EDIT_COURSES)
 def lista_profesores():
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     user_ctrl = controller.get_user_controller()
-    catedra_ctrl = controller.get_profesor_catedra_controller()
-
-    profesores = user_ctrl.get_all_teachers(only_active=True)
-    listado = []
-
-    for profe in profesores:
-        listado.append({
-            "obj": profe,
-            "catedras": catedra_ctrl.get_catedras_by_profesor(profe.id)
-        })
+    listado = user_ctrl.get_teachers_roster(only_active=True)
 
     return render_template('admin/list_profesores.html', profesores=listado)
 
 @admin_bp.route('/profesores/<int:id>/asignar-catedra', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.EDIT_USERS, Permission.EDIT_COURSES)
 def asignar_catedra(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     user_ctrl = controller.get_user_controller()
     catedra_ctrl = controller.get_profesor_catedra_controller()
     profesor = user_ctrl.get_user_by_id(id)
@@ -189,11 +174,8 @@ def asignar_catedra(id):
 
 @admin_bp.route('/profesores/<int:profesor_id>/remover-catedra/<nombre_catedra>', methods=['POST'])
 @login_required
+@requires(Permission.EDIT_USERS, Permission.EDIT_COURSES)
 def remover_catedra(profesor_id, nombre_catedra):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     user_ctrl = controller.get_user_controller()
     profesor = user_ctrl.get_user_by_id(profesor_id)
 
@@ -221,11 +203,9 @@ def remover_catedra(profesor_id, nombre_catedra):
 
 @admin_bp.route('/periodos-academicos', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
+@conditional(PeriodoAcademico)
 def gestionar_periodos():
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
 
     form = PeriodoAcademicoForm()
@@ -252,11 +232,8 @@ def gestionar_periodos():
 
 @admin_bp.route('/periodos-academicos/crear', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
 def crear_periodo():
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
     form = CrearPeriodoAcademicoForm()
 
@@ -278,11 +255,8 @@ def crear_periodo():
 
 @admin_bp.route('/periodos-academicos/<int:id>/editar', methods=['GET', 'POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
 def editar_periodo(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     factory = ControllerFactory(current_user=current_user)
     periodo_ctrl = factory.get_periodo_academico_controller()
     catedra_ctrl = factory.get_catedra_academica_controller()
@@ -294,7 +268,7 @@ def editar_periodo(id):
 
     # Cargar opciones del enum Catedra y lista de profesores
     catedra_form.catedra.choices = Catedra.choices()
-    profesores = user_ctrl.get_all_teachers()
+    profesores = user_ctrl.get_teacher_options()
     catedra_form.profesor_id.choices = [(0, "— Sin profesor —")] + [(p.id, p.primer_nombre) for p in profesores]
 
     # Edición del período
@@ -329,18 +303,15 @@ def editar_periodo(id):
         return redirect(url_for('admin.editar_periodo', id=id))
 
     # Listar cátedras ya asignadas
-    catedras = catedra_ctrl.listar_por_periodo(id)
+    catedras = catedra_ctrl.listar_resumen_por_periodo(id)
 
     return render_template("admin/editar_periodo.html", form=form, catedra_form=catedra_form,
                            periodo=periodo, catedras=catedras)
 
 @admin_bp.route('/periodos-academicos/<int:id>/eliminar', methods=['POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS, sensitive=True)
 def eliminar_periodo(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
     try:
         periodo_ctrl.delete_periodo(id)
@@ -352,11 +323,8 @@ def eliminar_periodo(id):
 
 @admin_bp.route('/periodos-academicos/<int:id>/activar', methods=['POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
 def activar_periodo(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
     periodo_ctrl.activar_periodo(id)
     flash("Período académico activado.", "success")
@@ -364,11 +332,8 @@ def activar_periodo(id):
 
 @admin_bp.route('/periodos-academicos/<int:id>/desactivar', methods=['POST'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
 def desactivar_periodo(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
     periodo_ctrl.desactivar_periodo(id)
     flash("Período académico desactivado.", "warning")
@@ -376,30 +341,56 @@ def desactivar_periodo(id):
 
 @admin_bp.route('/periodos-academicos/<int:id>/ver', methods=['GET'])
 @login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
+@conditional(PeriodoAcademico, CatedraAcademica, Usuario, Inscripcion)
 def ver_periodo(id):
-    if not current_user.is_admin():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
+    periodo_ctrl = ControllerFactory(current_user=current_user).get_periodo_academico_controller()
+
+    periodo = periodo_ctrl._get_or_fail(PeriodoAcademico, id)
+    resumen = periodo_ctrl.resumen_periodo(periodo.id)
+
+    return render_template("admin/ver_periodo.html", periodo=periodo, resumen=resumen)
 
+@admin_bp.route('/catedras/<int:catedra_id>/inscribir', methods=['GET', 'POST'])
+@login_required
+@requires(Permission.MANAGE_ACADEMIC_PERIODS)
+def inscribir_estudiantes(catedra_id):
     factory = ControllerFactory(current_user=current_user)
-    periodo_ctrl = factory.get_periodo_academico_controller()
-    catedra_ctrl = factory.get_catedra_academica_controller()
     inscripcion_ctrl = factory.get_inscripcion_controller()
     user_ctrl = factory.get_user_controller()
 
-    periodo = periodo_ctrl._get_or_fail(PeriodoAcademico, id)
-    catedras = catedra_ctrl.listar_por_periodo(periodo.id)
+    catedra = inscripcion_ctrl._get_or_fail(CatedraAcademica, catedra_id)
+    form = InscripcionLoteForm()
+    resultados = []
+    no_encontrados = []
 
-    resumen = []
-    for cat in catedras:
-        profesor = user_ctrl.get_user_by_id(cat.profesor_id) if cat.profesor_id else None
-        inscritos = inscripcion_ctrl.contar_estudiantes_en_catedra(cat.id) or 0  # ← asegúrate que devuelva int
+    if form.validate_on_submit():
+        emails = list(dict.fromkeys(
+            linea.strip().lower() for linea in form.estudiantes.data.splitlines() if linea.strip()
+        ))
+        ids = user_ctrl.get_user_ids_by_email(emails, role=Role.STUDENT)
+        no_encontrados = [email for email in emails if email not in ids]
+
+        lote = [
+            InscripcionCreate(
+                estudiante_id=ids[email],
+                catedra_academica_id=catedra.id,
+                periodo_id=catedra.periodo_id,
+                estado=EstadoInscripcion.ACTIVO
+            )
+            for email in emails if email in ids
+        ]
+        try:
+            emails_por_id = {user_id: email for email, user_id in ids.items()}
+            resultados = [
+                {"email": emails_por_id[r.estudiante_id], "resultado": r.resultado}
+                for r in inscripcion_ctrl.inscribir_lote(lote)
+            ]
+            aceptadas = sum(1 for r in resultados if r["resultado"] == "aceptada")
+            flash(f"{aceptadas} de {len(emails)} estudiante(s) inscritos.", "success" if aceptadas else "warning")
+        except Exception as e:
+            flash(f"Error al inscribir estudiantes: {str(e)}", "danger")
 
-        resumen.append({
-            "nombre": cat.catedra.label,
-            "grupo": cat.grupo,
-            "profesor": f"{profesor.primer_nombre} {profesor.primer_apellido}" if profesor else "Sin asignar",
-            "inscritos": inscritos
-        })
+    return render_template('admin/inscribir_estudiantes.html', form=form, catedra=catedra,
+                           resultados=resultados, no_encontrados=no_encontrados)
 
-    return render_template("admin/ver_periodo.html", periodo=periodo, resumen=resumen)
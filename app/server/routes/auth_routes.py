@@ -1,11 +1,10 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
 from flask_login import login_user, logout_user, login_required, current_user
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.server.forms import LoginForm
 from app.controllers import ControllerFactory
 from app.server.forms import RequestResetPasswordForm, PasswordResetForm
-from app.mail import ExpresarteMailer, MailTokenHandler
+from app.mail import get_mailer, MailTokenHandler
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -20,9 +19,9 @@ def login():
         password = form.password.data
 
         controller = ControllerFactory().get_user_controller()
-        user = controller.get_user_model_by_email(email)
+        user = controller.authenticate(email, password)
         
-        if user and check_password_hash(user.password_hash, password):
+        if user:
             login_user(user)
             flash(f"Bienvenido, {user.primer_nombre} 👋", "success")
             return redirect(url_for('main.index'))
@@ -49,8 +48,7 @@ def request_reset_password():
         controller = ControllerFactory().get_user_controller()
         try:
             user = controller.get_user_by_email(email)
-            mailer = ExpresarteMailer(current_app)
-            mailer.send_reset_password(email, user.id)
+            get_mailer().send_reset_password(email, user.id)
         except Exception:
             pass  # No revelamos si el correo existe
 
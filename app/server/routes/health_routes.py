@@ -0,0 +1,43 @@
+"""Endpoints de salud para balanceadores y orquestadores."""
+import os
+import time
+
+from flask import Blueprint, jsonify, current_app
+from sqlalchemy import text
+
+from app.database import db
+
+health_bp = Blueprint('health', __name__)
+
+_INICIO = time.monotonic()
+
+
+@health_bp.route('/healthz')
+def healthz():
+    """Liveness: el proceso responde. No toca la base de datos."""
+    return jsonify({
+        "status": "ok",
+        "version": current_app.config["APP_VERSION"],
+        "pid": os.getpid(),
+        "uptime_s": round(time.monotonic() - _INICIO, 1)
+    })
+
+
+@health_bp.route('/readyz')
+def readyz():
+    """Readiness: la base de datos responde; informa la latencia del ping."""
+    inicio = time.perf_counter()
+    try:
+        db.session.execute(text("SELECT 1"))
+        db.session.rollback()
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"[readyz]: La base de datos no responde: {e}")
+        return jsonify({"status": "error", "db": "down", "error": type(e).__name__, "pid": os.getpid()}), 503
+
+    return jsonify({
+        "status": "ok",
+        "db": "up",
+        "db_ping_ms": round((time.perf_counter() - inicio) * 1000, 2),
+        "pid": os.getpid()
+    })
@@ -3,9 +3,11 @@ from flask import(Blueprint, redirect, url_for, render_template, flash, request,
 from flask_login import login_required, current_user
 
 from app.controllers import ControllerFactory
-from app.server.forms import CalificacionForm, SetCalificacionForm
-from app.database.models import Usuario, CatedraAcademica, Calificacion, PeriodoAcademico
-from app.database.enums import Catedra
+from app.security import requires
+from app.cache import conditional
+from app.server.forms import CalificacionForm, SetCalificacionForm, CalificacionLoteForm
+from app.database.models import Usuario, CatedraAcademica, Calificacion, PeriodoAcademico, Inscripcion
+from app.database.enums import Catedra, Permission
 from app.schemas import CalificacionCreate, CalificacionUpdate
 
 teacher_bp = Blueprint('teacher', __name__, url_prefix='/teachers', template_folder='templates')
@@ -13,11 +15,8 @@ teacher_bp = Blueprint('teacher', __name__, url_prefix='/teachers', template_fol
 # Rutas de la navegación de la app
 @teacher_bp.route('/dashboard')
 @login_required
+@requires(Permission.EDIT_GRADES)
 def dashboard():
-    if not current_user.is_teacher():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     # Cátedras asignadas
     controller = ControllerFactory(current_user=current_user)
     catedra_ctrl = controller.get_profesor_catedra_controller()
@@ -35,11 +34,9 @@ def dashboard():
 
 @teacher_bp.route('/catedra/<nombre>/estudiantes')
 @login_required
+@requires(Permission.EDIT_GRADES)
+@conditional(PeriodoAcademico, CatedraAcademica, Inscripcion, Usuario, Calificacion)
 def ver_estudiantes(nombre):
-    if not current_user.is_teacher():
-        flash("Acceso denegado.", "danger")
-        return redirect(url_for('main.index'))
-
     try:
         catedra_enum = Catedra.from_label(nombre)
     except ValueError:
@@ -49,7 +46,6 @@ def ver_estudiantes(nombre):
     factory = ControllerFactory(current_user=current_user)
     catedra_ctrl = factory.get_profesor_catedra_controller()
     periodo_ctrl = factory.get_periodo_academico_controller()
-    calif_ctrl = factory.get_calificacion_controller()
 
     periodo = periodo_ctrl.get_active_periodo()
     if not periodo:
@@ -63,17 +59,7 @@ def ver_estudiantes(nombre):
         flash("No se encontró la cátedra en este período.", "warning")
         return redirect(url_for('teacher.dashboard'))
 
-    estudiantes = catedra_ctrl.get_students_by_catedra(current_user.id, catedra_enum)
-
-    resumen = []
-    for estudiante in estudiantes:
-        calificacion = calif_ctrl.obtener_calificacion(estudiante.id, catedra_academica.id)
-        resumen.append({
-            "id": estudiante.id,
-            "nombre": f"{estudiante.primer_nombre} {estudiante.primer_apellido}",
-            "calificacion": calificacion.calificacion if calificacion else "Sin registrar",
-            "observaciones": calificacion.observaciones if calificacion else ""
-        })
+    resumen = catedra_ctrl.get_roster_by_catedra_academica(catedra_academica.id)
     form = SetCalificacionForm()
     return render_template('teachers/ver_estudiantes.html',
         estudiantes=resumen,
@@ -85,6 +71,7 @@ def ver_estudiantes(nombre):
 
 @teacher_bp.route('/calificacion/<int:alumno_id>/<int:catedra_id>/<int:periodo_id>/editar', methods=['POST'])
 @login_required
+@requires(Permission.EDIT_GRADES)
 def editar_calificacion(alumno_id, catedra_id, periodo_id):
     form = SetCalificacionForm()
     if form.validate_on_submit():
@@ -117,42 +104,47 @@ def editar_calificacion(alumno_id, catedra_id, periodo_id):
 
 @teacher_bp.route("/asignar-calificaciones/<int:catedra_id>", methods=["GET", "POST"])
 @login_required
+@requires(Permission.EDIT_GRADES)
 def asignar_calificaciones(catedra_id):
     catedra = CatedraAcademica.query.get_or_404(catedra_id)
     if catedra.profesor_id != current_user.id:
         abort(403)
 
-    controller = ControllerFactory().get_calificacion_controller()
-    inscripciones = catedra.inscripciones.filter_by(estado="activo").all()
-    
-    # Crear lista de formularios, uno por estudiante
-    formset = []
-    for inscripcion in inscripciones:
-        form = CalificacionForm()
-        form.alumno_id.data = inscripcion.student.id
-        existente = controller.obtener_calificacion(inscripcion.student, catedra)
-        if existente:
-            form.nota_final.data = existente.nota
-        formset.append((inscripcion.student, form))
-
-    if request.method == "POST":
-        exitos = 0
-        for estudiante, form in formset:
-            form.process(request.form)
-            if form.validate():
-                nota = form.nota_final.data
-                resultado = controller.registrar_nota(
-                    alumno=estudiante,
-                    catedra=catedra,
-                    nota=nota
-                )
-                if resultado:
-                    exitos += 1
-        flash(f"{exitos} nota(s) registradas exitosamente.", "success")
-        return redirect(url_for("teacher.ver_estudiantes", nombre=catedra.catedra))
+    factory = ControllerFactory(current_user=current_user)
+    calif_ctrl = factory.get_calificacion_controller()
+    estudiantes = factory.get_profesor_catedra_controller().get_roster_by_catedra_academica(catedra.id)
+    nombres = {e["id"]: e["nombre"] for e in estudiantes}
+
+    form = CalificacionLoteForm()
+    if form.validate_on_submit():
+        lote = [
+            CalificacionCreate(
+                estudiante_id=int(entrada.alumno_id.data),
+                catedra_academica_id=catedra.id,
+                periodo_id=catedra.periodo_id,
+                calificacion=entrada.nota_final.data,
+                observaciones=entrada.observaciones.data or None
+            )
+            for entrada in form.calificaciones
+            if entrada.alumno_id.data.isdigit() and int(entrada.alumno_id.data) in nombres
+        ]
+        try:
+            registradas = calif_ctrl.registrar_lote(catedra.id, lote)
+            flash(f"{registradas} nota(s) registradas exitosamente.", "success")
+        except Exception as e:
+            flash(f"Error al registrar las calificaciones: {str(e)}", "danger")
+        return redirect(url_for("teacher.ver_estudiantes", nombre=catedra.catedra.value))
+
+    if request.method == "GET":
+        for estudiante in estudiantes:
+            form.calificaciones.append_entry({
+                "alumno_id": estudiante["id"],
+                "nota_final": estudiante["calificacion"],
+                "observaciones": estudiante["observaciones"]
+            })
 
     return render_template("teachers/asignar_calificaciones.html",
-        formset=formset,
+        form=form,
         catedra=catedra,
-        form=form
-    )
\ No newline at end of file
+        nombres=nombres
+    )
@@ -0,0 +1,158 @@
+"""
+Servidor de producción sobre waitress (`flask serve`).
+
+Waitress se configura desde Config (WAITRESS_* y SERVE_*). Con
+SERVE_PROCESSES > 1 (solo POSIX) el proceso principal abre el socket y crea
+N procesos hijos con fork; cada hijo atiende el mismo socket con su propio
+waitress de WAITRESS_THREADS hilos y el kernel reparte las conexiones. El
+padre vuelve a lanzar los hijos que mueren y, con SIGTERM o SIGINT, los
+detiene esperando hasta SERVE_GRACEFUL_TIMEOUT segundos.
+"""
+import os
+import time
+import signal
+import socket
+from typing import Dict, Optional
+
+from app.database import db
+
+
+def opciones_waitress(config) -> Dict:
+    """Parámetros de waitress tomados de la configuración de la app."""
+    opciones = dict(
+        threads=int(config.get("WAITRESS_THREADS", 8)),
+        connection_limit=int(config.get("WAITRESS_CONNECTION_LIMIT", 100)),
+        backlog=int(config.get("WAITRESS_BACKLOG", 1024)),
+        channel_timeout=int(config.get("WAITRESS_CHANNEL_TIMEOUT", 120)),
+        cleanup_interval=int(config.get("WAITRESS_CLEANUP_INTERVAL", 30)),
+        ident=config.get("APP_NAME") or "waitress",
+    )
+    if config.get("WAITRESS_TRUSTED_PROXY"):
+        opciones.update(
+            trusted_proxy=config["WAITRESS_TRUSTED_PROXY"],
+            trusted_proxy_headers={"x-forwarded-for", "x-forwarded-proto", "x-forwarded-host"},
+            clear_untrusted_proxy_headers=True,
+        )
+    return opciones
+
+
+def _crear_socket(host: str, port: int, backlog: int) -> socket.socket:
+    familia = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(familia, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def _terminar(*_):
+    raise SystemExit(0)
+
+
+def _hijo(app, sock: socket.socket, opciones: Dict) -> None:
+    """Proceso hijo: descarta las conexiones heredadas y atiende el socket compartido."""
+    from waitress import serve as waitress_serve
+
+    # waitress cierra ordenadamente (espera las tareas en curso) ante SystemExit
+    signal.signal(signal.SIGTERM, _terminar)
+    signal.signal(signal.SIGINT, _terminar)
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+    codigo = 0
+    try:
+        waitress_serve(app, sockets=[sock], **opciones)
+    except SystemExit:
+        pass
+    except Exception as e:
+        app.logger.error(f"[serve]: El worker {os.getpid()} terminó con error: {e}", exc_info=True)
+        codigo = 1
+    finally:
+        os._exit(codigo)
+
+
+def serve(app, host: Optional[str] = None, port: Optional[int] = None,
+          procesos: Optional[int] = None, hilos: Optional[int] = None) -> None:
+    """Atiende la app con waitress en uno o varios procesos."""
+    from waitress import serve as waitress_serve
+
+    host = host or app.config.get("SERVE_HOST", "0.0.0.0")
+    port = int(port or app.config.get("PORT") or 5001)
+    procesos = int(procesos or app.config.get("SERVE_PROCESSES", 1))
+    opciones = opciones_waitress(app.config)
+    if hilos:
+        opciones["threads"] = hilos
+
+    if procesos > 1 and not hasattr(os, "fork"):
+        app.logger.warning("[serve]: fork no disponible en esta plataforma; se usa un solo proceso")
+        procesos = 1
+    if procesos <= 1:
+        app.logger.info(f"[serve]: Escuchando en {host}:{port} con {opciones['threads']} hilos")
+        waitress_serve(app, host=host, port=port, **opciones)
+        return
+
+    sock = _crear_socket(host, port, opciones["backlog"])
+    with app.app_context():
+        db.engine.dispose()  # que los hijos no hereden conexiones abiertas
+
+    hijos: Dict[int, float] = {}
+    terminando = []
+
+    def lanzar():
+        pid = os.fork()
+        if pid == 0:
+            _hijo(app, sock, opciones)
+        hijos[pid] = time.monotonic()
+
+    def detener(signum, _frame):
+        terminando.append(signum)
+
+    signal.signal(signal.SIGTERM, detener)
+    signal.signal(signal.SIGINT, detener)
+
+    for _ in range(procesos):
+        lanzar()
+    app.logger.info(f"[serve]: Escuchando en {host}:{port} con {procesos} procesos "
+                    f"de {opciones['threads']} hilos (pids {sorted(hijos)})")
+
+    while not terminando:
+        pid, estado = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            time.sleep(0.5)
+            continue
+        inicio = hijos.pop(pid, None)
+        if inicio is None or terminando:
+            continue
+        app.logger.warning(f"[serve]: El worker {pid} terminó (estado {estado}); se relanza")
+        if time.monotonic() - inicio < 5:
+            time.sleep(1)  # evita relanzar en bucle un worker que falla al arrancar
+        lanzar()
+
+    _detener_hijos(app, hijos, float(app.config.get("SERVE_GRACEFUL_TIMEOUT", 30)))
+    sock.close()
+
+
+def _detener_hijos(app, hijos: Dict[int, float], timeout: float) -> None:
+    """Envía SIGTERM a los hijos y espera; a los que no terminan a tiempo, SIGKILL."""
+    for pid in list(hijos):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            hijos.pop(pid, None)
+
+    limite = time.monotonic() + timeout
+    while hijos and time.monotonic() < limite:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            hijos.clear()
+            break
+        if pid:
+            hijos.pop(pid, None)
+        else:
+            time.sleep(0.1)
+
+    for pid in list(hijos):
+        app.logger.warning(f"[serve]: El worker {pid} no terminó a tiempo; se fuerza")
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
@@ -0,0 +1,126 @@
+"""Comandos de la CLI de Flask (`flask --app run.py <comando>`)."""
+import signal
+import threading
+
+import click
+
+from app.controllers import ControllerFactory
+from app.database.enums import Role
+
+
+def register_commands(app):
+    """Registra los comandos personalizados en la CLI de la app."""
+
+    @app.cli.command("bootstrap")
+    def bootstrap():
+        """Crea las tablas que falten y el super admin inicial."""
+        from app.config import bootstrap_database
+        resultado = bootstrap_database()
+        click.echo("Bootstrap completado." if resultado else "Bootstrap completado con advertencias (ver log).")
+
+    @app.cli.command("serve")
+    @click.option("--host", default=None, help="Interfaz (SERVE_HOST).")
+    @click.option("--port", default=None, type=int, help="Puerto (PORT).")
+    @click.option("--procesos", default=None, type=int, help="Procesos con fork (SERVE_PROCESSES).")
+    @click.option("--hilos", default=None, type=int, help="Hilos por proceso (WAITRESS_THREADS).")
+    def serve(host, port, procesos, hilos):
+        """Sirve la app en producción con waitress."""
+        from app.server.serve import serve as servir
+        servir(app, host=host, port=port, procesos=procesos, hilos=hilos)
+
+    @app.cli.command("seed")
+    def seed():
+        """Carga el seed académico de prueba."""
+        from app.config import seed_database
+        click.echo("Seed cargado." if seed_database() else "El seed no se aplicó (¿ya estaba cargado?).")
+
+    @app.cli.command("replicar")
+    @click.option("--paginas", default=1024, show_default=True, help="Páginas copiadas por paso.")
+    def replicar(paginas):
+        """Copia la base SQLite principal sobre la réplica (SQLALCHEMY_REPLICA_URI)."""
+        from app.database import copiar_a_replica
+        destino = app.config.get("SQLALCHEMY_REPLICA_URI")
+        if not destino:
+            raise click.ClickException("SQLALCHEMY_REPLICA_URI no está definida.")
+        try:
+            duracion = copiar_a_replica(app.config["SQLALCHEMY_DATABASE_URI"], destino, paginas=paginas)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Réplica actualizada en {duracion * 1000:.0f} ms.")
+
+    @app.cli.command("reconciliar-cupos")
+    def reconciliar_cupos():
+        """Recalcula el contador de inscritos de cada cátedra."""
+        corregidas = ControllerFactory().get_inscripcion_controller().reconciliar_cupos()
+        click.echo(f"Cátedras corregidas: {corregidas}")
+
+    @app.cli.command("importar-usuarios")
+    @click.argument("archivo", type=click.File("r", encoding="utf-8-sig"))
+    @click.option("--rol", default="student", type=click.Choice(["student", "teacher"]),
+                  help="Rol por defecto si el CSV no trae la columna role.")
+    @click.option("--bloque", default=500, show_default=True, help="Filas por bloque.")
+    @click.option("--procesos", default=None, type=int, help="Procesos para hashear contraseñas.")
+    @click.option("--dry-run", is_flag=True, help="Solo valida y reporta, sin escribir.")
+    def importar_usuarios(archivo, rol, bloque, procesos, dry_run):
+        """Importa estudiantes o profesores desde un archivo CSV."""
+        reporte = ControllerFactory().get_user_controller().importar_usuarios_csv(
+            archivo, role=rol, chunk_size=bloque, workers=procesos, dry_run=dry_run
+        )
+        accion = "a crear" if reporte.dry_run else "creados"
+        click.echo(f"Filas: {reporte.total} | {accion}: {reporte.creados} | "
+                   f"duplicados: {len(reporte.duplicados)} | inválidos: {len(reporte.invalidos)}")
+        for item in reporte.duplicados + reporte.invalidos:
+            click.echo(f"  fila {item.fila} ({item.email or '-'}): {item.error}")
+
+    @app.cli.command("procesar-correos")
+    @click.option("--hilos", default=None, type=int, help="Envíos en paralelo (MAIL_OUTBOX_THREADS).")
+    @click.option("--una-vez", is_flag=True, help="Envía los correos vencidos y termina.")
+    def procesar_correos(hilos, una_vez):
+        """Envía los correos de la bandeja de salida hasta recibir SIGINT/SIGTERM."""
+        from app.mail import OutboxWorker
+        worker = OutboxWorker.desde_config(app, hilos=hilos)
+        if una_vez:
+            click.echo(f"Correos procesados: {worker.procesar_pendientes()}")
+            return
+
+        fin = threading.Event()
+        for senal in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(senal, lambda *_: fin.set())
+        worker.iniciar()
+        click.echo(f"Procesando correos con {worker.hilos} hilos (Ctrl+C para terminar)...")
+        fin.wait()
+        click.echo("Terminando envíos en curso...")
+        worker.detener()
+
+    @app.cli.command("reintentar-correos")
+    def reintentar_correos():
+        """Vuelve a encolar los correos que agotaron sus reintentos."""
+        from app.mail import reintentar_fallidos
+        click.echo(f"Correos reencolados: {reintentar_fallidos()}")
+
+    @app.cli.command("notificar")
+    @click.argument("evento", type=click.Choice(["periodo-activado", "calificaciones"]))
+    @click.argument("periodo_id", type=int)
+    @click.option("--lote", default=None, type=int, help="Mensajes por conexión SMTP (MAIL_BULK_BATCH_SIZE).")
+    @click.option("--ritmo", default=None, type=float, help="Mensajes por segundo (MAIL_BULK_RATE).")
+    def notificar(evento, periodo_id, lote, ritmo):
+        """Envía en bloque el aviso de período activado (profesores) o de calificaciones (estudiantes)."""
+        from app.mail import get_mailer
+
+        periodo_ctrl = ControllerFactory().get_periodo_academico_controller()
+        periodo = periodo_ctrl.obtener_periodo(periodo_id)
+        mailer = get_mailer()
+
+        if evento == "periodo-activado":
+            destinatarios = periodo_ctrl.contactos_periodo(periodo_id, Role.TEACHER)
+            enviar = mailer.send_period_activated
+        else:
+            destinatarios = periodo_ctrl.contactos_periodo(periodo_id, Role.STUDENT)
+            enviar = mailer.send_grades_published
+
+        resultados = enviar(periodo.nombre, destinatarios, batch_size=lote, rate=ritmo)
+        fallidos = [r for r in resultados if not r.enviado]
+        click.echo(f"Destinatarios: {len(resultados)} | enviados: {len(resultados) - len(fallidos)} | "
+                   f"fallidos: {len(fallidos)}")
+        for r in fallidos:
+            click.echo(f"  {r.email}: {r.error}")
@@ -1,12 +1,12 @@
+import click
 from flask_wtf import CSRFProtect
 from flask_login import LoginManager
-from flask_migrate import Migrate
 
 from app.database import db
 from app.database.models import Usuario
+from app.security import get_user_cache
 
 login_manager = LoginManager()
-migrate = Migrate()
 csrf = CSRFProtect()
 
 def init_login_manager(app):
@@ -18,14 +18,40 @@ def init_login_manager(app):
 
     @login_manager.user_loader
     def load_user(user_id):
-        """Función que carga un usuario por su ID."""
+        """Función que carga un usuario por su ID, desde la caché si está activa."""
+        cache = get_user_cache()
+        if cache is not None:
+            return cache.cargar(int(user_id))
         return db.session.get(Usuario, int(user_id))
 
     return login_manager
 
+class _GrupoMigraciones(click.Group):
+    """Grupo `flask db` que inicializa Flask-Migrate recién cuando se invoca."""
+
+    def __init__(self, cargar):
+        super().__init__("db", help="Migraciones de la base de datos (Flask-Migrate).")
+        self._cargar = cargar
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self._cargar().make_context(info_name, args, parent=parent, **extra)
+
 def init_migrate(app, db):
-    """Función que inicializa la extensión Migrate."""
-    migrate.init_app(app, db)
+    """
+    Función que inicializa la extensión Migrate. Alembic tarda en importarse y
+    solo lo usa `flask db`, así que con LAZY_MIGRATE se registra un grupo `db`
+    que carga Flask-Migrate al invocarse y los workers web no lo importan.
+    """
+    def cargar():
+        from flask_migrate import Migrate
+        if "migrate" not in app.extensions:
+            Migrate().init_app(app, db)
+        return app.cli.commands["db"]
+
+    if app.config.get("LAZY_MIGRATE", True):
+        app.cli.add_command(_GrupoMigraciones(cargar))
+    else:
+        cargar()
 
 def init_csrf(app):
     """Función que inicializa la extensión CSRFProtect."""
@@ -1,12 +1,27 @@
+import time
 from flask import Flask
+from werkzeug.local import LocalProxy
 from datetime import datetime
 
-from app.config import Config, create_initial_super_admin
+from app.config import Config, bootstrap_database, seed_database
 from app.server.routes import register_blueprints
 from app.server.server_extensions import init_login_manager, init_migrate, init_csrf
+from app.server.server_commands import register_commands
 from app.database import db, init_db
+from app.security import init_password_policy, init_user_cache
+from app.cache import init_cache, init_template_cache
+from app.mail import init_mailer
+
+def _rss_max_mb() -> float:
+    """Memoria residente máxima del proceso en MB (0 si no se puede medir)."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
 def create_app():
+    inicio = time.perf_counter()
     app = Flask(__name__,
                 template_folder='../templates',
                 static_folder='../static')
@@ -14,17 +29,24 @@ def create_app():
     app.config.from_object(Config)
 
     init_db(app)
+    init_password_policy(app)
+    init_user_cache(app)
+    init_cache(app)
+    init_template_cache(app)
+    init_mailer(app)
     init_migrate(app, db)
     init_csrf(app)
     init_login_manager(app)
     register_blueprints(app)
+    register_commands(app)
 
-    with app.app_context():
-        db.create_all()
-        create_initial_super_admin()
-        if app.config.get("DEBUG", False):
-            from app.seeds.academico_seed import generar_seed_academico
-            generar_seed_academico()
+    # Tablas, super admin y seed: `flask bootstrap` / `flask seed`.
+    # AUTO_BOOTSTRAP (activo por defecto solo en DEBUG) los ejecuta aquí.
+    if app.config.get("AUTO_BOOTSTRAP", False):
+        with app.app_context():
+            bootstrap_database()
+            if app.config.get("DEBUG", False):
+                seed_database()
 
     @app.context_processor
     def inject_app_name():
@@ -32,7 +54,9 @@ def create_app():
             "app_name": app.config["APP_NAME"],
             "app_version": app.config["APP_VERSION"],
             "server_language": app.config["LANGUAGE"],
-            "now": datetime.now() 
+            "now": LocalProxy(datetime.now)  # se evalúa solo si la plantilla lo usa
             }
 
+    app.config["STARTUP_MS"] = (time.perf_counter() - inicio) * 1000
+    app.logger.info(f"App creada en {app.config['STARTUP_MS']:.0f} ms (RSS máx. {_rss_max_mb():.1f} MB)")
     return app
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""Benchmark del arranque en frío de un worker.
+
+Lanza N procesos nuevos por configuración, cada uno importa la app y llama a
+`create_app()`, y reporta la mediana de:
+  - total: tiempo de pared del proceso (intérprete + imports + create_app);
+  - create_app: lo que mide la propia app (STARTUP_MS);
+  - RSS: memoria residente máxima del proceso;
+  - qué módulos pesados quedaron cargados (flask_mail, jwt, alembic).
+
+Configuraciones:
+  - antes: tablas, super admin y seed en create_app, Flask-Migrate y
+    correo cargados siempre (comportamiento anterior, en DEBUG);
+  - bootstrap: tablas y super admin en create_app, sin seed;
+  - rápido: nada de eso en create_app (`flask bootstrap` aparte),
+    correo y Flask-Migrate al primer uso.
+
+Uso:
+    python benchmarks/bench_arranque.py [--procesos 5]
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+HIJO = """
+import json, resource, sys
+from app.server import create_app
+app = create_app()
+print(json.dumps({
+    "create_app": app.config["STARTUP_MS"],
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modulos": [m for m in ("flask_mail", "jwt", "alembic") if m in sys.modules],
+}))
+"""
+
+CONFIGURACIONES = {
+    "antes": {"AUTO_BOOTSTRAP": "True", "DEBUG": "1", "LAZY_MIGRATE": "False", "MAIL_PRERENDER": "True"},
+    "bootstrap": {"AUTO_BOOTSTRAP": "True", "DEBUG": "", "LAZY_MIGRATE": "True", "MAIL_PRERENDER": "True"},
+    "rápido": {"AUTO_BOOTSTRAP": "False", "DEBUG": "", "LAZY_MIGRATE": "True", "MAIL_PRERENDER": "False"},
+}
+
+
+def lanzar(entorno):
+    inicio = time.perf_counter()
+    salida = subprocess.run([sys.executable, "-c", HIJO], cwd=ROOT, env=entorno,
+                            capture_output=True, text=True, check=True).stdout
+    datos = json.loads(salida.strip().splitlines()[-1])
+    datos["total"] = (time.perf_counter() - inicio) * 1000
+    return datos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, default=5)
+    args = parser.parse_args()
+
+    base = os.path.join(tempfile.mkdtemp(prefix="expresarte-arranque-"), "arranque.db")
+    comun = dict(os.environ, SQLALCHEMY_DATABASE_URI=f"sqlite:///{base}", MAIL_OUTBOX_WORKER="cli")
+    # Base ya inicializada, como en un despliegue que ejecutó `flask bootstrap`
+    lanzar(dict(comun, **CONFIGURACIONES["antes"]))
+
+    print(f"mediana de {args.procesos} procesos\n")
+    print(f"{'configuración':<14}{'total (ms)':>12}{'create_app (ms)':>17}{'RSS (MB)':>10}  módulos pesados")
+    for nombre, config in CONFIGURACIONES.items():
+        corridas = [lanzar(dict(comun, **config)) for _ in range(args.procesos)]
+        mediana = {clave: statistics.median(c[clave] for c in corridas) for clave in ("total", "create_app", "rss")}
+        print(f"{nombre:<14}{mediana['total']:>12.0f}{mediana['create_app']:>17.0f}{mediana['rss']:>10.1f}  "
+              f"{', '.join(corridas[0]['modulos']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
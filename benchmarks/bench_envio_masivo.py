@@ -0,0 +1,107 @@
+"""Benchmark del envío masivo de correos contra un servidor SMTP local.
+
+Compara, para N destinatarios:
+  - individual: `render_template` + `Mail.send` por destinatario (una
+    conexión SMTP y un render por mensaje);
+  - masivo: `ExpresarteMailer.send_bulk` (un render y una conexión por lote).
+Además comprueba que un destinatario rechazado no corta el lote y que el
+límite de mensajes por segundo se respeta.
+
+Uso:
+    python benchmarks/bench_envio_masivo.py [--destinatarios 500] [--lote 50] [--ritmo 100]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from smtp_prueba import ServidorSMTP  # noqa: E402
+
+smtp = ServidorSMTP()
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-masivo-")
+os.environ.update({
+    "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(_tmpdir, 'masivo.db')}",
+    "DEBUG": "",
+    "MAIL_SERVER": "127.0.0.1",
+    "MAIL_PORT": str(smtp.puerto),
+    "MAIL_USE_SSL": "False",
+    "MAIL_USE_TLS": "False",
+    "MAIL_USERNAME": "",
+    "MAIL_OUTBOX_WORKER": "cli",
+})
+
+from flask_mail import Message  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.mail import get_mailer  # noqa: E402
+
+REMITENTE = ("Expresarte", "no-responder@example.com")
+
+
+def destinatarios(n):
+    return [{"email": f"estudiante{i}@example.com", "nombre": f"Estudiante <{i}>"} for i in range(n)]
+
+
+def individual(mailer, lista):
+    for datos in lista:
+        html = mailer.render_template("calificaciones_publicadas.html", periodo="2026-I", link="http://x", **datos)
+        mailer.mail.send(Message(subject="Calificaciones", recipients=[datos["email"]], html=html, sender=REMITENTE))
+
+
+def masivo(mailer, lista, lote, ritmo=0):
+    return mailer.send_bulk("Calificaciones", lista, "calificaciones_publicadas.html",
+                            {"periodo": "2026-I", "link": "http://x"}, sender=REMITENTE,
+                            batch_size=lote, rate=ritmo)
+
+
+def medir(nombre, fn):
+    smtp.reiniciar()
+    inicio = time.perf_counter()
+    resultado = fn()
+    duracion = time.perf_counter() - inicio
+    recibidos = len(smtp.recibidos())
+    print(f"{nombre:<28}{duracion * 1000:>10.0f} ms{recibidos / duracion:>10.0f} msg/s"
+          f"{recibidos:>10}{smtp.conexiones:>12}")
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--destinatarios", type=int, default=500)
+    parser.add_argument("--lote", type=int, default=50)
+    parser.add_argument("--ritmo", type=float, default=100, help="msg/s para la prueba de límite")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        mailer = get_mailer()
+        lista = destinatarios(args.destinatarios)
+
+        print(f"{'camino':<28}{'total':>13}{'ritmo':>14}{'recibidos':>10}{'conexiones':>12}")
+        medir("individual", lambda: individual(mailer, lista))
+        resultados = medir("masivo", lambda: masivo(mailer, lista, args.lote))
+        assert all(r.enviado for r in resultados)
+        assert "Estudiante &lt;7&gt;" in smtp.recibidos()[7].decode("utf-8", "replace")
+
+        smtp.rechazar_destinatarios = "estudiante3@"
+        resultados = masivo(mailer, lista[:10], args.lote)
+        smtp.rechazar_destinatarios = None
+        fallidos = [r for r in resultados if not r.enviado]
+        assert [r.email for r in fallidos] == ["estudiante3@example.com"], fallidos
+        print(f"\nrechazo por destinatario: 9/10 enviados; {fallidos[0].email}: {fallidos[0].error}")
+
+        n = int(args.ritmo)
+        inicio = time.perf_counter()
+        masivo(mailer, lista[:n], args.lote, ritmo=args.ritmo)
+        duracion = time.perf_counter() - inicio
+        assert duracion >= (n - 1) / args.ritmo * 0.95, duracion
+        print(f"límite {args.ritmo:.0f} msg/s: {n} mensajes en {duracion:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
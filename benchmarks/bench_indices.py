@@ -0,0 +1,181 @@
+"""Benchmark de las consultas principales de los controladores con y sin índices.
+
+Crea una base SQLite temporal con un volumen realista (≈20k estudiantes,
+8 períodos, ≈65k inscripciones), mide cada consulta sin los índices del
+modelo y luego con ellos.
+
+Uso:
+    python benchmarks/bench_indices.py [--estudiantes 20000] [--repeticiones 200]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import date, datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-bench-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = ""
+os.environ["CACHE_BACKEND"] = "none"  # se miden las consultas, no la caché
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.config import bootstrap_database  # noqa: E402
+from app.database import db  # noqa: E402
+from app.database.models import (  # noqa: E402
+    Usuario, PeriodoAcademico, CatedraAcademica, Inscripcion, Calificacion
+)
+from app.database.enums import Role, Sexo, Catedra, EstadoInscripcion, Calificacion as Nota  # noqa: E402
+from app.controllers import ControllerFactory  # noqa: E402
+
+
+def sembrar(estudiantes: int, profesores: int = 400, periodos: int = 8, catedras_por_periodo: int = 150):
+    """Inserta datos sintéticos con inserciones masivas."""
+    rnd = random.Random(42)
+    apellidos = [f"Apellido{i:04d}" for i in range(3000)]
+    ahora = datetime.utcnow()
+
+    usuarios = [{
+        "email": f"profesor{i}@bench-expresarte.com", "password_hash": "x", "primer_nombre": f"Profe{i}",
+        "primer_apellido": rnd.choice(apellidos), "sexo": Sexo.NO_APLICA, "role": Role.TEACHER,
+        "activo": True, "fecha_creacion": ahora
+    } for i in range(profesores)]
+    usuarios += [{
+        "email": f"alumno{i}@bench-expresarte.com", "password_hash": "x", "primer_nombre": f"Alumno{i}",
+        "primer_apellido": rnd.choice(apellidos), "sexo": Sexo.NO_APLICA, "role": Role.STUDENT,
+        "activo": rnd.random() > 0.1, "fecha_creacion": ahora
+    } for i in range(estudiantes)]
+    db.session.execute(insert(Usuario), usuarios)
+
+    profesor_ids = [i + 2 for i in range(profesores)]  # el id 1 es el super admin
+    estudiante_ids = [i + 2 + profesores for i in range(estudiantes)]
+
+    db.session.execute(insert(PeriodoAcademico), [{
+        "nombre": f"{2018 + p // 2}-{'I' if p % 2 == 0 else 'II'}",
+        "fecha_inicio": date(2018 + p // 2, 1 if p % 2 == 0 else 7, 1),
+        "fecha_fin": date(2018 + p // 2, 6 if p % 2 == 0 else 12, 15),
+        "activo": p == periodos - 1
+    } for p in range(periodos)])
+
+    combinaciones = [(c, g) for c in Catedra for g in "ABCDEFGHIJKLMNOP"]
+    catedras = []
+    for periodo_id in range(1, periodos + 1):
+        for catedra, grupo in rnd.sample(combinaciones, catedras_por_periodo):
+            catedras.append({
+                "profesor_id": rnd.choice(profesor_ids), "catedra": catedra,
+                "periodo_id": periodo_id, "grupo": grupo, "cupos": 40
+            })
+    db.session.execute(insert(CatedraAcademica), catedras)
+
+    inscripciones, calificaciones = [], []
+    for periodo_id in range(1, periodos + 1):
+        ids_periodo = [periodo_id * catedras_por_periodo - i for i in range(catedras_por_periodo)]
+        for estudiante_id in rnd.sample(estudiante_ids, min(4000, estudiantes)):
+            for catedra_id in rnd.sample(ids_periodo, 2):
+                inscripciones.append({
+                    "estudiante_id": estudiante_id, "catedra_academica_id": catedra_id,
+                    "periodo_id": periodo_id, "estado": rnd.choice(list(EstadoInscripcion)[:3]),
+                    "fecha_inscripcion": ahora
+                })
+                if rnd.random() < 0.6:
+                    calificaciones.append({
+                        "estudiante_id": estudiante_id, "catedra_academica_id": catedra_id,
+                        "periodo_id": periodo_id, "calificacion": rnd.choice(list(Nota)),
+                        "observaciones": "", "fecha": ahora
+                    })
+    db.session.execute(insert(Inscripcion), inscripciones)
+    db.session.execute(insert(Calificacion), calificaciones)
+    db.session.commit()
+
+    return profesor_ids, estudiante_ids, len(catedras), len(inscripciones), len(calificaciones)
+
+
+def indices_del_modelo():
+    return [ix for tabla in db.metadata.sorted_tables for ix in tabla.indexes]
+
+
+def consultas(factory: ControllerFactory, estudiante_ids, total_catedras, periodos):
+    rnd = random.Random(7)
+    user_ctrl = factory.get_user_controller()
+    periodo_ctrl = factory.get_periodo_academico_controller()
+    insc_ctrl = factory.get_inscripcion_controller()
+    calif_ctrl = factory.get_calificacion_controller()
+    prof_ctrl = factory.get_profesor_catedra_controller()
+
+    def catedra():
+        return db.session.get(CatedraAcademica, rnd.randint(1, total_catedras))
+
+    def resumen():
+        periodo_ctrl.resumen_periodo(rnd.randint(1, periodos))
+
+    def catedra_de_profesor():
+        ca = catedra()
+        prof_ctrl.get_catedra_academica(ca.profesor_id, ca.catedra, ca.periodo_id)
+
+    return {
+        "contar_estudiantes_en_catedra": lambda: insc_ctrl.contar_estudiantes_en_catedra(rnd.randint(1, total_catedras)),
+        "resumen_periodo": resumen,
+        "get_roster_by_catedra_academica": lambda: prof_ctrl.get_roster_by_catedra_academica(rnd.randint(1, total_catedras)),
+        "get_users_page (estudiantes)": lambda: user_ctrl.get_users_page(role=Role.STUDENT, only_active=True),
+        "get_active_periodo": periodo_ctrl.get_active_periodo,
+        "obtener_calificacion": lambda: calif_ctrl.obtener_calificacion(rnd.choice(estudiante_ids), rnd.randint(1, total_catedras)),
+        "listar_por_alumno": lambda: insc_ctrl.listar_por_alumno(rnd.choice(estudiante_ids)),
+        "get_catedra_academica": catedra_de_profesor,
+    }
+
+
+def medir(funciones, repeticiones):
+    resultados = {}
+    for nombre, fn in funciones.items():
+        fn()  # calentamiento
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            fn()
+        resultados[nombre] = (time.perf_counter() - inicio) / repeticiones * 1000
+        db.session.remove()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--estudiantes", type=int, default=20000)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        bootstrap_database()  # tablas y super admin (id 1)
+        print("Sembrando base de datos...")
+        _, estudiante_ids, total_catedras, total_insc, total_calif = sembrar(args.estudiantes)
+        print(f"  usuarios={len(estudiante_ids)} cátedras={total_catedras} "
+              f"inscripciones={total_insc} calificaciones={total_calif}")
+
+        indices = indices_del_modelo()
+        with db.engine.begin() as conn:
+            for ix in indices:
+                conn.execute(text(f"DROP INDEX IF EXISTS {ix.name}"))
+            conn.execute(text("ANALYZE"))
+
+        factory = ControllerFactory(current_user=None)
+        antes = medir(consultas(factory, estudiante_ids, total_catedras, 8), args.repeticiones)
+
+        with db.engine.begin() as conn:
+            for ix in indices:
+                ix.create(conn, checkfirst=True)
+            conn.execute(text("ANALYZE"))
+
+        despues = medir(consultas(factory, estudiante_ids, total_catedras, 8), args.repeticiones)
+
+    print(f"\n{'consulta':<36}{'sin índices (ms)':>18}{'con índices (ms)':>18}{'mejora':>10}")
+    for nombre in antes:
+        print(f"{nombre:<36}{antes[nombre]:>18.3f}{despues[nombre]:>18.3f}{antes[nombre] / despues[nombre]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
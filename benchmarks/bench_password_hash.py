@@ -0,0 +1,56 @@
+"""Micro-benchmark de la política de contraseñas.
+
+Mide el costo de hashear y verificar una contraseña con distintas
+combinaciones de algoritmo y costo, para elegir PASSWORD_HASH_ALGORITHM y
+PASSWORD_HASH_COST según la CPU de cada despliegue.
+
+Uso:
+    python benchmarks/bench_password_hash.py [--repeticiones 5] [scrypt:16384 pbkdf2:600000 ...]
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from app.security.password_policy import PasswordPolicy  # noqa: E402
+
+CONFIGURACIONES = [
+    "scrypt",
+    "scrypt:16384",
+    "scrypt:8192",
+    "pbkdf2",
+    "pbkdf2:600000",
+    "pbkdf2:260000",
+]
+
+
+def medir(fn, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        fn()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("configuraciones", nargs="*", default=CONFIGURACIONES,
+                        help="algoritmo[:costo], por ejemplo scrypt:16384 o pbkdf2:600000")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    password = "clave-de-prueba-123"
+    print(f"{'método':<28}{'hash (ms)':>12}{'verificar (ms)':>16}{'logins/s/núcleo':>18}")
+    for config in args.configuraciones:
+        algoritmo, _, costo = config.partition(":")
+        policy = PasswordPolicy(algoritmo, costo or None)
+        guardado = policy.hash(password)
+        t_hash = medir(lambda: policy.hash(password), args.repeticiones)
+        t_verificar = medir(lambda: policy.verify(guardado, password), args.repeticiones)
+        print(f"{policy.method:<28}{t_hash:>12.1f}{t_verificar:>16.1f}{1000 / t_verificar:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
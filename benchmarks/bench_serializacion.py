@@ -0,0 +1,90 @@
+"""Benchmark de la conversión masiva de filas ORM a UserResponse.
+
+Carga N usuarios de una base SQLite temporal y compara el costo por fila de:
+  - por fila: `_to_response` en un bucle (implementación anterior)
+  - TypeAdapter: `_bulk_to_response` con validación de la lista completa
+  - confiable: `_bulk_to_response(..., trusted=True)` con `model_construct`
+
+Uso:
+    python benchmarks/bench_serializacion.py [--usuarios 10000] [--repeticiones 5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+from datetime import date, datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-bench-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ["DEBUG"] = ""
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.database import db  # noqa: E402
+from app.database.models import Usuario  # noqa: E402
+from app.database.enums import Role, Sexo  # noqa: E402
+from app.controllers import ControllerFactory  # noqa: E402
+from app.schemas import UserResponse  # noqa: E402
+
+
+def sembrar(usuarios: int):
+    ahora = datetime.utcnow()
+    db.session.execute(insert(Usuario), [{
+        "email": f"usuario{i}@bench-expresarte.com", "password_hash": "x",
+        "primer_nombre": f"Nombre{i}", "segundo_nombre": None if i % 3 else f"Segundo{i}",
+        "primer_apellido": f"Apellido{i % 977}", "sexo": Sexo.NO_APLICA,
+        "role": Role.STUDENT, "activo": True, "fecha_creacion": ahora,
+        "fecha_nacimiento": date(2000 + i % 20, 1 + i % 12, 1 + i % 28)
+    } for i in range(usuarios)])
+    db.session.commit()
+
+
+def medir(fn, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=10000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        sembrar(args.usuarios)
+        ctrl = ControllerFactory(current_user=None).get_user_controller()
+        filas = db.session.query(Usuario).all()
+        n = len(filas)
+
+        caminos = {
+            "por fila (_to_response)": lambda: [ctrl._to_response(u, UserResponse) for u in filas],
+            "TypeAdapter": lambda: ctrl._bulk_to_response(filas, UserResponse),
+            "confiable (model_construct)": lambda: ctrl._bulk_to_response(filas, UserResponse, trusted=True),
+        }
+
+        referencia = [r.model_dump() for r in caminos["por fila (_to_response)"]()]
+        for nombre, fn in caminos.items():
+            assert [r.model_dump() for r in fn()] == referencia, f"{nombre} no coincide con la referencia"
+
+        tiempos = {nombre: medir(fn, args.repeticiones) for nombre, fn in caminos.items()}
+
+    base = tiempos["por fila (_to_response)"]
+    print(f"{n} usuarios, mejor de {args.repeticiones}\n")
+    print(f"{'camino':<30}{'total (ms)':>12}{'por fila (µs)':>16}{'mejora':>10}")
+    for nombre, t in tiempos.items():
+        print(f"{nombre:<30}{t * 1000:>12.1f}{t / n * 1e6:>16.2f}{base / t:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Prueba de carga local de `flask serve` (waitress) con distinto número de procesos.
+
+Para cada cantidad de procesos levanta `flask serve` sobre una base SQLite
+temporal, espera a /readyz y lanza clientes HTTP concurrentes (keep-alive)
+contra una ruta durante unos segundos. Reporta peticiones por segundo y
+latencias p50/p95, y cuántos workers distintos respondieron.
+
+El cliente corre en la misma máquina: en equipos con pocos núcleos compite
+por CPU con el servidor y la escala observada es menor que la real.
+
+Uso:
+    python benchmarks/bench_serve.py [--procesos 1 2 4] [--hilos 4] [--clientes 16]
+                                     [--segundos 5] [--ruta /auth/login]
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import argparse
+import tempfile
+import threading
+import statistics
+import subprocess
+import http.client
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def esperar_listo(puerto, limite=30.0):
+    fin = time.monotonic() + limite
+    while time.monotonic() < fin:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", puerto, timeout=1)
+            conn.request("GET", "/readyz")
+            respuesta = conn.getresponse()
+            cuerpo = json.loads(respuesta.read())
+            if respuesta.status == 200:
+                return cuerpo
+        except (OSError, ValueError):
+            time.sleep(0.2)
+    raise RuntimeError("El servidor no respondió a /readyz")
+
+
+def cliente(puerto, ruta, fin, latencias, pids):
+    conn = http.client.HTTPConnection("127.0.0.1", puerto, timeout=10)
+    while time.monotonic() < fin:
+        inicio = time.perf_counter()
+        try:
+            conn.request("GET", ruta)
+            respuesta = conn.getresponse()
+            respuesta.read()
+        except OSError:
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", puerto, timeout=10)
+            continue
+        if respuesta.status < 500:
+            latencias.append(time.perf_counter() - inicio)
+    conn.close()
+    # Qué workers atendieron (cada conexión nueva puede caer en otro proceso)
+    for _ in range(8):
+        c = http.client.HTTPConnection("127.0.0.1", puerto, timeout=5)
+        c.request("GET", "/healthz")
+        pids.add(json.loads(c.getresponse().read())["pid"])
+        c.close()
+
+
+def medir(entorno, procesos, hilos, clientes, segundos, ruta):
+    puerto = puerto_libre()
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "flask", "serve", "--host", "127.0.0.1", "--port", str(puerto),
+         "--procesos", str(procesos), "--hilos", str(hilos)],
+        cwd=ROOT, env=entorno, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        listo = esperar_listo(puerto)
+        latencias, pids = [], set()
+        fin = time.monotonic() + segundos
+        hilos_cliente = [threading.Thread(target=cliente, args=(puerto, ruta, fin, latencias, pids))
+                         for _ in range(clientes)]
+        for h in hilos_cliente:
+            h.start()
+        for h in hilos_cliente:
+            h.join()
+    finally:
+        servidor.send_signal(signal.SIGTERM)
+        servidor.wait(timeout=60)
+
+    latencias.sort()
+    return {
+        "rps": len(latencias) / segundos,
+        "p50": statistics.median(latencias) * 1000,
+        "p95": latencias[int(len(latencias) * 0.95)] * 1000,
+        "workers": len(pids),
+        "ping": listo["db_ping_ms"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--hilos", type=int, default=4)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--segundos", type=float, default=5)
+    parser.add_argument("--ruta", default="/auth/login")
+    args = parser.parse_args()
+
+    base = os.path.join(tempfile.mkdtemp(prefix="expresarte-serve-"), "serve.db")
+    entorno = dict(os.environ, SQLALCHEMY_DATABASE_URI=f"sqlite:///{base}", DEBUG="",
+                   FLASK_APP=os.path.join(ROOT, "run.py"), MAIL_OUTBOX_WORKER="cli")
+    subprocess.run([sys.executable, "-m", "flask", "bootstrap"], cwd=ROOT, env=entorno,
+                   check=True, capture_output=True)
+
+    print(f"{args.ruta}, {args.clientes} clientes, {args.hilos} hilos por proceso, "
+          f"{args.segundos:.0f} s, {os.cpu_count()} CPU\n")
+    print(f"{'procesos':>8}{'req/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'workers':>9}{'ping BD (ms)':>14}")
+    base_rps = None
+    for procesos in args.procesos:
+        r = medir(entorno, procesos, args.hilos, args.clientes, args.segundos, args.ruta)
+        base_rps = base_rps or r["rps"]
+        print(f"{procesos:>8}{r['rps']:>10.0f}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['workers']:>9}"
+              f"{r['ping']:>14.2f}   x{r['rps'] / base_rps:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark de lecturas y escrituras concurrentes sobre SQLite.
+
+Compara el modo por defecto (SQLITE_TUNING=False: journal de rollback y la
+espera de 5 s del driver) con el perfil de SQLITE_* (WAL, synchronous=NORMAL,
+busy_timeout, cache y mmap). Para cada modo se crea una base nueva y se lanzan
+P procesos (como los workers de `flask serve --procesos`) con H hilos cada
+uno; cada hilo tiene su propio contexto de app, como un hilo de waitress, y
+mezcla lecturas (`get_user_list_page`) y escrituras a través de
+`_commit_or_rollback` durante unos segundos.
+
+Reporta operaciones por segundo, latencias p95 de lectura y escritura, y
+cuántas escrituras fallaron (por ejemplo con "database is locked").
+
+Uso:
+    python benchmarks/bench_sqlite_concurrencia.py [--procesos 4] [--hilos 4] [--segundos 5]
+                                                   [--escrituras 0.2] [--busy-timeout-ms 5000]
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+MODOS = {
+    "por defecto": {"SQLITE_TUNING": "False"},
+    "perfil WAL": {"SQLITE_TUNING": "True"},
+}
+
+
+USUARIOS = 2000
+
+
+def sembrar():
+    from datetime import datetime
+    from sqlalchemy import insert
+
+    from app.server import create_app
+    from app.database import db
+    from app.database.models import Usuario
+    from app.database.enums import Role, Sexo
+
+    with create_app().app_context():
+        db.create_all()
+        db.session.execute(insert(Usuario), [{
+            "email": f"usuario{i}@bench-expresarte.com", "password_hash": "x",
+            "primer_nombre": f"Nombre{i}", "primer_apellido": f"Apellido{i}",
+            "sexo": Sexo.NO_APLICA, "role": Role.STUDENT, "activo": True,
+            "fecha_creacion": datetime.utcnow()
+        } for i in range(USUARIOS)])
+        db.session.commit()
+
+
+def trabajo(hilos, segundos, proporcion_escrituras, inicio_comun):
+    """Se ejecuta en cada proceso hijo; devuelve las métricas como dict."""
+    import random
+    import threading
+    import time
+    import logging
+
+    from app.server import create_app
+    from app.database import db
+    from app.database.models import Usuario
+    from app.controllers import ControllerFactory
+
+    app = create_app()
+    app.logger.setLevel(logging.CRITICAL)
+    time.sleep(max(0.0, inicio_comun - time.time()))  # todos los procesos arrancan a la vez
+
+    lecturas, escrituras, errores = [], [], []
+    fin = time.monotonic() + segundos
+
+    def hilo(semilla):
+        azar = random.Random(semilla)
+        with app.app_context():
+            ctrl = ControllerFactory(current_user=None).get_user_controller()
+            while time.monotonic() < fin:
+                inicio = time.perf_counter()
+                if azar.random() < proporcion_escrituras:
+                    usuario = db.session.get(Usuario, azar.randint(1, USUARIOS))
+                    usuario.segundo_nombre = f"S{azar.randint(0, 10 ** 6)}"
+                    resultado = ctrl._commit_or_rollback()
+                    if resultado is True:
+                        escrituras.append(time.perf_counter() - inicio)
+                    else:
+                        errores.append(resultado)
+                else:
+                    ctrl.get_user_list_page(role="student", limit=50)
+                    db.session.rollback()  # cierra la transacción de lectura, como al final de una petición
+                    lecturas.append(time.perf_counter() - inicio)
+
+    trabajadores = [threading.Thread(target=hilo, args=(i,)) for i in range(hilos)]
+    for t in trabajadores:
+        t.start()
+    for t in trabajadores:
+        t.join()
+
+    return {"lecturas": lecturas, "escrituras": escrituras, "errores": errores}
+
+
+def p95(valores):
+    return sorted(valores)[int(len(valores) * 0.95)] * 1000 if valores else 0.0
+
+
+def correr_modo(entorno, args):
+    import time
+
+    base = os.path.join(tempfile.mkdtemp(prefix="expresarte-sqlite-"), "bench.db")
+    env = dict(os.environ, SQLALCHEMY_DATABASE_URI=f"sqlite:///{base}", DEBUG="",
+               CACHE_BACKEND="none", USER_CACHE_ENABLED="False", MAIL_PRERENDER="False",
+               SQLITE_BUSY_TIMEOUT_MS=str(args.busy_timeout_ms), **entorno)
+    comando = [sys.executable, os.path.abspath(__file__)]
+    subprocess.run(comando + ["--_sembrar"], cwd=ROOT, env=env, check=True, capture_output=True)
+
+    inicio_comun = time.time() + 5
+    hijos = [subprocess.Popen(
+        comando + ["--_hijo", "--hilos", str(args.hilos), "--segundos", str(args.segundos),
+                   "--escrituras", str(args.escrituras), "--_inicio", str(inicio_comun)],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    ) for _ in range(args.procesos)]
+
+    lecturas, escrituras, errores = [], [], []
+    for hijo in hijos:
+        salida, _ = hijo.communicate()
+        r = json.loads(salida.strip().splitlines()[-1])
+        lecturas += r["lecturas"]
+        escrituras += r["escrituras"]
+        errores += r["errores"]
+    return lecturas, escrituras, errores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, default=4)
+    parser.add_argument("--hilos", type=int, default=4)
+    parser.add_argument("--segundos", type=float, default=5)
+    parser.add_argument("--escrituras", type=float, default=0.2, help="Proporción de escrituras (0-1)")
+    parser.add_argument("--busy-timeout-ms", type=int, default=5000,
+                        help="SQLITE_BUSY_TIMEOUT_MS del perfil WAL (0 = fallar al instante)")
+    parser.add_argument("--_hijo", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--_sembrar", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--_inicio", type=float, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args._sembrar:
+        sembrar()
+        return
+    if args._hijo:
+        print(json.dumps(trabajo(args.hilos, args.segundos, args.escrituras, args._inicio)))
+        return
+
+    print(f"{args.procesos} procesos x {args.hilos} hilos, {args.segundos:.0f} s, "
+          f"{args.escrituras:.0%} escrituras, busy_timeout del perfil {args.busy_timeout_ms} ms\n")
+    print(f"{'modo':<14}{'ops/s':>9}{'lecturas':>10}{'escrituras':>12}{'fallidas':>10}"
+          f"{'p95 lect. (ms)':>16}{'p95 escr. (ms)':>16}")
+    for nombre, entorno in MODOS.items():
+        lecturas, escrituras, errores = correr_modo(entorno, args)
+        ops = (len(lecturas) + len(escrituras)) / args.segundos
+        print(f"{nombre:<14}{ops:>9.0f}{len(lecturas):>10}{len(escrituras):>12}{len(errores):>10}"
+              f"{p95(lecturas):>16.1f}{p95(escrituras):>16.1f}")
+        if errores:
+            print(f"{'':<14}primer error: {errores[0].splitlines()[0][:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Prueba de carga y de fallos de la bandeja de salida de correos.
+
+Levanta un servidor SMTP mínimo en 127.0.0.1 (ver smtp_prueba.py) y
+comprueba contra una base SQLite temporal:
+  - envío: N correos encolados llegan exactamente una vez, con dos workers
+    compitiendo por la misma tabla;
+  - reintentos: con el servidor rechazando, cada correo se reintenta con
+    espera creciente y termina FALLIDO al agotar los intentos;
+  - drenado: `detener()` espera los envíos en curso y no deja correos
+    reclamados a medias.
+
+Uso:
+    python benchmarks/check_outbox.py [--correos 200] [--hilos 4]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from smtp_prueba import ServidorSMTP  # noqa: E402
+
+
+smtp = ServidorSMTP()
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-outbox-")
+os.environ.update({
+    "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(_tmpdir, 'outbox.db')}",
+    "DEBUG": "",
+    "MAIL_SERVER": "127.0.0.1",
+    "MAIL_PORT": str(smtp.puerto),
+    "MAIL_USE_SSL": "False",
+    "MAIL_USE_TLS": "False",
+    "MAIL_USERNAME": "",
+    "MAIL_OUTBOX_WORKER": "cli",
+})
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.database import db  # noqa: E402
+from app.database.models import CorreoSaliente  # noqa: E402
+from app.database.enums import EstadoCorreo  # noqa: E402
+from app.mail import OutboxWorker, encolar_correo  # noqa: E402
+
+
+def estados():
+    filas = db.session.execute(
+        select(CorreoSaliente.estado, func.count()).group_by(CorreoSaliente.estado)
+    ).all()
+    db.session.commit()
+    return {estado: total for estado, total in filas}
+
+
+def esperar(condicion, limite=60.0):
+    fin = time.monotonic() + limite
+    while time.monotonic() < fin:
+        if condicion():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def limpiar():
+    db.session.query(CorreoSaliente).delete()
+    db.session.commit()
+    smtp.reiniciar()
+
+
+def encolar(n, prefijo):
+    for i in range(n):
+        encolar_correo(f"{prefijo} {i}", [f"{prefijo.lower()}{i}@example.com"], f"<p>{prefijo} {i}</p>",
+                       sender=("Expresarte", "no-responder@example.com"))
+
+
+def prueba_envio(app, correos, hilos):
+    limpiar()
+    encolar(correos, "Envio")
+    workers = [OutboxWorker.desde_config(app, hilos=hilos, intervalo=0.2) for _ in range(2)]
+    inicio = time.perf_counter()
+    for w in workers:
+        w.iniciar()
+    esperar(lambda: estados().get(EstadoCorreo.ENVIADO, 0) == correos)
+    duracion = time.perf_counter() - inicio
+    for w in workers:
+        w.detener()
+
+    asuntos = Counter(m.split(b"Subject: ", 1)[1].split(b"\r\n", 1)[0] for m in smtp.recibidos())
+    duplicados = sum(1 for total in asuntos.values() if total > 1)
+    assert estados() == {EstadoCorreo.ENVIADO: correos}, estados()
+    assert len(asuntos) == correos and duplicados == 0, (len(asuntos), duplicados)
+    print(f"envío: {correos} correos, 2 workers x {hilos} hilos, {duracion:.2f} s "
+          f"({correos / duracion:.0f} correos/s), duplicados: {duplicados}")
+
+
+def prueba_reintentos(app):
+    limpiar()
+    smtp.rechazar = True
+    encolar(5, "Reintento")
+    worker = OutboxWorker.desde_config(app, hilos=2, intervalo=0.05, max_intentos=4,
+                                       espera_base=0.1, espera_max=1.0)
+    worker.iniciar()
+    ok = esperar(lambda: estados().get(EstadoCorreo.FALLIDO, 0) == 5, limite=30)
+    worker.detener()
+    smtp.rechazar = False
+
+    correos = db.session.query(CorreoSaliente).all()
+    assert ok, estados()
+    assert all(c.intentos == 4 and "451" in (c.ultimo_error or "") for c in correos)
+    assert not smtp.recibidos()
+    print(f"reintentos: 5 correos FALLIDO tras {correos[0].intentos} intentos; "
+          f"último error: {correos[0].ultimo_error}")
+
+
+def prueba_drenado(app, hilos):
+    limpiar()
+    smtp.demora = 0.5
+    encolar(hilos * 3, "Drenado")
+    worker = OutboxWorker.desde_config(app, hilos=hilos, intervalo=0.05)
+    worker.iniciar()
+    esperar(lambda: estados().get(EstadoCorreo.ENVIANDO, 0) > 0)
+    time.sleep(0.1)
+    inicio = time.perf_counter()
+    worker.detener()
+    duracion = time.perf_counter() - inicio
+    smtp.demora = 0.0
+
+    resultado = estados()
+    enviados = resultado.get(EstadoCorreo.ENVIADO, 0)
+    assert EstadoCorreo.ENVIANDO not in resultado, resultado
+    assert enviados == len(smtp.recibidos()) and enviados > 0, (resultado, len(smtp.recibidos()))
+    print(f"drenado: detener() esperó {duracion:.2f} s; enviados {enviados}, "
+          f"pendientes {resultado.get(EstadoCorreo.PENDIENTE, 0)}, ninguno a medias")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--correos", type=int, default=200)
+    parser.add_argument("--hilos", type=int, default=4)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        prueba_envio(app, args.correos, args.hilos)
+        prueba_reintentos(app)
+        prueba_drenado(app, args.hilos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Prueba de la separación de lecturas y escrituras con una réplica SQLite.
+
+Usa dos archivos SQLite temporales: la base principal y una réplica creada
+con la API de backup en línea (`copiar_a_replica`, la misma que usa
+`flask replicar`). Comprueba:
+  - enrutado: los métodos de lectura de los controladores consultan la
+    réplica y las escrituras van a la principal;
+  - leer lo propio: tras un commit, el resto del contexto lee de la
+    principal, y la petición siguiente del mismo cliente también, mientras
+    dura REPLICA_READ_YOUR_WRITES_SECONDS;
+  - caché de lecturas (backend por defecto): lo leído de la réplica no se
+    guarda y quien debe leer lo propio no recibe entradas de la caché;
+  - la réplica rechaza escrituras (PRAGMA query_only) y se puede refrescar
+    en línea mientras la principal recibe escrituras;
+  - contención: latencia de las escrituras mientras varios hilos hacen
+    lecturas pesadas contra la principal o contra la réplica.
+
+Uso:
+    python benchmarks/check_replica.py [--usuarios 5000] [--lectores 4] [--segundos 3]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-replica-")
+PRINCIPAL = f"sqlite:///{os.path.join(_tmpdir, 'principal.db')}"
+REPLICA = f"sqlite:///{os.path.join(_tmpdir, 'replica.db')}"
+os.environ.update({
+    "SQLALCHEMY_DATABASE_URI": PRINCIPAL,
+    "SQLALCHEMY_REPLICA_URI": REPLICA,
+    "REPLICA_READ_YOUR_WRITES_SECONDS": "1",
+    "DEBUG": "",
+    "USER_CACHE_ENABLED": "False",
+    "MAIL_PRERENDER": "False",
+})
+
+from sqlalchemy import event, insert, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.database import db, copiar_a_replica, leer_de_primaria, BIND_REPLICA  # noqa: E402
+from app.database.models import Usuario  # noqa: E402
+from app.database.enums import Role, Sexo  # noqa: E402
+from app.controllers import ControllerFactory  # noqa: E402
+from app.controllers.periodo_academico_controller import PeriodoAcademicoController  # noqa: E402
+from app.schemas.periodo_academico import PeriodoAcademicoCreate  # noqa: E402
+from app.schemas.users import UserUpdate  # noqa: E402
+
+
+class Contador:
+    """Cuenta las sentencias ejecutadas por cada engine."""
+
+    def __init__(self):
+        self.total = {None: 0, BIND_REPLICA: 0}
+        for clave in self.total:
+            event.listen(db.engines[clave], "before_cursor_execute", self._contar(clave))
+
+    def _contar(self, clave):
+        def contar(*_):
+            self.total[clave] += 1
+        return contar
+
+    def foto(self):
+        return dict(self.total)
+
+    def diferencia(self, antes):
+        return {clave: self.total[clave] - antes[clave] for clave in self.total}
+
+
+def periodo(nombre):
+    return PeriodoAcademicoCreate(nombre=nombre, fecha_inicio=datetime(2030, 1, 1), fecha_fin=datetime(2030, 6, 1))
+
+
+def prueba_enrutado(app, contador):
+    with app.app_context():
+        ctrl = ControllerFactory().get_periodo_academico_controller()
+        antes = contador.foto()
+        assert ctrl.obtener_periodo_por_nombre("Base") is not None
+        lectura = contador.diferencia(antes)
+
+        antes = contador.foto()
+        ctrl.crear_periodo(periodo("Nuevo"))
+        escritura = contador.diferencia(antes)
+
+        antes = contador.foto()
+        propio = ctrl.obtener_periodo_por_nombre("Nuevo")
+        tras_commit = contador.diferencia(antes)
+
+    assert lectura[BIND_REPLICA] > 0 and lectura[None] == 0, lectura
+    assert escritura[None] > 0 and escritura[BIND_REPLICA] == 0, escritura
+    assert propio is not None and tras_commit[BIND_REPLICA] == 0, tras_commit
+    print(f"enrutado: lectura {lectura}, escritura {escritura}, lectura tras commit {tras_commit}")
+
+    with app.app_context():
+        ajeno = ControllerFactory().get_periodo_academico_controller().obtener_periodo_por_nombre("Nuevo")
+    assert ajeno is None, "la réplica no debería tener aún el período nuevo"
+    print("leer lo propio: visible en el mismo contexto; otro contexto lee la réplica (aún sin el cambio)")
+
+
+def registrar_rutas(app):
+    """Vistas mínimas para probar peticiones consecutivas con el cliente de pruebas."""
+    from flask import request
+
+    @app.route("/_replica/<nombre>", methods=["GET", "POST"])
+    def _replica(nombre):
+        ctrl = ControllerFactory().get_periodo_academico_controller()
+        if request.method == "POST":
+            ctrl.crear_periodo(periodo(nombre))
+            return "creado"
+        return "si" if ctrl.obtener_periodo_por_nombre(nombre) else "no"
+
+    @app.route("/_replica_periodos")
+    def _replica_periodos():
+        ctrl = ControllerFactory().get_periodo_academico_controller()
+        return ",".join(p.nombre for p in ctrl.listar_periodos())
+
+    @app.route("/_replica_activo", methods=["GET", "POST"])
+    def _replica_activo():
+        ctrl = ControllerFactory().get_periodo_academico_controller()
+        if request.method == "POST":
+            leer_de_primaria(db.session)
+            ctrl.activar_periodo(ctrl.obtener_periodo_por_nombre(request.form["nombre"]).id)
+            return "activado"
+        activo = ctrl.get_active_periodo()
+        return activo.nombre if activo else "ninguno"
+
+    app.config["WTF_CSRF_ENABLED"] = False
+
+
+def prueba_peticiones(app):
+    cliente = app.test_client()
+    otro = app.test_client()
+    assert cliente.post("/_replica/Redirect").text == "creado"
+    propio = cliente.get("/_replica/Redirect").text
+    ajeno = otro.get("/_replica/Redirect").text
+    time.sleep(float(app.config["REPLICA_READ_YOUR_WRITES_SECONDS"]) + 0.1)
+    vencido = cliente.get("/_replica/Redirect").text
+    assert (propio, ajeno, vencido) == ("si", "no", "no"), (propio, ajeno, vencido)
+    print("peticiones: el GET tras el POST lee la principal; otro cliente y el mismo "
+          "cliente tras la ventana leen la réplica")
+
+
+def prueba_cache(app):
+    from app.cache import get_cache
+
+    cliente = app.test_client()
+    otro = app.test_client()
+    otro.get("/_replica_periodos")
+    assert cliente.post("/_replica/2030-A").text == "creado"
+    ajeno = otro.get("/_replica_periodos").text
+    with app.app_context():
+        entradas = len(get_cache()._datos)
+    propio = cliente.get("/_replica_periodos").text
+    assert "2030-A" not in ajeno and entradas == 0, (ajeno, entradas)
+    assert "2030-A" in propio, propio
+    print(f"caché: otro cliente lee la réplica ({ajeno!r}) y no se guarda; "
+          f"quien escribió ve {propio!r}")
+
+    # Mismo caso con la copia local del período activo
+    otro.get("/_replica_activo")
+    assert cliente.post("/_replica_activo", data={"nombre": "2030-A"}).text == "activado"
+    ajeno = otro.get("/_replica_activo").text
+    guardado = bool(PeriodoAcademicoController._activo_cache)
+    propio = cliente.get("/_replica_activo").text
+    assert ajeno != "2030-A" and not guardado, (ajeno, guardado)
+    assert propio == "2030-A", propio
+    print(f"período activo: otro cliente lee la réplica ({ajeno!r}) y no se guarda; "
+          f"quien activó ve {propio!r}")
+
+
+def prueba_replica(app):
+    with app.app_context():
+        try:
+            with db.engines[BIND_REPLICA].begin() as conn:
+                conn.execute(text("UPDATE periodo_academico SET nombre = 'x'"))
+            raise AssertionError("la réplica aceptó una escritura")
+        except OperationalError as e:
+            print(f"solo lectura: la réplica rechaza escrituras ({e.orig})")
+
+    detener = threading.Event()
+    escritas = []
+
+    def escritor():
+        with app.app_context():
+            ctrl = ControllerFactory().get_user_controller()
+            i = 0
+            while not detener.is_set():
+                ctrl.edit_user(1 + i % 100, UserUpdate(segundo_nombre=f"Copia{i}"))
+                db.session.remove()
+                escritas.append(i)
+                i += 1
+
+    hilo = threading.Thread(target=escritor)
+    hilo.start()
+    time.sleep(0.2)
+    duracion = copiar_a_replica(PRINCIPAL, REPLICA, paginas=64)
+    detener.set()
+    hilo.join()
+
+    with app.app_context():
+        ctrl = ControllerFactory().get_periodo_academico_controller()
+        assert ctrl.obtener_periodo_por_nombre("Nuevo") is not None
+    print(f"backup en línea: {duracion * 1000:.0f} ms con {len(escritas)} escrituras "
+          f"concurrentes en la principal; la réplica ya tiene los cambios")
+
+
+def medir(app, lectores, segundos, en_replica):
+    detener = threading.Event()
+    latencias, lecturas = [], []
+
+    def lector():
+        with app.app_context():
+            if not en_replica:
+                leer_de_primaria(db.session)
+            ctrl = ControllerFactory().get_user_controller()
+            while not detener.is_set():
+                ctrl.list_users(role=Role.STUDENT.value)
+                lecturas.append(1)
+
+    def escritor():
+        with app.app_context():
+            ctrl = ControllerFactory().get_user_controller()
+            i = 0
+            while not detener.is_set():
+                inicio = time.perf_counter()
+                ctrl.edit_user(1 + i % 100, UserUpdate(segundo_nombre=f"Nota{i}"))
+                latencias.append(time.perf_counter() - inicio)
+                db.session.remove()
+                i += 1
+                time.sleep(0.01)
+
+    hilos = [threading.Thread(target=lector) for _ in range(lectores)] + [threading.Thread(target=escritor)]
+    for h in hilos:
+        h.start()
+    time.sleep(segundos)
+    detener.set()
+    for h in hilos:
+        h.join()
+
+    latencias.sort()
+    p95 = latencias[int(len(latencias) * 0.95)] * 1000 if latencias else 0.0
+    return len(latencias), p95, len(lecturas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=5000)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--segundos", type=float, default=3)
+    args = parser.parse_args()
+
+    app = create_app()
+    registrar_rutas(app)
+    with app.app_context():
+        db.create_all()
+        db.session.execute(insert(Usuario), [{
+            "email": f"usuario{i}@replica-expresarte.com", "password_hash": "x",
+            "primer_nombre": f"Nombre{i}", "primer_apellido": f"Apellido{i}",
+            "sexo": Sexo.NO_APLICA, "role": Role.STUDENT, "activo": True,
+            "fecha_creacion": datetime.utcnow()
+        } for i in range(args.usuarios)])
+        db.session.commit()
+        ControllerFactory().get_periodo_academico_controller().crear_periodo(periodo("Base"))
+        contador = Contador()
+    print(f"réplica inicial: {copiar_a_replica(PRINCIPAL, REPLICA) * 1000:.0f} ms "
+          f"({args.usuarios} usuarios)")
+
+    prueba_enrutado(app, contador)
+    prueba_peticiones(app)
+    prueba_cache(app)
+    prueba_replica(app)
+
+    print(f"\ncontención: {args.lectores} hilos con list_users ({args.usuarios} filas) "
+          f"+ 1 hilo editando usuarios, {args.segundos:.0f} s")
+    print(f"{'lecturas en':<14}{'escrituras':>12}{'p95 escr. (ms)':>16}{'lecturas':>10}")
+    for nombre, en_replica in (("principal", False), ("réplica", True)):
+        escrituras, p95, lecturas = medir(app, args.lectores, args.segundos, en_replica)
+        print(f"{nombre:<14}{escrituras:>12}{p95:>16.1f}{lecturas:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Servidor SMTP mínimo en memoria para las pruebas de correo de benchmarks/."""
+import time
+import threading
+import socketserver
+
+
+class ServidorSMTP:
+    """Servidor SMTP de prueba que guarda los mensajes en memoria."""
+
+    def __init__(self):
+        self.mensajes = []
+        self.conexiones = 0
+        self.rechazar = False
+        self.rechazar_destinatarios = None  # texto: RCPT que lo contenga recibe 550
+        self.demora = 0.0
+        self._lock = threading.Lock()
+        servidor = self
+
+        class Manejador(socketserver.StreamRequestHandler):
+            def responder(self, linea):
+                self.wfile.write(linea.encode("ascii") + b"\r\n")
+
+            def handle(self):
+                with servidor._lock:
+                    servidor.conexiones += 1
+                self.responder("220 localhost prueba")
+                while True:
+                    linea = self.rfile.readline()
+                    if not linea:
+                        return
+                    comando = linea.decode("utf-8", "replace").strip().upper()
+                    if comando.startswith(("EHLO", "HELO")):
+                        self.responder("250 localhost")
+                    elif comando.startswith("MAIL FROM"):
+                        self.responder("451 ocupado, reintente" if servidor.rechazar else "250 ok")
+                    elif comando.startswith("RCPT") and servidor.rechazar_destinatarios \
+                            and servidor.rechazar_destinatarios.upper() in comando:
+                        self.responder("550 buzon inexistente")
+                    elif comando.startswith(("RCPT", "RSET", "NOOP")):
+                        self.responder("250 ok")
+                    elif comando == "DATA":
+                        self.responder("354 fin con .")
+                        datos = []
+                        while (linea := self.rfile.readline()) not in (b".\r\n", b""):
+                            datos.append(linea)
+                        time.sleep(servidor.demora)
+                        with servidor._lock:
+                            servidor.mensajes.append(b"".join(datos))
+                        self.responder("250 ok")
+                    elif comando == "QUIT":
+                        self.responder("221 adios")
+                        return
+                    else:
+                        self.responder("500 ?")
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._tcp = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Manejador)
+        self._tcp.daemon_threads = True
+        self.puerto = self._tcp.server_address[1]
+        threading.Thread(target=self._tcp.serve_forever, daemon=True).start()
+
+    def recibidos(self):
+        with self._lock:
+            return list(self.mensajes)
+
+    def reiniciar(self):
+        with self._lock:
+            self.mensajes.clear()
+            self.conexiones = 0
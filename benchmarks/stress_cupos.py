@@ -0,0 +1,112 @@
+"""Prueba de estrés del control de cupos de inscripción.
+
+Lanza muchos hilos que intentan inscribir alumnos distintos en una misma
+cátedra a la vez y verifica que nunca se vendan más cupos de los disponibles
+y que el contador `inscritos` coincida con las inscripciones activas.
+
+Uso:
+    python benchmarks/stress_cupos.py [--hilos 32] [--alumnos 200] [--cupos 25]
+"""
+import os
+import sys
+import argparse
+import tempfile
+import threading
+from collections import Counter
+from datetime import date, datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+_tmpdir = tempfile.mkdtemp(prefix="expresarte-stress-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(_tmpdir, 'stress.db')}"
+os.environ["DEBUG"] = ""
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.server import create_app  # noqa: E402
+from app.config import bootstrap_database  # noqa: E402
+from app.database import db  # noqa: E402
+from app.database.models import Usuario, PeriodoAcademico, CatedraAcademica  # noqa: E402
+from app.database.enums import Role, Sexo, Catedra, EstadoInscripcion  # noqa: E402
+from app.controllers import ControllerFactory  # noqa: E402
+from app.schemas import InscripcionCreate  # noqa: E402
+from app.errors import PermissionDeniedError  # noqa: E402
+
+
+def preparar(alumnos: int, cupos: int):
+    periodo = PeriodoAcademico(nombre="Estrés", fecha_inicio=date(2026, 1, 1), fecha_fin=date(2026, 6, 30))
+    db.session.add(periodo)
+    db.session.flush()
+    catedra = CatedraAcademica(catedra=Catedra.GUITARRA, periodo_id=periodo.id, grupo="A", cupos=cupos)
+    db.session.add(catedra)
+    db.session.execute(insert(Usuario), [{
+        "email": f"alumno{i}@stress-expresarte.com", "password_hash": "x", "primer_nombre": f"Alumno{i}",
+        "primer_apellido": "Estrés", "sexo": Sexo.NO_APLICA, "role": Role.STUDENT,
+        "activo": True, "fecha_creacion": datetime.utcnow()
+    } for i in range(alumnos)])
+    db.session.commit()
+    ids = [u.id for u in db.session.query(Usuario.id).filter_by(role=Role.STUDENT.value)]
+    return periodo.id, catedra.id, ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=32)
+    parser.add_argument("--alumnos", type=int, default=200)
+    parser.add_argument("--cupos", type=int, default=25)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        bootstrap_database()  # tablas y super admin
+        periodo_id, catedra_id, alumnos = preparar(args.alumnos, args.cupos)
+
+    resultados = Counter()
+    lock = threading.Lock()
+    barrera = threading.Barrier(args.hilos)
+
+    def trabajador(lote):
+        barrera.wait()
+        for estudiante_id in lote:
+            with app.app_context():
+                ctrl = ControllerFactory().get_inscripcion_controller()
+                try:
+                    ctrl.inscribir_alumno(InscripcionCreate(
+                        estudiante_id=estudiante_id, catedra_academica_id=catedra_id,
+                        periodo_id=periodo_id, estado=EstadoInscripcion.ACTIVO
+                    ))
+                    clave = "aceptadas"
+                except PermissionDeniedError:
+                    clave = "rechazadas"
+                except Exception:
+                    db.session.rollback()
+                    clave = "errores"
+            with lock:
+                resultados[clave] += 1
+
+    hilos = [
+        threading.Thread(target=trabajador, args=(alumnos[i::args.hilos],))
+        for i in range(args.hilos)
+    ]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    with app.app_context():
+        catedra = db.session.get(CatedraAcademica, catedra_id)
+        activos = ControllerFactory().get_inscripcion_controller().contar_estudiantes_en_catedra(catedra_id)
+        print(f"hilos={args.hilos} intentos={len(alumnos)} cupos={catedra.cupos}")
+        print(f"aceptadas={resultados['aceptadas']} rechazadas={resultados['rechazadas']} "
+              f"errores={resultados['errores']}")
+        print(f"contador inscritos={catedra.inscritos} inscripciones activas={activos}")
+
+        assert activos <= catedra.cupos, "Se vendieron más cupos de los disponibles"
+        assert catedra.inscritos == activos, "El contador no coincide con las inscripciones activas"
+        assert resultados["aceptadas"] == activos
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
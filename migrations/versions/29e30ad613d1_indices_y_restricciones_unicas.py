@@ -0,0 +1,72 @@
+"""Índices compuestos y restricciones únicas
+
+Agrega índices sobre las columnas de filtrado más usadas por los controladores
+y reemplaza las verificaciones `filter_by(...).first()` por restricciones
+únicas a nivel de base de datos.
+
+Las bases existentes fueron creadas con `db.create_all()`, por lo que esta
+revisión es la primera y solo crea los índices que aún no existen. Si hay
+filas duplicadas, la creación de los índices únicos fallará y deberán
+depurarse antes de aplicar la migración.
+
+Revision ID: 29e30ad613d1
+Revises:
+Create Date: 2026-10-18 12:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '29e30ad613d1'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (nombre, tabla, columnas, único)
+INDICES = [
+    ('ix_inscripcion_catedra_estado', 'inscripcion', ['catedra_academica_id', 'estado'], False),
+    ('ix_inscripcion_estudiante', 'inscripcion', ['estudiante_id'], False),
+    ('uq_calificacion_estudiante_catedra', 'calificacion', ['estudiante_id', 'catedra_academica_id'], True),
+    ('ix_catedra_academica_periodo_profesor_catedra', 'catedra_academica', ['periodo_id', 'profesor_id', 'catedra'], False),
+    ('uq_catedra_academica_periodo_catedra_grupo', 'catedra_academica', ['periodo_id', 'catedra', 'grupo'], True),
+    ('ix_usuarios_role_activo', 'usuarios', ['role', 'activo'], False),
+    ('ix_usuarios_apellido_id', 'usuarios', ['primer_apellido', 'id'], False),
+    ('ix_periodo_academico_activo', 'periodo_academico', ['activo'], False),
+    ('uq_periodo_academico_nombre', 'periodo_academico', ['nombre'], True),
+    ('uq_profesor_catedra_profesor_catedra', 'profesor_catedra', ['profesor_id', 'catedra'], True),
+]
+
+# Índice único parcial: una sola inscripción activa por alumno y cátedra
+INSCRIPCION_ACTIVA = 'uq_inscripcion_activa'
+DIALECTOS_INDICE_PARCIAL = ('sqlite', 'postgresql')
+
+
+def _existentes(tabla):
+    inspector = sa.inspect(op.get_bind())
+    return {ix['name'] for ix in inspector.get_indexes(tabla)}
+
+
+def upgrade():
+    for nombre, tabla, columnas, unico in INDICES:
+        if nombre not in _existentes(tabla):
+            op.create_index(nombre, tabla, columnas, unique=unico)
+
+    dialecto = op.get_bind().dialect.name
+    if dialecto in DIALECTOS_INDICE_PARCIAL and INSCRIPCION_ACTIVA not in _existentes('inscripcion'):
+        condicion = sa.text("estado = 'ACTIVO'")
+        op.create_index(
+            INSCRIPCION_ACTIVA, 'inscripcion', ['estudiante_id', 'catedra_academica_id'],
+            unique=True, sqlite_where=condicion, postgresql_where=condicion
+        )
+
+
+def downgrade():
+    if INSCRIPCION_ACTIVA in _existentes('inscripcion'):
+        op.drop_index(INSCRIPCION_ACTIVA, table_name='inscripcion')
+
+    for nombre, tabla, _columnas, _unico in reversed(INDICES):
+        if nombre in _existentes(tabla):
+            op.drop_index(nombre, table_name=tabla)
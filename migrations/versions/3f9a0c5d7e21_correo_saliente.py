@@ -0,0 +1,47 @@
+"""Tabla correo_saliente
+
+Bandeja de salida persistente: las vistas encolan los correos y un worker
+los envía con reintentos.
+
+Revision ID: 3f9a0c5d7e21
+Revises: 8d3f6b2e4a17
+Create Date: 2026-10-18 16:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a0c5d7e21'
+down_revision = '8d3f6b2e4a17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'correo_saliente' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'correo_saliente',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('asunto', sa.String(length=255), nullable=False),
+        sa.Column('destinatarios', sa.JSON(), nullable=False),
+        sa.Column('remitente', sa.String(length=255), nullable=True),
+        sa.Column('html', sa.Text(), nullable=False),
+        sa.Column('estado', sa.Enum('PENDIENTE', 'ENVIANDO', 'ENVIADO', 'FALLIDO', name='estadocorreo'), nullable=False),
+        sa.Column('intentos', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('proximo_intento', sa.DateTime(), nullable=False),
+        sa.Column('bloqueado_hasta', sa.DateTime(), nullable=True),
+        sa.Column('ultimo_error', sa.Text(), nullable=True),
+        sa.Column('fecha_creacion', sa.DateTime(), nullable=True),
+        sa.Column('fecha_envio', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_correo_saliente_estado_proximo', 'correo_saliente', ['estado', 'proximo_intento'])
+
+
+def downgrade():
+    op.drop_index('ix_correo_saliente_estado_proximo', table_name='correo_saliente')
+    op.drop_table('correo_saliente')
+    sa.Enum(name='estadocorreo').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,33 @@
+"""Tabla version_cache
+
+Contadores de versión por clave que los procesos usan para saber cuándo
+descartar lo que tienen cacheado (por ejemplo, el período académico activo).
+
+Revision ID: 5c1e7a9d2b40
+Revises: bf5d32acf3c9
+Create Date: 2026-10-18 13:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e7a9d2b40'
+down_revision = 'bf5d32acf3c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'version_cache' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            'version_cache',
+            sa.Column('clave', sa.String(length=64), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+            sa.PrimaryKeyConstraint('clave')
+        )
+
+
+def downgrade():
+    op.drop_table('version_cache')
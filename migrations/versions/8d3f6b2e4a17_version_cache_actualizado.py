@@ -0,0 +1,31 @@
+"""Columna actualizado en version_cache
+
+Guarda el instante del último incremento de cada contador; se usa como
+Last-Modified de las páginas que dependen de esas tablas.
+
+Revision ID: 8d3f6b2e4a17
+Revises: 5c1e7a9d2b40
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d3f6b2e4a17'
+down_revision = '5c1e7a9d2b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columnas = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('version_cache')}
+    if 'actualizado' not in columnas:
+        with op.batch_alter_table('version_cache') as batch_op:
+            batch_op.add_column(sa.Column('actualizado', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('version_cache') as batch_op:
+        batch_op.drop_column('actualizado')
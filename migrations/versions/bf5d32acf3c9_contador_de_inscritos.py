@@ -0,0 +1,39 @@
+"""Contador de inscritos en catedra_academica
+
+Agrega la columna `inscritos`, mantenida por InscripcionController con un
+UPDATE condicional atómico, y la inicializa con el número de inscripciones
+activas de cada cátedra.
+
+Revision ID: bf5d32acf3c9
+Revises: 29e30ad613d1
+Create Date: 2026-10-18 13:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'bf5d32acf3c9'
+down_revision = '29e30ad613d1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columnas = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('catedra_academica')}
+    if 'inscritos' not in columnas:
+        with op.batch_alter_table('catedra_academica') as batch_op:
+            batch_op.add_column(sa.Column('inscritos', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        "UPDATE catedra_academica SET inscritos = ("
+        "SELECT COUNT(inscripcion.id) FROM inscripcion "
+        "WHERE inscripcion.catedra_academica_id = catedra_academica.id "
+        "AND inscripcion.estado = 'ACTIVO')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('catedra_academica') as batch_op:
+        batch_op.drop_column('inscritos')